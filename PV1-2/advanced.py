@@ -5,6 +5,15 @@ import argparse
 import os
 import csv
 
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "PV4", "src"))
+try:
+    from batch_evaluation import BatchEvaluator
+except ImportError:  # numpy is optional, fitness() is then evaluated per chromosome
+    BatchEvaluator = None
+from graph_io import load_graph_arrays
+from dsatur_engine import dsatur
+from selection import tournament_indices
+
 
 def read_input(file=None):
     """
@@ -13,11 +22,13 @@ def read_input(file=None):
     Next n_edges lines: u v
     Returns n_nodes, edges list.
     """
-    if file is None:
-        data = sys.stdin.read().strip().split()
-    else:
-        with open(file, 'r') as f:
-            data = f.read().strip().split()
+    if file is not None:
+        # Bulk parse with validation, cached as a binary sidecar next to the file
+        n_nodes, _, _, edge_array = load_graph_arrays(file)
+        if hasattr(edge_array, "tolist"):
+            edge_array = edge_array.tolist()
+        return n_nodes, [tuple(edge) for edge in edge_array]
+    data = sys.stdin.read().strip().split()
     it = iter(data)
     try:
         n_nodes = int(next(it))
@@ -42,6 +53,17 @@ def fitness(chrom, edges, penalty_weight):
     return objective(chrom) + penalty_weight * conflicts
 
 
+def population_fitness(pop, evaluator, penalty_weight, edges=None):
+    """
+    fitness() of every chromosome at once, vectorized over the edge array.
+    Without an evaluator (numpy missing) fitness() is called per chromosome on edges.
+    """
+    if evaluator is None:
+        return [fitness(chrom, edges, penalty_weight) for chrom in pop]
+    conflicts = evaluator.conflicts(pop)
+    return (evaluator.max_color(pop) + 1 + penalty_weight * conflicts).tolist()
+
+
 def greedy_coloring(n_nodes, edges):
     coloring = [-1] * n_nodes
     adj = [[] for _ in range(n_nodes)]
@@ -96,13 +118,6 @@ def init_population(pop_size, n_nodes, max_colors, edges=None, greedysat_seed=Fa
     return pop
 
 
-def tournament_select(pop, fits, k):
-    """Tournament selection of size k."""
-    contenders = random.sample(list(zip(pop, fits)), k)
-    winner = min(contenders, key=lambda x: x[1])[0]
-    return winner[:]
-
-
 def one_point_crossover(p1, p2):
     n = len(p1)
     pt = random.randint(1, n-1)
@@ -151,7 +166,8 @@ def run_ga(n_nodes,
 
     print(f"[GA] Starting: pop_size={pop_size}, max_gens={max_gens}, max_colors={max_colors}, tournament_k={tournament_k}, crossover_prob={crossover_prob}")
     population = init_population(pop_size, n_nodes, max_colors, edges, greedysat_seed)
-    fitnesses = [fitness(ind, edges, penalty_weight) for ind in population]
+    evaluator = BatchEvaluator(n_nodes, edges) if BatchEvaluator is not None else None
+    fitnesses = population_fitness(population, evaluator, penalty_weight, edges)
 
     best_fit = min(fitnesses)
     best_ind = population[fitnesses.index(best_fit)][:]
@@ -171,9 +187,11 @@ def run_ga(n_nodes,
         # Elitism: always keep the best individual
         new_pop = [best_ind[:]]
 
+        # All tournaments of the generation are drawn at once from the fitness vector
+        parents = iter(tournament_indices(fitnesses, 2 * (pop_size - 1), tournament_k))
         while len(new_pop) < pop_size:
-            p1 = tournament_select(population, fitnesses, tournament_k)
-            p2 = tournament_select(population, fitnesses, tournament_k)
+            p1 = population[next(parents)]
+            p2 = population[next(parents)]
             if random.random() < crossover_prob:
                 child = one_point_crossover(p1, p2)
             else:
@@ -182,7 +200,7 @@ def run_ga(n_nodes,
             new_pop.append(child)
 
         population = new_pop
-        fitnesses = [fitness(ind, edges, penalty_weight) for ind in population]
+        fitnesses = population_fitness(population, evaluator, penalty_weight, edges)
         gen_best = min(fitnesses)
         gen_best_ind = population[fitnesses.index(gen_best)][:]
 
@@ -221,7 +239,7 @@ def run_ga(n_nodes,
                         idx = random.randrange(n_nodes)
                         shifted[idx] = random.randrange(max_colors)
                     population.append(shifted)
-                fitnesses = [fitness(ind, edges, penalty_weight) for ind in population]
+                fitnesses = population_fitness(population, evaluator, penalty_weight, edges)
                 gens_since_improve = 0
             else:
                 print(f"[GA][Gen {gen}] WARNING: Stuck at local optimum for {long_stagnation} generations. No restart will be performed (long_stagnation >= max_gens). Consider lowering --long_stagnation if you want restarts.")
@@ -241,33 +259,7 @@ def dsatur_coloring(n_nodes, edges):
     for u, v in edges:
         adj[u].append(v)
         adj[v].append(u)
-    # Initialize
-    coloring = [-1] * n_nodes
-    saturation = [0] * n_nodes  # Number of different colors in neighborhood
-    degrees = [len(adj[u]) for u in range(n_nodes)]
-    uncolored = set(range(n_nodes))
-    neighbor_colors = [set() for _ in range(n_nodes)]
-    for _ in range(n_nodes):
-        # Select vertex with highest saturation, break ties by degree
-        max_sat = max(saturation[u] for u in uncolored)
-        candidates = [u for u in uncolored if saturation[u] == max_sat]
-        if len(candidates) > 1:
-            u = max(candidates, key=lambda x: degrees[x])
-        else:
-            u = candidates[0]
-        # Assign the smallest available color
-        used = {coloring[v] for v in adj[u] if coloring[v] != -1}
-        for c in range(n_nodes):
-            if c not in used:
-                coloring[u] = c
-                break
-        # Update saturation of neighbors
-        for v in adj[u]:
-            if coloring[u] not in neighbor_colors[v]:
-                neighbor_colors[v].add(coloring[u])
-                saturation[v] = len(neighbor_colors[v])
-        uncolored.remove(u)
-    return coloring
+    return dsatur(adj)
 
 
 def main():
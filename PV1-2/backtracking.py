@@ -1,39 +1,46 @@
-def color_backtrack(G: dict[int, list[int]], k: int) -> dict[int, int] | None:
+import os
+import sys
+from typing import Callable
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "PV4", "src"))
+from anytime import Deadline, Incumbent, solve_result
+from backtrack_engine import KColoringSearch
+
+def _search(G: dict[int, list[int]], k: int, deadline: Deadline | None = None, node_limit: int | None = None,
+            on_progress: Callable[[KColoringSearch], None] | None = None) -> KColoringSearch:
+    """Build the iterative k-coloring search of a graph with nodes 0..n-1."""
+    masks = [0] * len(G)
+    for node, neighbors in G.items():
+        for neighbor in neighbors:
+            masks[node] |= 1 << neighbor
+    return KColoringSearch(masks, k, node_limit=node_limit, deadline=deadline, on_progress=on_progress)
+
+def color_backtrack(G: dict[int, list[int]], k: int, deadline: Deadline | None = None, node_limit: int | None = None,
+                    on_progress: Callable[[KColoringSearch], None] | None = None) -> dict[int, int] | None:
     """
-    Recursive backtracking graph coloring.
+    Backtracking graph coloring (iterative, see PV4 backtrack_engine): forward
+    checking on bitset domains, MRV/DSATUR vertex order and color symmetry breaking.
+    Returns None when no k-coloring exists, or the optional deadline or node
+    budget ran out. on_progress receives the search (search.nodes) periodically.
     """
-    def is_safe(node: int, color: int, coloring: dict[int, int]) -> bool:
-        """Check if it's safe to color 'node' with 'color' given current 'coloring'"""
-        for neighbor in G[node]:
-            if neighbor in coloring and coloring[neighbor] == color:
-                return False
-        return True
-
-    def backtrack(node: int, coloring: dict[int, int]) -> dict[int, int] | None:
-        """Recursive backtracking helper function"""
-        # Base case: all nodes are colored
-        if node == len(G):
-            return coloring.copy()
-        
-        # Try each color for current node
-        for color in range(k):
-            if is_safe(node, color, coloring):
-                # Try this color
-                coloring[node] = color
-                
-                # Recursively color remaining nodes
-                result = backtrack(node + 1, coloring)
-                if result is not None:
-                    return result
-                
-                # Backtrack: remove this color assignment
-                coloring.pop(node)
-        
-        # No valid coloring found for this branch
+    colors = _search(G, k, deadline, node_limit, on_progress).run()
+    if colors is None:
         return None
+    return {node: colors[node] for node in G}
 
-    # Start with empty coloring and node 0
-    return backtrack(0, {})
+def solve(G: dict[int, list[int]], k: int, time_budget: float | None = None, target: int = 0,
+          deadline: Deadline | None = None, incumbent: Incumbent | None = None) -> dict:
+    """
+    Anytime entry point of the backtracking solver (common solver protocol).
+    The status is 'infeasible' when the search finished without a k-coloring.
+    """
+    deadline = deadline if deadline is not None else Deadline(time_budget)
+    incumbent = incumbent if incumbent is not None else Incumbent(max_colors=k)
+    search = _search(G, k, deadline)
+    colors = search.run()
+    if colors is not None:
+        incumbent.offer({node: colors[node] for node in G}, 0)
+    return solve_result(incumbent, deadline, target, infeasible=search.exhausted)
 
 if __name__ == "__main__":
     from parser import read_graph
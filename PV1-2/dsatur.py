@@ -1,112 +1,195 @@
-import sys
-from collections import defaultdict
+import time
+from parser import read_csr_graph
+from dsatur_engine import dsatur
+from clique_engine import max_clique
+from anytime import Deadline, Incumbent, solve_result
+
+# Share of time_limit (or of the deadline) and of node_limit spent on the maximum clique lower bound
+CLIQUE_TIME_SHARE = 0.1
+CLIQUE_NODE_SHARE = 0.1
 
 class Graph:
     def __init__(self, n):
         self.n = n
         self.adj = [set() for _ in range(n)]
     @classmethod
-    def from_file(cls, path):
-        with open(path) as f:
-            n, m = map(int, f.readline().split())
-            G = cls(n)
-            for line in f:
-                u, v = map(int, line.split())
-                G.adj[u].add(v)
-                G.adj[v].add(u)
+    def from_csr(cls, csr):
+        G = cls(csr.num_vertices)
+        G.adj = csr.to_adjacency_sets()
         return G
+    @classmethod
+    def from_file(cls, path):
+        return cls.from_csr(read_csr_graph(path))
 
 def greedy_dsatur(G):
-    n = G.n
-    colors = [-1]*n
-    neighbor_colors = [set() for _ in range(n)]
-    degrees = [len(G.adj[u]) for u in range(n)]
-    for _ in range(n):
-        # pick uncolored vertex with max saturation, tie by degree
-        sat_deg = [ (len(neighbor_colors[u]), degrees[u], u)
-                    for u in range(n) if colors[u]==-1 ]
-        _, _, u = max(sat_deg)
-        # assign the smallest available color
-        used = neighbor_colors[u]
-        for c in range(n):
-            if c not in used:
-                colors[u] = c
-                break
-        # update neighbors' saturation info
-        for v in G.adj[u]:
-            if c not in neighbor_colors[v]:
-                neighbor_colors[v].add(c)
+    colors = dsatur(G.adj)
     num_colors = max(colors) + 1
     return colors, num_colors
 
-def dsatur_exact(G, time_limit=None):
-    sys.setrecursionlimit(10000)
+def dsatur_exact(G, time_limit=None, node_limit=None, deadline=None, incumbent=None, stop_at=None):
+    """
+    Exact DSATUR branch and bound.
+    Colors of the uncolored vertices are integer bitsets (bit c set = a neighbor
+    has color c), a maximum clique (bit-parallel branch and bound, bounded by
+    CLIQUE_TIME_SHARE of the time and CLIQUE_NODE_SHARE of the node budget)
+    is precolored and gives the lower bound, and the search runs on an
+    explicit stack. Stops at time_limit seconds or
+    node_limit nodes and returns the best coloring found so far.
+    An anytime.Deadline can be passed instead of time_limit (cooperative
+    cancellation), and every improved coloring is offered to incumbent.
+    With stop_at, only colorings with at most stop_at colors are searched and
+    the first one ends the search.
+    Returns (colors, k, optimal) where optimal tells whether k was proven minimal
+    (with stop_at: whether no coloring with at most stop_at colors exists
+    when k > stop_at).
+    """
     n = G.n
+    if n == 0:
+        if incumbent is not None:
+            incumbent.offer([], 0, 0)
+        return [], 0, True
     # initial upper bound
     best_colors, best_k = greedy_dsatur(G)
+    if incumbent is not None:
+        incumbent.offer(best_colors, 0, best_k)
 
-    # structures for recursive search
+    masks = [0]*n
+    for u in range(n):
+        for v in G.adj[u]:
+            masks[u] |= 1 << v
+    clique_budget = None
+    if time_limit is not None:
+        clique_budget = time_limit * CLIQUE_TIME_SHARE
+    elif deadline is not None and deadline.end is not None:
+        clique_budget = deadline.remaining() * CLIQUE_TIME_SHARE
+    clique_nodes = None
+    if node_limit is not None:
+        # the search keeps the rest of the node budget
+        clique_nodes = max(1, int(node_limit * CLIQUE_NODE_SHARE))
+        node_limit = max(0, node_limit - clique_nodes)
+    clique, _ = max_clique(masks, deadline=Deadline(clique_budget, parent=deadline), node_limit=clique_nodes)
+    lower_bound = len(clique)
+    if best_k <= lower_bound or (stop_at is not None and best_k <= stop_at):
+        return best_colors, best_k, best_k <= lower_bound
+    # colorings are searched below bound colors
+    bound = best_k if stop_at is None else stop_at + 1
+    if bound <= lower_bound:
+        return best_colors, best_k, True
+
+    adj = [sorted(G.adj[u]) for u in range(n)]
+    degrees = [len(adj[u]) for u in range(n)]
+    # score = saturation * step + degree, so max(score) is the DSATUR choice
+    step = max(degrees) + 1
+    score = degrees[:]
     colors = [-1]*n
-    neighbor_colors = [set() for _ in range(n)]
-    degrees = [len(G.adj[u]) for u in range(n)]
-
-    def search(colored_cnt, used_k):
-        nonlocal best_k, best_colors
-
-        # prune on color-count
-        if used_k >= best_k:
-            return
-        # if all colored, we've found a better solution
-        if colored_cnt == n:
-            best_k = used_k
-            best_colors = colors.copy()
-            return
-
-        # pick next vertex: max saturation, tie by degree
-        sat_deg = [ (len(neighbor_colors[u]), degrees[u], u)
-                    for u in range(n) if colors[u]==-1 ]
-        _, _, u = max(sat_deg)
-
-        forbidden = neighbor_colors[u]
-        # try existing colors
-        for c in range(used_k):
-            if c not in forbidden:
-                colors[u] = c
-                # update neighbor info
-                updated = []
-                for v in G.adj[u]:
-                    if colors[v]==-1 and c not in neighbor_colors[v]:
-                        neighbor_colors[v].add(c)
-                        updated.append(v)
-                search(colored_cnt+1, used_k)
-                # backtrack
-                colors[u] = -1
-                for v in updated:
-                    neighbor_colors[v].remove(c)
-        # try a new color
-        colors[u] = used_k
+    forbidden = [0]*n
+    uncolored = set(range(n))
+
+    def assign(u, c):
+        colors[u] = c
+        uncolored.discard(u)
+        bit = 1 << c
         updated = []
-        for v in G.adj[u]:
-            if colors[v]==-1:
-                neighbor_colors[v].add(used_k)
+        for v in adj[u]:
+            if colors[v] == -1 and not forbidden[v] & bit:
+                forbidden[v] |= bit
+                score[v] += step
                 updated.append(v)
-        search(colored_cnt+1, used_k+1)
+        return updated
+
+    def unassign(u, c, updated):
         colors[u] = -1
+        uncolored.add(u)
+        bit = 1 << c
         for v in updated:
-            neighbor_colors[v].remove(used_k)
+            forbidden[v] ^= bit
+            score[v] -= step
+
+    def push(stack, used_k):
+        u = max(uncolored, key=score.__getitem__)
+        # existing colors plus one new color, never reaching bound
+        limit = (1 << min(used_k + 1, bound - 1)) - 1
+        stack.append([u, ~forbidden[u] & limit, used_k, None, -1])
+
+    # symmetry breaking: the clique gets colors 0..q-1
+    for c, u in enumerate(clique):
+        assign(u, c)
+
+    end_time = time.time() + time_limit if time_limit is not None else None
+    nodes = 0
+    stack = []
+    if uncolored:
+        push(stack, lower_bound)
+    while stack:
+        if node_limit is not None and nodes >= node_limit:
+            break
+        if nodes % 1024 == 0 and ((end_time is not None and time.time() > end_time)
+                                  or (deadline is not None and deadline.expired())):
+            break
+        frame = stack[-1]
+        u, allowed, used_k, updated, c = frame
+        if updated is not None:
+            unassign(u, c, updated)
+            frame[3] = None
+        # drop colors that can no longer beat the incumbent
+        allowed &= (1 << (bound - 1)) - 1
+        if not allowed:
+            stack.pop()
+            continue
+        low = allowed & -allowed
+        c = low.bit_length() - 1
+        frame[1] = allowed ^ low
+        frame[4] = c
+        updated = assign(u, c)
+        frame[3] = updated
+        nodes += 1
+        new_used = max(used_k, c + 1)
+
+        if not uncolored:
+            best_k = bound = new_used
+            best_colors = colors.copy()
+            if incumbent is not None:
+                incumbent.offer(best_colors, 0, best_k)
+            if best_k <= lower_bound or stop_at is not None:
+                break
+            continue
+        # forward check: a neighbor left without any color below bound - 1 is a dead end
+        full = (1 << (bound - 1)) - 1
+        if any(forbidden[v] & full == full for v in updated):
+            continue
+        push(stack, new_used)
+
+    optimal = not stack or best_k <= lower_bound
+    return best_colors, best_k, optimal
 
-    search(colored_cnt=0, used_k=0)
-    return best_colors, best_k
+def solve(G, k, time_budget=None, target=0, deadline=None, incumbent=None, node_limit=None):
+    """
+    Anytime entry point of the exact DSATUR search (common solver protocol).
+    Stops at the first coloring with at most k colors; the status is
+    'infeasible' when the search proved that k is below the chromatic number.
+    """
+    deadline = deadline if deadline is not None else Deadline(time_budget)
+    incumbent = incumbent if incumbent is not None else Incumbent(max_colors=k)
+    _, best_k, complete = dsatur_exact(G, node_limit=node_limit, deadline=deadline, incumbent=incumbent, stop_at=k)
+    return solve_result(incumbent, deadline, target, infeasible=complete and best_k > k)
 
 if __name__ == "__main__":
-    import argparse, time
+    import argparse
     p = argparse.ArgumentParser(description="Greedy DSATUR graph-coloring")
     p.add_argument("input", help="path to graph file")
+    p.add_argument("--exact", action="store_true", help="run the exact branch and bound")
+    p.add_argument("--time-limit", type=float, default=None, help="time budget of the exact search in seconds")
+    p.add_argument("--node-limit", type=int, default=None, help="node budget of the exact search")
     args = p.parse_args()
 
     G = Graph.from_file(args.input)
     t0 = time.time()
-    coloring, k = greedy_dsatur(G)
+    if args.exact:
+        coloring, k, optimal = dsatur_exact(G, args.time_limit, args.node_limit)
+    else:
+        coloring, k = greedy_dsatur(G)
     t1 = time.time()
     print(f"Found coloring with {k} colors in {t1-t0:.2f}s")
+    if args.exact:
+        print("Optimal" if optimal else "Budget exhausted, best coloring found so far")
     # No longer printing the color of each vertex
@@ -5,8 +5,8 @@ Advanced Features: Elitism + Hybridization (GA + SA)
 """
 
 import random
-import math
 from parser import read_graph
+from annealing_engine import SimulatedAnnealing
 
 
 def initialize_population(G: dict[int, list[int]], pop_size: int) -> list[list[int]]:
@@ -44,9 +44,9 @@ def tournament_selection(pop: list[list[int]], fits: list[float], k: int) -> lis
     """
     k-tournament selection: pick k random individuals, return the best.
     """
-    candidates = random.sample(list(zip(pop, fits)), k)
-    winner = min(candidates, key=lambda x: x[1])[0]
-    return winner
+    # Sample indices instead of zipping the whole population on every call
+    winner = min(random.sample(range(len(pop)), k), key=fits.__getitem__)
+    return pop[winner]
 
 
 def crossover(parent1: list[int], parent2: list[int]) -> tuple[list[int], list[int]]:
@@ -70,22 +70,22 @@ def mutate(chrom: list[int], mutation_rate: float) -> None:
             chrom[i] = random.randrange(n)
 
 
+def make_annealer(G: dict[int, list[int]], initial_temp: float, cooling_rate: float) -> SimulatedAnnealing:
+    """
+    SA engine for this fitness: a swap keeps the set of used colors, so its
+    fitness change is len(G) per conflict and is scored in O(deg).
+    """
+    neighbors = [G.get(v, []) for v in range(len(G))]
+    return SimulatedAnnealing(neighbors, move="swap", initial_temp=initial_temp,
+                              cooling_rate=cooling_rate, weight=len(G))
+
+
 def simulated_annealing(chrom: list[int], G: dict[int, list[int]], initial_temp: float, cooling_rate: float, sa_steps: int) -> list[int]:
     """
     Local improvement: small SA to reduce conflicts/colors.
     """
     best = chrom.copy()
-    best_fit = fitness(best, G)
-    temp = initial_temp
-    for _ in range(sa_steps):
-        # neighbor: swap two colors
-        i, j = random.sample(range(len(chrom)), 2)
-        neighbor = best.copy()
-        neighbor[i], neighbor[j] = neighbor[j], neighbor[i]
-        fit_n = fitness(neighbor, G)
-        if fit_n < best_fit or random.random() < math.exp(-(fit_n-best_fit)/temp):
-            best, best_fit = neighbor, fit_n
-        temp *= cooling_rate
+    make_annealer(G, initial_temp, cooling_rate).anneal(best, sa_steps, track_energy=False)
     return best
 
 
@@ -115,6 +115,7 @@ def ga_coloring(G: dict[int, list[int]], pop_size: int = 100, generations: int =
     # 2) Evaluate fitness
     fits = [fitness(ind, G) for ind in population]
     best_chrom = min(population, key=lambda c: fitness(c, G))
+    annealer = make_annealer(G, sa_temp, sa_cooling)
     for gen in range(generations):
         offspring = []
         # Elitism: preserve previous best
@@ -131,10 +132,9 @@ def ga_coloring(G: dict[int, list[int]], pop_size: int = 100, generations: int =
             # Mutation
             mutate(c1, mutation_rate)
             mutate(c2, mutation_rate)
-            # Hybrid SA
-            c1 = simulated_annealing(c1, G, sa_temp, sa_cooling, sa_steps)
-            c2 = simulated_annealing(c2, G, sa_temp, sa_cooling, sa_steps)
             offspring.extend([c1, c2])
+        # Hybrid SA: all offspring annealed in place in one batch (their fitness is computed below)
+        annealer.anneal_many(offspring, sa_steps, track_energy=False)
         # Replacement
         population = replace_population(population, offspring, fits, elitism_rate)
         fits = [fitness(ind, G) for ind in population]
@@ -1,3 +1,9 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "PV4", "src"))
+from dsatur_engine import dsatur_dict
+
 def greedy_coloring(G: dict[int, list[int]], order: list[int] | None = None) -> dict[int, int]:
     """
     Simple greedy graph coloring.
@@ -28,36 +34,7 @@ def dsatur_coloring(G: dict[int, list[int]]) -> dict[int, int]:
     At each step, picks the node with highest saturation (number of distinct neighbor colors).
     Ties are broken by degree.
     """
-    # Initialize data structures
-    coloring = {}
-    saturation = {node: 0 for node in G}  # Number of distinct colors in neighborhood
-    uncolored = set(G.keys())
-    
-    while uncolored:
-        # Find node with maximum saturation
-        max_sat = max(saturation[node] for node in uncolored)
-        candidates = [node for node in uncolored if saturation[node] == max_sat]
-        
-        # Break ties by degree
-        node = max(candidates, key=lambda x: len(G[x]))
-        
-        # Find smallest available color
-        used_colors = {coloring[neighbor] for neighbor in G[node] if neighbor in coloring}
-        color = 0
-        while color in used_colors:
-            color += 1
-        
-        # Color the node
-        coloring[node] = color
-        uncolored.remove(node)
-        
-        # Update saturation for neighbors
-        for neighbor in G[node]:
-            if neighbor in uncolored:
-                neighbor_colors = {coloring[n] for n in G[neighbor] if n in coloring}
-                saturation[neighbor] = len(neighbor_colors)
-    
-    return coloring
+    return dsatur_dict(G)
 
 if __name__ == "__main__":
     from parser import read_graph
@@ -1,3 +1,23 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "PV4", "src"))
+from csr_graph import CSRGraph
+from graph_io import load_csr_graph
+
+
+def read_csr_graph(path: str) -> CSRGraph:
+    """
+    Read an undirected graph into the shared compact CSRGraph (0-based ids).
+    Parsed in bulk; repeat loads memory-map the cached binary sidecar.
+    Args:
+        path: path to the .txt file containing edge-list.
+    Returns:
+        graph: CSRGraph with sorted neighbor rows
+    """
+    return load_csr_graph(path)
+
+
 def read_graph(path: str) -> dict[int, list[int]]:
     """
     Read an undirected graph from the given file.
@@ -6,24 +26,8 @@ def read_graph(path: str) -> dict[int, list[int]]:
     Returns:
         adjacency_list: dict mapping node->list of neighbor nodes
     """
-    adjacency_list = {}
-    
-    with open(path, 'r') as f:
-        # Read first line to get number of nodes and edges
-        num_nodes, num_edges = map(int, f.readline().split())
-        
-        # Initialize adjacency list with empty lists for each node
-        for i in range(num_nodes):
-            adjacency_list[i] = []
-            
-        # Read edges and build adjacency list
-        for _ in range(num_edges):
-            u, v = map(int, f.readline().split())
-            # Add edge in both directions since graph is undirected
-            adjacency_list[u].append(v)
-            adjacency_list[v].append(u)
-            
-    return adjacency_list
+    # Parse once into CSR form and hand out the adjacency-list view
+    return dict(read_csr_graph(path).to_adjacency_dict())
 
 if __name__ == "__main__":
     # örnek: gc_50_9.txt dosyasını oku ve ilk birkaç komşuyu göster
@@ -61,7 +61,7 @@ def run_all(graph_files: list[str], k: int, bt_limit: int = 50) -> list[tuple[st
 
 if __name__ == "__main__":
     files = ["gc_50_9.txt", "gc_70_9.txt", "gc_100_9.txt", "gc_250_9.txt", "gc_500_9.txt"]
-    results = run_all(files, k=9, bt_limit=50)
+    results = run_all(files, k=9, bt_limit=100)
     
     # Create DataFrame and save to CSV
     df = pd.DataFrame(results, columns=[
@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsatur import Graph
+
+
+@pytest.fixture
+def random_dsatur_graph(random_edges):
+    """dsatur.Graph instances built from the shared random_edges."""
+    def build(n, p, seed, colors=None):
+        G = Graph(n)
+        for u, v in random_edges(n, p, seed, colors):
+            G.adj[u].add(v)
+            G.adj[v].add(u)
+        return G
+    return build
@@ -0,0 +1,38 @@
+from dsatur import Graph, dsatur_exact
+
+
+def _proper(G, colors):
+    return all(colors[u] != colors[v] for u in range(G.n) for v in G.adj[u])
+
+
+def _colorable(G, k, colors=None, v=0):
+    """Plain backtracking on the vertex order, for small graphs."""
+    colors = colors if colors is not None else [-1] * G.n
+    if v == G.n:
+        return True
+    for c in range(k):
+        if all(colors[u] != c for u in G.adj[v]):
+            colors[v] = c
+            if _colorable(G, k, colors, v + 1):
+                return True
+    colors[v] = -1
+    return False
+
+
+def test_exact_search_finds_the_chromatic_number(random_dsatur_graph):
+    for seed in range(15):
+        G = random_dsatur_graph(12, 0.4, seed)
+        colors, k, optimal = dsatur_exact(G)
+        assert optimal and _proper(G, colors) and len(set(colors)) == k
+        assert not _colorable(G, k - 1)
+
+
+def test_budget_keeps_a_valid_coloring(random_dsatur_graph):
+    G = random_dsatur_graph(70, 0.5, seed=60)
+    colors, k, optimal = dsatur_exact(G, node_limit=50)
+    assert not optimal
+    assert _proper(G, colors) and len(set(colors)) == k
+
+
+def test_empty_graph():
+    assert dsatur_exact(Graph(0)) == ([], 0, True)
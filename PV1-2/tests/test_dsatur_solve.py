@@ -0,0 +1,29 @@
+import backtracking
+from anytime import Deadline
+from dsatur import Graph, dsatur_exact, solve
+
+
+def test_solve_agrees_with_backtracking(random_dsatur_graph):
+    for seed in range(15):
+        G = random_dsatur_graph(12, 0.4, seed)
+        _, k, _ = dsatur_exact(G)
+        adj_list = {v: sorted(G.adj[v]) for v in range(G.n)}
+        for target_k in (k - 1, k):
+            assert solve(G, target_k)["status"] == backtracking.solve(adj_list, target_k)["status"]
+        assert solve(G, k - 1)["status"] == "infeasible"
+        assert solve(G, k)["valid"]
+
+
+def test_empty_graph():
+    assert solve(Graph(0), 1)["status"] == "target"
+
+
+def test_budget_is_not_infeasible(random_dsatur_graph):
+    G = random_dsatur_graph(70, 0.5, seed=60)
+    # The search stops before settling k = 9, which proves nothing
+    assert solve(G, 9, node_limit=50)["status"] == "finished"
+    # k below the clique bound is infeasible without any search
+    assert solve(G, 7, node_limit=50)["status"] == "infeasible"
+    deadline = Deadline()
+    deadline.cancel()
+    assert solve(G, 9, deadline=deadline)["status"] == "cancelled"
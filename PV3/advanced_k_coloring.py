@@ -7,114 +7,63 @@ Combines GA with backtracking and constraint propagation
 import random
 from graph_loader import load_graph
 from heuristics import dsatur_coloring
+from anytime import Deadline, Incumbent, solve_result
+from domain_store import DomainStore
+from backtrack_engine import KColoringSearch
+from chromatic_search import minimize_colors
 
-def can_color_vertex(vertex, color, assignment, adj_list):
-    """Check if vertex can be colored with given color"""
-    for neighbor in adj_list.get(vertex, []):
-        if neighbor in assignment and assignment[neighbor] == color:
-            return False
-    return True
+def can_color_vertex(vertex, color, store):
+    """Check if vertex can be colored with given color (1..k) in the domain store"""
+    return store.allowed(vertex, color - 1)
 
-def backtrack_k_coloring(adj_list, num_vertices, k, partial_solution=None, timeout_generations=1000):
+def backtrack_k_coloring(adj_list, num_vertices, k, partial_solution=None, timeout_generations=1000, deadline=None,
+                         on_progress=None):
     """
-    Backtracking algorithm for k-coloring with timeout
+    Backtracking algorithm for k-coloring with a node budget.
+    Runs the iterative search of PV4 backtrack_engine: forward checking on the
+    bitset domain store, MRV/DSATUR vertex order and color symmetry breaking.
+    timeout_generations is the node budget (None: unlimited); the optional
+    deadline (anytime.Deadline) also stops the search, which then returns None.
+    on_progress receives the search (search.nodes) periodically.
     """
-    if partial_solution is None:
-        partial_solution = {}
-    
-    vertices = list(range(num_vertices))
-    # Sort vertices by degree (descending) - harder vertices first
-    vertices.sort(key=lambda v: len(adj_list.get(v, [])), reverse=True)
-    
-    def backtrack_recursive(vertex_idx, generation_count):
-        if generation_count > timeout_generations:
-            return None  # Timeout
-            
-        if vertex_idx == len(vertices):
-            return partial_solution.copy()  # Found solution
-        
-        vertex = vertices[vertex_idx]
-        if vertex in partial_solution:
-            return backtrack_recursive(vertex_idx + 1, generation_count + 1)
-        
-        # Try each color
-        for color in range(1, k + 1):
-            if can_color_vertex(vertex, color, partial_solution, adj_list):
-                partial_solution[vertex] = color
-                
-                result = backtrack_recursive(vertex_idx + 1, generation_count + 1)
-                if result is not None:
-                    return result
-                
-                del partial_solution[vertex]  # Backtrack
-        
-        return None  # No solution found
-    
-    solution_dict = backtrack_recursive(0, 0)
-    if solution_dict:
+    store = DomainStore.from_adjacency(adj_list, num_vertices, k)
+    precolored = {vertex: color - 1 for vertex, color in (partial_solution or {}).items()}
+    search = KColoringSearch(store.masks, k, precolored=precolored, node_limit=timeout_generations,
+                             deadline=deadline, on_progress=on_progress)
+    colors = search.run()
+    if colors is not None:
         # Convert to chromosome format
-        return [solution_dict.get(i, 1) for i in range(num_vertices)]
+        return [color + 1 for color in colors]
     return None
 
 def constraint_propagation_coloring(adj_list, num_vertices, k):
     """
-    Constraint propagation approach
+    Constraint propagation approach.
+    Assignments propagate through the bitset domain store: neighbors reduced to a
+    single color are assigned from a work queue, without sweeping all vertices.
     """
-    # For each vertex, maintain set of possible colors
-    possible_colors = {v: set(range(1, k + 1)) for v in range(num_vertices)}
-    assignment = {}
+    store = DomainStore.from_adjacency(adj_list, num_vertices, k)
     
     # Sort vertices by degree (ascending) - easier vertices first for propagation
     vertices = sorted(range(num_vertices), key=lambda v: len(adj_list.get(v, [])))
     
-    def propagate_constraints():
-        """Remove impossible colors based on current assignments"""
-        changed = True
-        while changed:
-            changed = False
-            for vertex in range(num_vertices):
-                if vertex in assignment:
-                    continue
-                    
-                # Remove colors used by neighbors
-                for neighbor in adj_list.get(vertex, []):
-                    if neighbor in assignment:
-                        neighbor_color = assignment[neighbor]
-                        if neighbor_color in possible_colors[vertex]:
-                            possible_colors[vertex].remove(neighbor_color)
-                            changed = True
-                
-                # If only one color left, assign it
-                if len(possible_colors[vertex]) == 1:
-                    color = list(possible_colors[vertex])[0]
-                    assignment[vertex] = color
-                    changed = True
-                elif len(possible_colors[vertex]) == 0:
-                    return False  # No solution possible
-        return True
-    
     # Try to solve with constraint propagation
     for vertex in vertices:
-        if vertex not in assignment:
-            if not propagate_constraints():
-                return None
-            
-            if vertex not in assignment:
-                # Choose color with minimum remaining values heuristic
-                if possible_colors[vertex]:
-                    color = min(possible_colors[vertex])
-                    assignment[vertex] = color
-                else:
-                    return None
-    
-    if len(assignment) == num_vertices:
-        return [assignment.get(i, 1) for i in range(num_vertices)]
-    return None
+        if store.colors[vertex] == -1:
+            domain = store.domains[vertex]
+            # Smallest remaining color
+            if not domain or not store.assign(vertex, (domain & -domain).bit_length() - 1):
+                return None  # No solution possible
+    
+    return [color + 1 for color in store.colors]
 
-def hybrid_k_coloring_attack(adj_list, num_vertices, k, verbose=True):
+def hybrid_k_coloring_attack(adj_list, num_vertices, k, verbose=True, time_budget=None, deadline=None):
     """
-    Multi-pronged attack on k-coloring problem
+    Multi-pronged attack on k-coloring problem.
+    time_budget (seconds) or a shared deadline bounds the backtracking and the restarts.
     """
+    if deadline is None and time_budget is not None:
+        deadline = Deadline(time_budget)
     if verbose:
         print(f"\n🚀 HYBRID K-COLORING ATTACK for k={k}")
         print("=" * 60)
@@ -141,7 +90,7 @@ def hybrid_k_coloring_attack(adj_list, num_vertices, k, verbose=True):
     if verbose:
         print(f"🔧 Method 2: Backtracking...")
     
-    solution = backtrack_k_coloring(adj_list, num_vertices, k, timeout_generations=5000)
+    solution = backtrack_k_coloring(adj_list, num_vertices, k, timeout_generations=5000, deadline=deadline)
     if solution:
         conflicts = sum(1 for u in adj_list for v in adj_list[u] 
                        if u < v and solution[u] == solution[v])
@@ -160,6 +109,10 @@ def hybrid_k_coloring_attack(adj_list, num_vertices, k, verbose=True):
         print(f"🔧 Method 3: Random Restart Greedy...")
     
     for attempt in range(100):
+        if deadline is not None and deadline.expired():
+            if verbose:
+                print(f"⏰ Time budget exhausted after {attempt} restarts")
+            return None
         vertices = list(range(num_vertices))
         random.shuffle(vertices)  # Random ordering
         
@@ -195,7 +148,70 @@ def hybrid_k_coloring_attack(adj_list, num_vertices, k, verbose=True):
     
     return None
 
-def comprehensive_k_coloring_test():
+def solve(adj_list, k, time_budget=None, target=0, deadline=None, incumbent=None):
+    """
+    Anytime entry point of the exact backtracking search for a proper k-coloring.
+
+    Only complete colorings are offered to the incumbent. If the search space is
+    exhausted before the deadline, the result status is 'infeasible' (no
+    k-coloring exists).
+
+    Args:
+        adj_list (dict): The adjacency list of the graph (vertices 0..n-1).
+        k (int): The number of available colors.
+        time_budget (float): Wall-clock limit in seconds (ignored if deadline is given).
+        target (int): Accepted for the common solver protocol; backtracking only
+            produces proper colorings.
+        deadline (Deadline): Shared budget; cancel() stops the search from another thread.
+        incumbent (Incumbent): Receives the coloring when one is found.
+
+    Returns:
+        dict: See anytime.solve_result.
+    """
+    deadline = deadline if deadline is not None else Deadline(time_budget)
+    incumbent = incumbent if incumbent is not None else Incumbent(max_colors=k)
+    num_vertices = len(adj_list)
+    solution = backtrack_k_coloring(adj_list, num_vertices, k, timeout_generations=None, deadline=deadline)
+    if solution is not None:
+        incumbent.offer(solution, 0)
+    return solve_result(incumbent, deadline, target, infeasible=solution is None and not deadline.expired())
+
+def hybrid_attack_solve(adj_list, k, time_budget=None, target=0, deadline=None, incumbent=None, initial=None):
+    """
+    Anytime wrapper of hybrid_k_coloring_attack for the chromatic search driver.
+
+    With a warm start, its conflict-free vertices are kept as a partial
+    assignment and backtracking only colors the others; the full attack runs
+    if that fails, then the exact search for the rest of the budget. When the
+    exact search is exhausted, the status is 'infeasible' and the driver can
+    stop at k + 1.
+
+    Returns:
+        dict: See anytime.solve_result.
+    """
+    deadline = deadline if deadline is not None else Deadline(time_budget)
+    incumbent = incumbent if incumbent is not None else Incumbent(max_colors=k)
+    num_vertices = len(adj_list)
+    solution = None
+    if initial is not None:
+        partial = {v: initial[v] for v in range(num_vertices)
+                   if all(initial[u] != initial[v] for u in adj_list.get(v, []))}
+        solution = backtrack_k_coloring(adj_list, num_vertices, k, partial_solution=partial,
+                                        timeout_generations=5000, deadline=deadline)
+    if solution is None and not deadline.expired():
+        solution = hybrid_k_coloring_attack(adj_list, num_vertices, k, verbose=False, deadline=deadline)
+    exhausted = False
+    if solution is None and not deadline.expired():
+        search = KColoringSearch(DomainStore.from_adjacency(adj_list, num_vertices, k).masks, k, deadline=deadline)
+        colors = search.run()
+        exhausted = search.exhausted
+        if colors is not None:
+            solution = [color + 1 for color in colors]
+    if solution is not None:
+        incumbent.offer(solution, 0)
+    return solve_result(incumbent, deadline, target, infeasible=exhausted)
+
+def comprehensive_k_coloring_test(time_budget=60.0):
     """
     Comprehensive test of advanced k-coloring techniques
     """
@@ -210,36 +226,23 @@ def comprehensive_k_coloring_test():
     k_dsatur, _ = dsatur_coloring(graph)
     print(f"DSatur baseline: {k_dsatur} colors")
     
-    # Try advanced techniques
-    best_result = k_dsatur
-    
-    for k_target in range(k_dsatur - 1, max(k_dsatur - 3, 1), -1):
-        print(f"\n{'='*50}")
-        print(f"🎯 ATTEMPTING k={k_target}")
-        print(f"{'='*50}")
-        
-        solution = hybrid_k_coloring_attack(graph, num_vertices, k_target, verbose=True)
-        
-        if solution:
-            actual_colors = len(set(solution))
-            conflicts = sum(1 for u in graph for v in graph[u] 
-                           if u < v and solution[u] == solution[v])
-            
-            print(f"\n🎉 BREAKTHROUGH! Found {k_target}-coloring!")
-            print(f"   ✅ Uses {actual_colors} distinct colors")
-            print(f"   ✅ Conflicts: {conflicts}")
-            print(f"   ✅ All colors in range [1, {k_target}]: {all(1 <= c <= k_target for c in solution)}")
-            
-            best_result = k_target
-        else:
-            print(f"\n❌ Could not find {k_target}-coloring")
-            break
+    # Warm-started k-descent between the clique bound and DSatur
+    result = minimize_colors(graph, time_budget=time_budget, solver=hybrid_attack_solve)
+    best_result = result["k"]
+    solution = result["coloring"]
+    if best_result < k_dsatur:
+        conflicts = sum(1 for u in graph for v in graph[u]
+                       if u < v and solution[u] == solution[v])
+        print(f"\n🎉 BREAKTHROUGH! Found {best_result}-coloring!")
+        print(f"   ✅ Conflicts: {conflicts}")
+        print(f"   ✅ All colors in range [1, {best_result}]: {all(1 <= c <= best_result for c in solution)}")
     
     # Final summary
     print(f"\n🏆 FINAL COMPREHENSIVE RESULTS:")
     print("=" * 50)
     print(f"DSatur baseline:     {k_dsatur} colors")
     print(f"Advanced techniques: {best_result} colors")
+    print(f"Clique lower bound:  {result['lower_bound']} colors")
     
     if best_result < k_dsatur:
         improvement = ((k_dsatur - best_result) / k_dsatur) * 100
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+CHROMATIC NUMBER SEARCH
+Drives a k-coloring solver towards the smallest k it can reach: maximum clique
+lower bound, DSatur upper bound, warm-started attempts and adaptive time budgets.
+"""
+
+import random
+from heuristics import dsatur_coloring
+# PV4/src is on sys.path through heuristics
+from anytime import Deadline, Incumbent, solve_result
+from clique_engine import max_clique
+from csr_graph import CSRGraph
+from dsatur_engine import dsatur
+from hybrid_genetic_algorithms import TabuSearch
+
+STRATEGIES = ("descent", "bisection")
+
+
+def clique_lower_bound(adj_list, time_budget=1.0, deadline=None):
+    """
+    Size of a clique of the graph; any clique size is a lower bound on the
+    chromatic number. The bit-parallel maximum clique search (PV4
+    clique_engine) returns the best clique found within the budget.
+
+    Args:
+        adj_list (dict): The adjacency list of the graph (vertices 0..n-1).
+        time_budget (float): Wall-clock limit in seconds (ignored if deadline is given).
+        deadline (Deadline): Shared budget.
+
+    Returns:
+        int: The size of the largest clique found.
+    """
+    masks = [0] * len(adj_list)
+    for v in range(len(adj_list)):
+        for u in adj_list.get(v, []):
+            masks[v] |= 1 << u
+    clique, _ = max_clique(masks, time_budget=time_budget, deadline=deadline)
+    return len(clique)
+
+
+def drop_top_color(coloring, adj_list, k):
+    """
+    Removes color k from a coloring: every vertex of color k moves to the color
+    in 1..k-1 with the fewest conflicts (random ties).
+
+    Args:
+        coloring (list): Colors 1..k of the vertices.
+        adj_list (dict): The adjacency list of the graph.
+        k (int): The color to remove.
+
+    Returns:
+        list: A new coloring with colors 1..k-1, possibly with conflicts.
+    """
+    coloring = list(coloring)
+    for v in [v for v, color in enumerate(coloring) if color == k]:
+        counts = [0] * k
+        for u in adj_list.get(v, []):
+            if coloring[u] < k:
+                counts[coloring[u]] += 1
+        fewest = min(counts[1:])
+        coloring[v] = random.choice([c for c in range(1, k) if counts[c] == fewest])
+    return coloring
+
+
+def _compact(coloring):
+    """Renumbers the colors of a coloring to 1..c in order of first use."""
+    mapping = {}
+    return [mapping.setdefault(color, len(mapping) + 1) for color in coloring]
+
+
+def tabucol_solve(adj_list, k, time_budget=None, target=0, deadline=None, incumbent=None, initial=None,
+                  max_iterations=1000000, tabu_tenure=10):
+    """
+    Anytime TabuCol (PV4 TabuSearch) on k colors, the default solver of minimize_colors.
+
+    Args:
+        adj_list (dict): The adjacency list of the graph (vertices 0..n-1).
+        k (int): The number of available colors.
+        time_budget (float): Wall-clock limit in seconds (ignored if deadline is given).
+        target (int): Conflict count accepted as a solution.
+        deadline (Deadline): Shared budget; cancel() stops the search from another thread.
+        incumbent (Incumbent): Receives the best coloring (colors 1..k).
+        initial (list): Warm-start coloring with colors 1..k (default: k-limited DSatur).
+
+    Returns:
+        dict: See anytime.solve_result.
+    """
+    deadline = deadline if deadline is not None else Deadline(time_budget)
+    incumbent = incumbent if incumbent is not None else Incumbent(max_colors=k)
+    n = len(adj_list)
+    graph = CSRGraph.from_edges(n, [(u, v) for u in range(n) for v in adj_list.get(u, []) if u < v], base=0)
+    if initial is None:
+        start = dsatur(graph.adjacency_lists(), num_colors=k)
+    else:
+        start = [color - 1 for color in initial]
+    search = TabuSearch(graph, start, max_iterations=max_iterations, tabu_tenure=tabu_tenure,
+                        deadline=deadline, num_colors=k, verbose=False)
+    solution, conflicts = search.run()
+    incumbent.offer([color + 1 for color in solution], conflicts)
+    return solve_result(incumbent, deadline, target)
+
+
+def minimize_colors(adj_list, time_budget=60.0, solver=tabucol_solve, strategy="descent",
+                    min_attempt_budget=0.5, initial=None, deadline=None, verbose=True, clique_budget=1.0, max_failures=5):
+    """
+    Searches for the smallest k for which the solver finds a proper k-coloring.
+
+    The search lies between a clique lower bound and the DSatur (or given)
+    upper bound. Every attempt at k is warm-started from the best valid
+    coloring with its top color classes redistributed (drop_top_color), so the
+    solver starts a few conflicts away from a solution instead of from scratch.
+
+    - 'descent' tries k = best - 1.
+    - 'bisection' probes the middle of the open range first. After a failed
+      probe it continues above the probe, and once the range is closed it falls
+      back to descent.
+
+    Each attempt gets the remaining time divided by the remaining gap to the
+    lower bound. The budget doubles with every failure at the same k, and never
+    drops below min_attempt_budget. After max_failures failures at the same k
+    the search stops, so it also ends without a time budget. A solver result
+    with status 'infeasible' (an exact solver proved that no k-coloring exists)
+    raises the lower bound.
+
+    Args:
+        adj_list (dict): The adjacency list of the graph (vertices 0..n-1).
+        time_budget (float): Total wall-clock budget in seconds (ignored if deadline is given).
+        solver (callable): solver(adj_list, k, deadline=..., incumbent=..., initial=...)
+            returning an anytime.solve_result dict, e.g. tabucol_solve or
+            genetic_algorithm.solve_enhanced_memetic.
+        strategy (str): One of STRATEGIES.
+        min_attempt_budget (float): Smallest time budget of one attempt in seconds.
+        initial (list or dict): Valid starting coloring (default: DSatur).
+        deadline (Deadline): Shared budget; cancel() stops the search from another thread.
+        verbose (bool): Print every attempt.
+        clique_budget (float): Seconds of the budget spent on the clique lower bound.
+        max_failures (int): Failed attempts at the same k before the search gives up.
+
+    Returns:
+        dict: k (best number of colors), coloring (list, colors 1..k),
+        lower_bound, upper_bound (the starting k), optimal (k reached the
+        lower bound), attempts (k, status, budget and elapsed of every attempt)
+        and elapsed.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{strategy}', expected one of {STRATEGIES}.")
+    deadline = deadline if deadline is not None else Deadline(time_budget)
+    n = len(adj_list)
+    if initial is None:
+        _, initial = dsatur_coloring(adj_list)
+    best = _compact([initial[v] for v in range(n)])
+    best_k = max(best, default=0)
+    upper_bound = best_k
+    lower_bound = clique_lower_bound(adj_list, deadline=Deadline(clique_budget, parent=deadline))
+    probe_floor = lower_bound
+    failures = 0
+    attempts = []
+
+    if verbose:
+        print(f"\n🔎 CHROMATIC SEARCH ({strategy}): clique lower bound {lower_bound}, upper bound {upper_bound}")
+
+    while best_k > lower_bound and not deadline.expired():
+        if strategy == "bisection" and probe_floor < best_k - 1:
+            k = (probe_floor + best_k - 1) // 2
+        else:
+            k = best_k - 1
+
+        warm = best
+        for color in range(best_k, k, -1):
+            warm = drop_top_color(warm, adj_list, color)
+
+        remaining = deadline.remaining()
+        budget = None
+        if remaining != float('inf'):
+            budget = remaining / (best_k - lower_bound) * 2 ** failures
+            budget = min(remaining, max(min_attempt_budget, budget))
+        attempt_deadline = Deadline(budget, parent=deadline)
+
+        result = solver(adj_list, k, deadline=attempt_deadline, incumbent=Incumbent(max_colors=k), initial=warm)
+        attempts.append({"k": k, "status": result["status"], "budget": budget, "elapsed": result["elapsed"]})
+        if verbose:
+            shown = "∞" if budget is None else f"{budget:.2f}s"
+            print(f"  k={k}: {result['status']} after {result['elapsed']:.2f}s (budget {shown}, "
+                  f"conflicts {result['conflicts']})")
+
+        if result["valid"]:
+            coloring = result["coloring"]
+            best = _compact([coloring[v] for v in range(n)])
+            best_k = max(best)
+            failures = 0
+        elif result["status"] == "infeasible":
+            lower_bound = max(lower_bound, k + 1)
+            probe_floor = max(probe_floor, lower_bound)
+            failures = 0
+        elif result["status"] == "cancelled":
+            break
+        else:
+            probe_floor = max(probe_floor, k + 1)
+            if k == best_k - 1:
+                failures += 1
+                if failures >= max_failures:
+                    break
+
+    if verbose:
+        print(f"🏁 Best k={best_k} (lower bound {lower_bound}, {len(attempts)} attempts, "
+              f"{deadline.elapsed():.2f}s)")
+
+    return {
+        "k": best_k,
+        "coloring": best,
+        "lower_bound": lower_bound,
+        "upper_bound": upper_bound,
+        "optimal": best_k == lower_bound,
+        "attempts": attempts,
+        "elapsed": deadline.elapsed()
+    }
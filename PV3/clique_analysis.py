@@ -3,80 +3,50 @@
 CLIQUE ANALYSIS: Careful analysis of cliques in the graph
 """
 
-from graph_loader import load_graph
+import time
+from graph_loader import load_csr_graph
+from clique_engine import max_clique
 
-def find_max_clique():
-    """Find the maximum clique more carefully"""
+def find_max_clique(file_path='gc_50_9.txt', time_budget=60.0):
+    """
+    Find the maximum clique with the bit-parallel branch and bound of
+    PV4 clique_engine (proven maximum unless the time budget runs out).
+    """
     
     print("🔍 CAREFUL CLIQUE ANALYSIS")
     print("=" * 40)
     
-    # Load graph
-    num_vertices, num_edges, graph = load_graph('gc_50_9.txt')
+    # Load graph; adjacency as integer bitsets, O(1) edge tests
+    graph = load_csr_graph(file_path)
+    masks = graph.build_bitmatrix()
     
     def is_clique(vertices):
         """Check if a set of vertices forms a clique"""
         vertices = list(vertices)
         for i in range(len(vertices)):
             for j in range(i + 1, len(vertices)):
-                v1, v2 = vertices[i], vertices[j]
-                if v2 not in graph.get(v1, []):
+                if not graph.has_edge(vertices[i], vertices[j]):
                     return False
         return True
     
-    def find_clique_from_vertex(start_vertex):
-        """Find largest clique containing start_vertex"""
-        clique = {start_vertex}
-        candidates = set(graph.get(start_vertex, []))
-        
-        while candidates:
-            # Find vertex in candidates that is connected to all in clique
-            best_vertex = None
-            best_connections = -1
-            
-            for candidate in candidates:
-                connections = sum(1 for v in clique if candidate in graph.get(v, []))
-                if connections == len(clique) and connections > best_connections:
-                    best_vertex = candidate
-                    best_connections = connections
-            
-            if best_vertex is not None:
-                clique.add(best_vertex)
-                # Update candidates - only those connected to all in clique
-                new_candidates = set()
-                for candidate in candidates:
-                    if candidate != best_vertex:
-                        connected_to_all = all(candidate in graph.get(v, []) for v in clique)
-                        if connected_to_all:
-                            new_candidates.add(candidate)
-                candidates = new_candidates
-            else:
-                break
-        
-        return clique
-    
-    print(f"🔍 Finding maximum clique...")
+    print(f"🔍 Finding maximum clique (budget {time_budget:.0f}s)...")
     
-    max_clique = set()
-    max_size = 0
+    start_time = time.time()
+    clique, optimal = max_clique(masks, time_budget=time_budget)
+    max_clique_set = set(clique)
+    max_size = len(clique)
     
-    # Try from a few high-degree vertices
-    degrees = [(len(graph.get(v, [])), v) for v in range(num_vertices)]
-    degrees.sort(reverse=True)
-    
-    for degree, vertex in degrees[:10]:  # Top 10 highest degree
-        clique = find_clique_from_vertex(vertex)
-        if len(clique) > max_size:
-            max_clique = clique
-            max_size = len(clique)
-        print(f"   Vertex {vertex} (degree {degree}): clique size {len(clique)}")
+    if optimal:
+        print(f"   ✅ Search completed in {time.time() - start_time:.2f}s: clique is maximum")
+    else:
+        print(f"   ⏰ Time budget exhausted: best clique found so far")
     
     print(f"\n📊 RESULTS:")
     print(f"   Maximum clique size found: {max_size}")
-    print(f"   Maximum clique: {sorted(max_clique)}")
+    print(f"   Maximum clique: {sorted(max_clique_set)}")
     
     # Verify the clique
-    if is_clique(max_clique):
+    if is_clique(max_clique_set):
         print(f"   ✅ Verified: This is indeed a clique")
     else:
         print(f"   ❌ ERROR: This is not a valid clique!")
@@ -95,15 +65,15 @@ def find_max_clique():
         print(f"   ✅ Possible: {max_size} ≤ 22, so 22-coloring could exist")
     
     # Detailed check of the clique
-    if max_clique:
+    if max_clique_set:
         print(f"\n🔬 DETAILED CLIQUE VERIFICATION:")
-        clique_list = list(max_clique)
+        clique_list = list(max_clique_set)
         missing_edges = []
         
         for i in range(len(clique_list)):
             for j in range(i + 1, len(clique_list)):
                 v1, v2 = clique_list[i], clique_list[j]
-                if v2 not in graph.get(v1, []):
+                if not graph.has_edge(v1, v2):
                     missing_edges.append((v1, v2))
         
         if missing_edges:
@@ -112,7 +82,7 @@ def find_max_clique():
         else:
             print(f"   ✅ All edges present - valid clique")
     
-    return max_size, max_clique
+    return max_size, max_clique_set
 
 if __name__ == "__main__":
     find_max_clique() 
@@ -3,8 +3,11 @@
 FINAL TEST: Check the limits of k-coloring
 """
 
-from graph_loader import load_graph
+from graph_loader import load_graph, load_csr_graph
 from heuristics import dsatur_coloring
+from anytime import Deadline
+from clique_engine import max_clique
+from backtrack_engine import KColoringSearch
 import time
 
 def test_k_limits():
@@ -21,48 +24,32 @@ def test_k_limits():
     dsatur_k, _ = dsatur_coloring(graph)
     print(f"DSatur baseline: {dsatur_k} colors")
     
-    def backtrack_k_coloring(k, timeout_calls=50000):
-        """Simple backtracking with call limit"""
-        assignment = {}
-        vertices = list(range(num_vertices))
-        vertices.sort(key=lambda v: len(graph.get(v, [])), reverse=True)
-        
-        call_count = 0
-        
-        def can_color(vertex, color):
-            for neighbor in graph.get(vertex, []):
-                if neighbor in assignment and assignment[neighbor] == color:
-                    return False
-            return True
-        
-        def backtrack(vertex_idx):
-            nonlocal call_count
-            call_count += 1
-            
-            if call_count > timeout_calls:
-                return False
-                
-            if vertex_idx >= len(vertices):
-                return True
-            
-            vertex = vertices[vertex_idx]
-            
-            for color in range(1, k + 1):
-                if can_color(vertex, color):
-                    assignment[vertex] = color
-                    
-                    if backtrack(vertex_idx + 1):
-                        return True
-                    
-                    del assignment[vertex]
-            
-            return False
+    masks = load_csr_graph('gc_50_9.txt').build_bitmatrix()
+    
+    # Proven lower bound: no k below the maximum clique size needs testing
+    clique, clique_optimal = max_clique(masks, time_budget=5.0)
+    lower_bound = len(clique)
+    print(f"Clique lower bound: {lower_bound} colors" + (" (maximum clique)" if clique_optimal else ""))
+    
+    def show_progress(search):
+        print(f"    ... {search.nodes} nodes", end="\r", flush=True)
+    
+    def backtrack_k_coloring(k, timeout_calls=50000, time_budget=None):
+        """
+        Iterative backtracking (PV4 backtrack_engine: forward checking, DSatur
+        ordering, symmetry breaking) with node limit and optional wall-clock budget (seconds)
+        """
+        search = KColoringSearch(masks, k, node_limit=timeout_calls, deadline=Deadline(time_budget),
+                                 on_progress=show_progress, progress_interval=20000)
         
         start_time = time.time()
-        success = backtrack(0)
+        colors = search.run()
         end_time = time.time()
         
-        return success, call_count, end_time - start_time, assignment
+        success = colors is not None
+        assignment = {v: color + 1 for v, color in enumerate(colors)} if success else {}
+        timed_out = not success and not search.exhausted
+        return success, search.nodes, end_time - start_time, assignment, timed_out
     
     # Test different k values
     print(f"\n🧪 TESTING DIFFERENT K VALUES:")
@@ -71,18 +58,18 @@ def test_k_limits():
     
     results = {}
     
-    for k in range(23, 16, -1):  # From 23 down to 17
-        success, calls, time_taken, assignment = backtrack_k_coloring(k, timeout_calls=100000)
+    for k in range(23, lower_bound - 1, -1):  # From 23 down to the clique bound
+        success, calls, time_taken, assignment, timed_out = backtrack_k_coloring(k, timeout_calls=None, time_budget=5.0)
         
         status = "✅ FOUND" if success else "❌ FAILED"
-        if calls >= 100000:
+        if timed_out:
             status = "⏰ TIMEOUT"
         
         results[k] = success
         
         print(f"{k:>3} | {str(success):>8} | {calls:>8} | {time_taken:>6.3f}s | {status}")
         
-        if not success and calls < 100000:
+        if not success and not timed_out:
             print(f"    └─ PROVEN IMPOSSIBLE with {calls} calls")
             break
     
@@ -91,6 +78,8 @@ def test_k_limits():
     
     successful_k = [k for k, success in results.items() if success]
     failed_k = [k for k, success in results.items() if not success]
+    if not failed_k and lower_bound > 1:
+        failed_k = [lower_bound - 1]  # Ruled out by the clique
     
     if successful_k:
         min_successful = min(successful_k)
@@ -3,12 +3,15 @@ This file makes the 'genetic_algorithm' directory a Python package
 and exposes the main functions to be used by other modules.
 """
 
-from .ga import run_memetic_algorithm, calculate_fitness
-from .ga_enhanced import run_enhanced_memetic_algorithm, run_multistart_enhanced_algorithm
+from .ga import run_memetic_algorithm, solve_memetic, calculate_fitness, calculate_population_fitness
+from .ga_enhanced import run_enhanced_memetic_algorithm, run_multistart_enhanced_algorithm, solve_enhanced_memetic
 
 __all__ = [
     'run_memetic_algorithm',
     'run_enhanced_memetic_algorithm', 
     'run_multistart_enhanced_algorithm',
-    'calculate_fitness'
+    'solve_memetic',
+    'solve_enhanced_memetic',
+    'calculate_fitness',
+    'calculate_population_fitness'
 ]
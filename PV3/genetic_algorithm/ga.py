@@ -1,6 +1,19 @@
+import sys
+import os
 import random
+from itertools import count
 from heuristics import dsatur_coloring
 
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "PV4", "src"))
+try:
+    from batch_evaluation import BatchEvaluator
+except ImportError:  # numpy is optional, calculate_fitness is then used per chromosome
+    BatchEvaluator = None
+from fitness_cache import FitnessCache, ZobristHasher
+from selection import tournament_indices
+from anytime import Deadline, Incumbent, solve_result
+from population_store import PopulationStore
+
 def calculate_fitness(chromosome, adj_list):
     """
     Calculates the fitness of a chromosome.
@@ -14,6 +27,21 @@ def calculate_fitness(chromosome, adj_list):
                     conflicts += 1
     return conflicts
 
+def calculate_population_fitness(population, batch_evaluator, fitness_cache=None, adj_list=None):
+    """
+    Calculates the fitness of every chromosome of the population at once.
+    Equivalent to calling calculate_fitness on each chromosome, but vectorized over the edge array.
+    Without a batch_evaluator (numpy missing) calculate_fitness is called on adj_list instead.
+    With a fitness_cache, chromosomes seen before (e.g. elites) are not evaluated again.
+    """
+    if batch_evaluator is None:
+        compute = lambda chromosomes: [calculate_fitness(chromosome, adj_list) for chromosome in chromosomes]
+    else:
+        compute = lambda chromosomes: batch_evaluator.conflicts(chromosomes).tolist()
+    if fitness_cache is None:
+        return compute(population)
+    return fitness_cache.get_or_compute_many(population, compute)
+
 def local_search_improvement(chromosome, adj_list, num_colors):
     """
     Improves a chromosome by performing local search.
@@ -50,16 +78,22 @@ def local_search_improvement(chromosome, adj_list, num_colors):
             
     return chromosome
 
-def run_memetic_algorithm(adj_list, num_vertices, num_colors, verbose=True):
+def run_memetic_algorithm(adj_list, num_vertices, num_colors, verbose=True, generations=500,
+                          deadline=None, incumbent=None, target=0):
     """
     Main function to run the Memetic Algorithm for graph coloring.
+
+    Args:
+        generations (int): Generation limit; None runs until the target or the deadline.
+        deadline (Deadline): Polled every generation; the run stops when it expires.
+        incumbent (Incumbent): Receives every improvement of the best solution.
+        target (int): Stop once the best solution has at most this many conflicts.
     """
     if verbose:
         print("\nRunning Memetic Algorithm (GA + Local Search)...")
     
     # --- 1. GA Parameters (More Aggressive Search) ---
     population_size = 200
-    generations = 500
     mutation_rate = 0.2
     crossover_rate = 0.85
     tournament_size = 5
@@ -80,18 +114,31 @@ def run_memetic_algorithm(adj_list, num_vertices, num_colors, verbose=True):
     # --- 3. Main GA Loop ---
     best_solution_overall = None
     best_fitness_overall = float('inf')
+    batch_evaluator = BatchEvaluator.from_adjacency(adj_list, num_vertices) if BatchEvaluator is not None else None
+    fitness_cache = FitnessCache(hasher=ZobristHasher(num_vertices, num_colors))
+    # Double-buffered population: children are written in place into the rows of the
+    # next buffer and the buffers swap every generation
+    store = PopulationStore(population_size, num_vertices)
+    store.load(population)
+    scratch = [0] * num_vertices  # Second child of a pair that no longer fits
 
-    for gen in range(generations):
-        fitness_scores = [calculate_fitness(chromo, adj_list) for chromo in population]
-
-        sorted_population = sorted(zip(population, fitness_scores), key=lambda x: x[1])
-        population = [item[0] for item in sorted_population]
-        fitness_scores = [item[1] for item in sorted_population]
+    for gen in (count() if generations is None else range(generations)):
+        if deadline is not None and deadline.expired():
+            if verbose:
+                print(f"Time budget exhausted after {gen} generations.")
+            break
+        population = store.rows
+        fitness_scores = store.fitness
+        fitness_scores[:] = calculate_population_fitness(population, batch_evaluator, fitness_cache, adj_list)
+        order = store.ranking()
         
-        current_best_fitness = fitness_scores[0]
+        current_best_fitness = fitness_scores[order[0]]
         if current_best_fitness < best_fitness_overall:
             best_fitness_overall = current_best_fitness
-            best_solution_overall = population[0]
+            # Rows are reused two generations later, so the best is copied
+            best_solution_overall = population[order[0]][:]
+            if incumbent is not None:
+                incumbent.offer(best_solution_overall, best_fitness_overall)
             if verbose:
                 print(f"Generation {gen+1}/{generations} | Best Fitness: {best_fitness_overall}")
 
@@ -99,38 +146,43 @@ def run_memetic_algorithm(adj_list, num_vertices, num_colors, verbose=True):
             if verbose:
                 print("Found a valid coloring!")
             break
+        if best_fitness_overall <= target:
+            break
 
         # --- 4. Elitism and Selection ---
-        new_population = []
+        new_population = store.next_rows
         elitism_count = int(population_size * 0.1) # Keep top 10%
-        new_population.extend(population[:elitism_count])
+        for i in range(elitism_count):
+            new_population[i][:] = population[order[i]]
 
         # Apply Local Search to some of the elite individuals
         for i in range(int(elitism_count * local_search_rate)):
-             new_population[i] = local_search_improvement(new_population[i], adj_list, num_colors)
+             local_search_improvement(new_population[i], adj_list, num_colors)
             
         # --- 5. Crossover and Mutation ---
-        while len(new_population) < population_size:
-            parents = []
-            for _ in range(2):
-                tournament = random.sample(list(zip(population, fitness_scores)), tournament_size)
-                winner = min(tournament, key=lambda x: x[1])[0]
-                parents.append(winner)
+        # Tournament winners of the whole generation, drawn at once from the fitness vector
+        winners = iter(tournament_indices(fitness_scores, population_size - elitism_count + 1, tournament_size))
+        slot = elitism_count
+        while slot < population_size:
+            parent1 = population[next(winners)]
+            parent2 = population[next(winners)]
+            child1 = new_population[slot]
+            child2 = new_population[slot + 1] if slot + 1 < population_size else scratch
 
+            child1[:] = parent1
+            child2[:] = parent2
             if random.random() < crossover_rate:
                 point = random.randint(1, num_vertices - 1)
-                child1 = parents[0][:point] + parents[1][point:]
-                child2 = parents[1][:point] + parents[0][point:]
-            else:
-                child1, child2 = parents[0][:], parents[1][:]
+                child1[point:] = parent2[point:]
+                child2[point:] = parent1[point:]
 
-            for child in [child1, child2]:
+            for child in (child1, child2):
                 for i in range(num_vertices):
                     if random.random() < mutation_rate:
                         child[i] = random.randint(1, num_colors)
-                new_population.append(child)
+            slot += 2
         
-        population = new_population[:population_size]
+        store.swap()
     
     if verbose:
         print("\nMA run finished.")
@@ -140,4 +192,28 @@ def run_memetic_algorithm(adj_list, num_vertices, num_colors, verbose=True):
         else:
             print(f"Could not find a valid solution. Best attempt had {best_fitness_overall} conflicts.")
 
-    return best_solution_overall 
+    return best_solution_overall
+
+
+def solve_memetic(adj_list, k, time_budget=None, target=0, deadline=None, incumbent=None,
+                  generations=None, verbose=False):
+    """
+    Anytime entry point of the Memetic Algorithm: runs until the target, the
+    time budget or the generation limit.
+
+    Args:
+        adj_list (dict): The adjacency list of the graph (vertices 0..n-1).
+        k (int): The number of available colors.
+        time_budget (float): Wall-clock limit in seconds (ignored if deadline is given).
+        target (int): Stop once the best solution has at most this many conflicts.
+        deadline (Deadline): Shared budget; cancel() stops the run from another thread.
+        incumbent (Incumbent): Receives every improvement while the run is going.
+
+    Returns:
+        dict: See anytime.solve_result.
+    """
+    deadline = deadline if deadline is not None else Deadline(time_budget)
+    incumbent = incumbent if incumbent is not None else Incumbent(max_colors=k)
+    run_memetic_algorithm(adj_list, len(adj_list), k, verbose=verbose, generations=generations,
+                          deadline=deadline, incumbent=incumbent, target=target)
+    return solve_result(incumbent, deadline, target)
@@ -1,5 +1,9 @@
 import random
+from itertools import count
 from heuristics import dsatur_coloring, get_diverse_initial_solutions
+from .kempe import KempeChainEngine
+from .ga import BatchEvaluator, FitnessCache, ZobristHasher, calculate_population_fitness, tournament_indices
+from .ga import Deadline, Incumbent, solve_result, PopulationStore
 
 def calculate_fitness(chromosome, adj_list):
     """
@@ -14,84 +18,21 @@ def calculate_fitness(chromosome, adj_list):
                     conflicts += 1
     return conflicts
 
-def kempe_chain_search(chromosome, adj_list, max_attempts=50):
+def kempe_chain_search(chromosome, adj_list, max_attempts=50, engine=None):
     """
     Advanced local search using Kempe chains.
     A Kempe chain is a connected component in the subgraph induced by vertices of two colors.
+    Chain swaps are scored from the chain's boundary edges by a KempeChainEngine;
+    pass an engine built once per graph to avoid rebuilding its neighbor lists.
     """
-    num_vertices = len(chromosome)
-    colors_used = set(chromosome)
-    improved = False
-    
-    for attempt in range(max_attempts):
-        # Pick two different colors randomly
-        if len(colors_used) < 2:
-            break
-            
-        color1, color2 = random.sample(list(colors_used), 2)
-        
-        # Find all vertices with these colors
-        vertices_c1 = [v for v in range(num_vertices) if chromosome[v] == color1]
-        vertices_c2 = [v for v in range(num_vertices) if chromosome[v] == color2]
-        
-        if not vertices_c1 or not vertices_c2:
-            continue
-        
-        # Build the subgraph with only these two colors
-        subgraph_vertices = set(vertices_c1 + vertices_c2)
-        
-        # Find connected components in this 2-color subgraph
-        visited = set()
-        
-        for start_vertex in subgraph_vertices:
-            if start_vertex in visited:
-                continue
-                
-            # BFS to find the connected component (Kempe chain)
-            component = []
-            queue = [start_vertex]
-            visited.add(start_vertex)
-            
-            while queue:
-                current = queue.pop(0)
-                component.append(current)
-                
-                for neighbor in adj_list.get(current, []):
-                    if neighbor in subgraph_vertices and neighbor not in visited:
-                        visited.add(neighbor)
-                        queue.append(neighbor)
-            
-            if len(component) > 1:
-                # Try swapping colors in this Kempe chain
-                original_fitness = calculate_fitness(chromosome, adj_list)
-                
-                # Swap colors in the component
-                for vertex in component:
-                    if chromosome[vertex] == color1:
-                        chromosome[vertex] = color2
-                    else:
-                        chromosome[vertex] = color1
-                
-                new_fitness = calculate_fitness(chromosome, adj_list)
-                
-                if new_fitness <= original_fitness:
-                    # Keep the improvement
-                    improved = True
-                    if new_fitness == 0:  # Found valid solution
-                        return chromosome
-                else:
-                    # Revert the change
-                    for vertex in component:
-                        if chromosome[vertex] == color1:
-                            chromosome[vertex] = color2
-                        else:
-                            chromosome[vertex] = color1
-    
-    return chromosome
+    if engine is None:
+        engine = KempeChainEngine(adj_list, len(chromosome))
+    return engine.search(chromosome, max_attempts)
 
-def tabu_search_refinement(chromosome, adj_list, max_iterations=100, tabu_length=20):
+def tabu_search_refinement(chromosome, adj_list, max_iterations=100, tabu_length=20, deadline=None):
     """
     Tabu Search to refine the solution further.
+    Stops early when the optional deadline expires.
     """
     current_solution = chromosome[:]
     best_solution = chromosome[:]
@@ -103,6 +44,8 @@ def tabu_search_refinement(chromosome, adj_list, max_iterations=100, tabu_length
     for iteration in range(max_iterations):
         if current_fitness == 0:
             break
+        if deadline is not None and deadline.expired():
+            break
             
         best_move = None
         best_move_fitness = float('inf')
@@ -163,12 +106,13 @@ def tabu_search_refinement(chromosome, adj_list, max_iterations=100, tabu_length
     
     return best_solution
 
-def conflict_aware_crossover(parent1, parent2, adj_list):
+def conflict_aware_crossover(parent1, parent2, adj_list, out=None):
     """
     Intelligent crossover that considers graph structure.
+    The child is written into out when given (e.g. a row of a PopulationStore).
     """
     num_vertices = len(parent1)
-    child = [0] * num_vertices
+    child = [0] * num_vertices if out is None else out
     
     # For each vertex, choose the color from the parent that causes fewer conflicts
     for vertex in range(num_vertices):
@@ -191,17 +135,25 @@ def conflict_aware_crossover(parent1, parent2, adj_list):
     
     return child
 
-def run_enhanced_memetic_algorithm(adj_list, num_vertices, num_colors, verbose=True):
+def run_enhanced_memetic_algorithm(adj_list, num_vertices, num_colors, verbose=True, generations=800,
+                                   deadline=None, incumbent=None, target=0, initial=None):
     """
     Main function to run the Memetic Algorithm for graph coloring
     with advanced heuristics and Kempe chain local search.
+
+    Args:
+        generations (int): Generation limit; None runs until the target or the deadline.
+        deadline (Deadline): Polled every generation and inside the local searches.
+        incumbent (Incumbent): Receives every improvement of the best solution.
+        target (int): Stop once the best solution has at most this many conflicts.
+        initial (list): Warm-start chromosome (colors 1..num_colors), seeded into
+            the population together with a few perturbed copies.
     """
     if verbose:
         print("\nRunning ADVANCED Memetic Algorithm (Multiple Heuristics + Kempe Chains + Smart Crossover)...")
     
     # --- 1. GA Parameters ---
     population_size = 150
-    generations = 800
     base_mutation_rate = 0.15
     crossover_rate = 0.9
     tournament_size = 7
@@ -209,6 +161,15 @@ def run_enhanced_memetic_algorithm(adj_list, num_vertices, num_colors, verbose=T
     
     # --- 2. Smart Population Initialization ---
     population = []
+
+    # Warm start (e.g. the previous k's solution with its top color redistributed)
+    if initial is not None:
+        population.append(list(initial))
+        for _ in range(4):
+            chromosome = list(initial)
+            for i in random.sample(range(num_vertices), max(1, num_vertices // 20)):
+                chromosome[i] = random.randint(1, num_colors)
+            population.append(chromosome)
     
     # Get diverse initial solutions from multiple heuristics
     diverse_solutions = get_diverse_initial_solutions(adj_list, num_solutions=10)
@@ -233,22 +194,35 @@ def run_enhanced_memetic_algorithm(adj_list, num_vertices, num_colors, verbose=T
     best_fitness_overall = float('inf')
     stagnation_counter = 0
     current_mutation_rate = base_mutation_rate
+    batch_evaluator = BatchEvaluator.from_adjacency(adj_list, num_vertices) if BatchEvaluator is not None else None
+    fitness_cache = FitnessCache(hasher=ZobristHasher(num_vertices, num_colors))
+    kempe_engine = KempeChainEngine(adj_list, num_vertices)
+    # Double-buffered population: children are written in place into the rows of the
+    # next buffer and the buffers swap every generation
+    store = PopulationStore(population_size, num_vertices)
+    store.load(population)
 
-    for gen in range(generations):
-        # Evaluate fitness
-        fitness_scores = [calculate_fitness(chromo, adj_list) for chromo in population]
+    for gen in (count() if generations is None else range(generations)):
+        if deadline is not None and deadline.expired():
+            if verbose:
+                print(f"Time budget exhausted after {gen} generations.")
+            break
+        # Evaluate fitness (elites and unchanged parents come from the cache)
+        population = store.rows
+        fitness_scores = store.fitness
+        fitness_scores[:] = calculate_population_fitness(population, batch_evaluator, fitness_cache, adj_list)
         
-        # Sort population by fitness
-        sorted_population = sorted(zip(population, fitness_scores), key=lambda x: x[1])
-        population = [item[0] for item in sorted_population]
-        fitness_scores = [item[1] for item in sorted_population]
+        # Rank population by fitness (indices sorted in place, rows stay where they are)
+        order = store.ranking()
         
-        current_best_fitness = fitness_scores[0]
+        current_best_fitness = fitness_scores[order[0]]
         if current_best_fitness < best_fitness_overall:
             best_fitness_overall = current_best_fitness
-            best_solution_overall = population[0][:]
+            best_solution_overall = population[order[0]][:]
             stagnation_counter = 0
             current_mutation_rate = base_mutation_rate
+            if incumbent is not None:
+                incumbent.offer(best_solution_overall, best_fitness_overall)
             if verbose:
                 print(f"Generation {gen+1}/{generations} | Best Fitness: {best_fitness_overall}")
         else:
@@ -264,21 +238,27 @@ def run_enhanced_memetic_algorithm(adj_list, num_vertices, num_colors, verbose=T
             if verbose:
                 print("Found a valid coloring!")
             break
+        if best_fitness_overall <= target:
+            break
 
         # --- 4. Advanced Local Search with Kempe Chains ---
         kempe_count = int(population_size * kempe_search_rate)
         for i in range(min(kempe_count, len(population))):
-            population[i] = kempe_chain_search(population[i][:], adj_list)
+            if deadline is not None and deadline.expired():
+                break
+            kempe_chain_search(population[order[i]], adj_list, engine=kempe_engine)
 
         # --- 5. Tabu Search Refinement (every 50 generations) ---
         if gen > 0 and gen % 50 == 0 and best_solution_overall is not None:
             if verbose:
                 print(f"Applying Tabu Search refinement at generation {gen+1}")
-            refined_solution = tabu_search_refinement(best_solution_overall, adj_list)
+            refined_solution = tabu_search_refinement(best_solution_overall, adj_list, deadline=deadline)
             refined_fitness = calculate_fitness(refined_solution, adj_list)
             if refined_fitness < best_fitness_overall:
                 best_fitness_overall = refined_fitness
                 best_solution_overall = refined_solution
+                if incumbent is not None:
+                    incumbent.offer(best_solution_overall, best_fitness_overall)
                 if verbose:
                     print(f"Tabu Search improved solution to fitness: {best_fitness_overall}")
 
@@ -288,50 +268,49 @@ def run_enhanced_memetic_algorithm(adj_list, num_vertices, num_colors, verbose=T
                 print(f"Severe stagnation detected! Restarting with new diverse population...")
             # Keep only the best 20% and generate new diverse solutions
             keep_count = int(population_size * 0.2)
-            population = population[:keep_count]
+            replaced = iter(order[keep_count:])
             
             # Add new diverse solutions
             diverse_solutions = get_diverse_initial_solutions(adj_list, num_solutions=5)
-            for solution_dict in diverse_solutions:
+            for solution_dict in diverse_solutions[:population_size - keep_count]:
                 chromosome = [solution_dict.get(i, 1) for i in range(num_vertices)]
                 unique_colors = list(set(chromosome))
                 color_map = {old_color: (i % num_colors) + 1 for i, old_color in enumerate(unique_colors)}
-                chromosome = [color_map[color] for color in chromosome]
-                population.append(chromosome)
+                population[next(replaced)][:] = [color_map[color] for color in chromosome]
             
             # Fill rest randomly
-            while len(population) < population_size:
-                chromosome = [random.randint(1, num_colors) for _ in range(num_vertices)]
-                population.append(chromosome)
+            for row in replaced:
+                chromosome = population[row]
+                for i in range(num_vertices):
+                    chromosome[i] = random.randint(1, num_colors)
             
             stagnation_counter = 0
 
         # --- 7. Elite Preservation ---
-        new_population = []
+        new_population = store.next_rows
         elite_count = int(population_size * 0.15)
-        new_population.extend([ind[:] for ind in population[:elite_count]])
+        for i in range(elite_count):
+            new_population[i][:] = population[order[i]]
 
         # --- 8. Advanced Reproduction ---
-        while len(new_population) < population_size:
-            # Tournament selection
-            parent1 = min(random.sample(list(zip(population, fitness_scores)), tournament_size), 
-                         key=lambda x: x[1])[0]
-            parent2 = min(random.sample(list(zip(population, fitness_scores)), tournament_size), 
-                         key=lambda x: x[1])[0]
+        # Tournament selection: all tournaments of the generation drawn at once from the fitness vector
+        parents = iter(tournament_indices(fitness_scores, 2 * (population_size - elite_count), tournament_size))
+        for slot in range(elite_count, population_size):
+            parent1 = population[next(parents)]
+            parent2 = population[next(parents)]
+            child = new_population[slot]
 
             if random.random() < crossover_rate:
-                child = conflict_aware_crossover(parent1, parent2, adj_list)
+                conflict_aware_crossover(parent1, parent2, adj_list, out=child)
             else:
-                child = parent1[:]
+                child[:] = parent1
 
             # Mutation
             for i in range(num_vertices):
                 if random.random() < current_mutation_rate:
                     child[i] = random.randint(1, num_colors)
-            
-            new_population.append(child)
         
-        population = new_population[:population_size]
+        store.swap()
     
     if verbose:
         print("\nAdvanced MA run finished.")
@@ -343,10 +322,13 @@ def run_enhanced_memetic_algorithm(adj_list, num_vertices, num_colors, verbose=T
 
     return best_solution_overall 
 
-def run_multistart_enhanced_algorithm(adj_list, num_vertices, num_colors, num_runs=3, verbose=True):
+def run_multistart_enhanced_algorithm(adj_list, num_vertices, num_colors, num_runs=3, verbose=True,
+                                      deadline=None, incumbent=None, target=0):
     """
     Run the advanced algorithm multiple times with different starting conditions
     and return the best solution found.
+    All runs share the deadline and the incumbent; no new run starts after the
+    deadline expired or the target was reached.
     """
     if verbose:
         print(f"\n🚀 MULTISTART ADVANCED ALGORITHM - {num_runs} independent runs")
@@ -357,6 +339,10 @@ def run_multistart_enhanced_algorithm(adj_list, num_vertices, num_colors, num_ru
     best_run_number = 0
     
     for run in range(num_runs):
+        if deadline is not None and deadline.expired():
+            break
+        if best_overall_fitness <= target:
+            break
         if verbose:
             print(f"\n⚡ Starting Run #{run + 1}/{num_runs}")
             print("-" * 50)
@@ -365,7 +351,8 @@ def run_multistart_enhanced_algorithm(adj_list, num_vertices, num_colors, num_ru
         random.seed(42 + run * 1000)
         
         # Run the advanced algorithm
-        solution = run_enhanced_memetic_algorithm(adj_list, num_vertices, num_colors, verbose=verbose)
+        solution = run_enhanced_memetic_algorithm(adj_list, num_vertices, num_colors, verbose=verbose,
+                                                  deadline=deadline, incumbent=incumbent, target=target)
         
         if solution:
             fitness = calculate_fitness(solution, adj_list)
@@ -398,4 +385,29 @@ def run_multistart_enhanced_algorithm(adj_list, num_vertices, num_colors, num_ru
         else:
             print(f"   ❌ No valid coloring found. Best attempt had {best_overall_fitness} conflicts.")
     
-    return best_overall_solution 
+    return best_overall_solution
+
+
+def solve_enhanced_memetic(adj_list, k, time_budget=None, target=0, deadline=None, incumbent=None,
+                           generations=None, verbose=False, initial=None):
+    """
+    Anytime entry point of the advanced Memetic Algorithm: runs until the
+    target, the time budget or the generation limit.
+
+    Args:
+        adj_list (dict): The adjacency list of the graph (vertices 0..n-1).
+        k (int): The number of available colors.
+        time_budget (float): Wall-clock limit in seconds (ignored if deadline is given).
+        target (int): Stop once the best solution has at most this many conflicts.
+        deadline (Deadline): Shared budget; cancel() stops the run from another thread.
+        incumbent (Incumbent): Receives every improvement while the run is going.
+        initial (list): Optional warm-start chromosome with colors 1..k.
+
+    Returns:
+        dict: See anytime.solve_result.
+    """
+    deadline = deadline if deadline is not None else Deadline(time_budget)
+    incumbent = incumbent if incumbent is not None else Incumbent(max_colors=k)
+    run_enhanced_memetic_algorithm(adj_list, len(adj_list), k, verbose=verbose, generations=generations,
+                                   deadline=deadline, incumbent=incumbent, target=target, initial=initial)
+    return solve_result(incumbent, deadline, target)
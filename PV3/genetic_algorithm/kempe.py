@@ -0,0 +1,142 @@
+import random
+from collections import deque
+
+
+class KempeChainEngine:
+    """
+    Kempe-chain move engine for graph coloring.
+
+    A Kempe chain for the color pair (a, b) is a connected component of the
+    a-b edges between vertices colored a or b. Swapping a and b on a chain only
+    changes the conflict status of the chain's boundary edges, so the delta is
+    computed from those edges alone instead of re-evaluating the whole graph.
+    Per-color vertex sets give the vertices of a color pair without scanning
+    the chromosome.
+    """
+    def __init__(self, adj_list, num_vertices):
+        """
+        Args:
+            adj_list (dict): The adjacency list of the graph.
+            num_vertices (int): Number of vertices (ids 0..n-1).
+        """
+        self.num_vertices = num_vertices
+        self.neighbors = [list(adj_list.get(v, [])) for v in range(num_vertices)]
+        self.mark = [0] * num_vertices
+        self.stamp = 0
+        self.chromosome = None
+        self.color_classes = {}
+        self.conflicts = 0
+
+    def load(self, chromosome):
+        """
+        Starts working on a chromosome (modified in place): builds the color classes
+        and counts the conflicts once.
+        """
+        self.chromosome = chromosome
+        self.color_classes = {}
+        for v, color in enumerate(chromosome):
+            self.color_classes.setdefault(color, set()).add(v)
+        self.conflicts = sum(1 for u, neighbors in enumerate(self.neighbors)
+                             for v in neighbors if u < v and chromosome[u] == chromosome[v])
+
+    def _new_stamp(self):
+        self.stamp += 1
+        return self.stamp
+
+    def chain(self, start, color1, color2, stamp, visited_from):
+        """
+        BFS over the a-b edges from start; vertices are marked with stamp.
+        Vertices with a mark >= visited_from already belong to another chain.
+
+        Returns:
+            list: The vertices of the Kempe chain containing start.
+        """
+        chromosome = self.chromosome
+        mark = self.mark
+        mark[start] = stamp
+        component = [start]
+        queue = deque(component)
+        while queue:
+            current = queue.popleft()
+            other = color2 if chromosome[current] == color1 else color1
+            for neighbor in self.neighbors[current]:
+                if mark[neighbor] < visited_from and chromosome[neighbor] == other:
+                    mark[neighbor] = stamp
+                    component.append(neighbor)
+                    queue.append(neighbor)
+        return component
+
+    def swap_delta(self, component, color1, color2, stamp):
+        """
+        Conflict change of swapping color1 and color2 on a chain, from its boundary edges.
+        The chain's vertices must carry mark == stamp.
+        """
+        chromosome = self.chromosome
+        mark = self.mark
+        delta = 0
+        for v in component:
+            old = chromosome[v]
+            new = color2 if old == color1 else color1
+            for w in self.neighbors[v]:
+                if mark[w] == stamp:
+                    continue  # Internal edges keep their status
+                color_w = chromosome[w]
+                if color_w == old:
+                    delta -= 1
+                elif color_w == new:
+                    delta += 1
+        return delta
+
+    def swap(self, component, color1, color2, delta):
+        """
+        Applies a chain swap and updates the color classes and conflict count.
+        """
+        chromosome = self.chromosome
+        class1 = self.color_classes.setdefault(color1, set())
+        class2 = self.color_classes.setdefault(color2, set())
+        for v in component:
+            if chromosome[v] == color1:
+                chromosome[v] = color2
+                class1.discard(v)
+                class2.add(v)
+            else:
+                chromosome[v] = color1
+                class2.discard(v)
+                class1.add(v)
+        self.conflicts += delta
+
+    def search(self, chromosome, max_attempts=50):
+        """
+        Kempe-chain local search, same acceptance rule as before: for a random
+        color pair every chain with at least two vertices is swapped when the
+        swap does not increase the conflicts.
+
+        Args:
+            chromosome (list): The coloring, modified in place.
+            max_attempts (int): Number of color pairs tried.
+
+        Returns:
+            list: The improved chromosome.
+        """
+        self.load(chromosome)
+        for _ in range(max_attempts):
+            colors_used = [color for color, members in self.color_classes.items() if members]
+            if len(colors_used) < 2:
+                break
+            color1, color2 = random.sample(colors_used, 2)
+
+            attempt = self.stamp + 1
+            # Snapshot: swaps move vertices between the two classes
+            for start in list(self.color_classes[color1] | self.color_classes[color2]):
+                if self.mark[start] >= attempt:
+                    continue
+                stamp = self._new_stamp()
+                component = self.chain(start, color1, color2, stamp, attempt)
+                if len(component) < 2:
+                    continue
+                delta = self.swap_delta(component, color1, color2, stamp)
+                if delta <= 0:
+                    self.swap(component, color1, color2, delta)
+                    if self.conflicts == 0:  # Found valid solution
+                        return chromosome
+        return chromosome
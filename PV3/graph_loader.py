@@ -1,4 +1,22 @@
-import collections
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "PV4", "src"))
+from graph_io import load_csr_graph as load_cached_csr_graph
+
+def load_csr_graph(file_path):
+    """
+    Loads a graph file into the shared compact CSRGraph representation.
+    The file is parsed in bulk and cached as a binary sidecar, so repeated
+    runs skip parsing.
+
+    Args:
+        file_path (str): The path to the graph file.
+
+    Returns:
+        CSRGraph: The graph with 0-based vertex ids.
+    """
+    return load_cached_csr_graph(file_path)
 
 def load_graph(file_path):
     """
@@ -8,6 +26,9 @@ def load_graph(file_path):
     - First line: <number of vertices> <number of edges>
     - Subsequent lines: <vertex_u> <vertex_v>
 
+    The file is parsed once into a CSRGraph; vertex ids are normalized to 0..n-1
+    so the algorithms can index chromosomes with them directly.
+
     Args:
         file_path (str): The path to the graph file.
 
@@ -17,23 +38,10 @@ def load_graph(file_path):
             - int: The number of edges.
             - dict: The adjacency list representation of the graph.
     """
-    adj_list = collections.defaultdict(list)
-    with open(file_path, 'r') as f:
-        try:
-            first_line = f.readline().strip().split()
-            if len(first_line) < 2:
-                raise ValueError("Invalid file format: First line should contain number of vertices and edges.")
-            num_vertices, num_edges = int(first_line[0]), int(first_line[1])
-
-            for line in f:
-                parts = line.strip().split()
-                if len(parts) < 2:
-                    continue
-                u, v = map(int, parts)
-                adj_list[u].append(v)
-                adj_list[v].append(u)
-        except (IOError, ValueError) as e:
-            print(f"Error reading file {file_path}: {e}")
-            return 0, 0, None
-
-    return num_vertices, num_edges, adj_list 
+    try:
+        graph = load_csr_graph(file_path)
+    except ValueError as e:
+        print(f"Error reading file {file_path}: {e}")
+        return 0, 0, None
+
+    return graph.num_vertices, graph.num_edges, graph.to_adjacency_dict()
@@ -1,5 +1,10 @@
 import collections
 import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "PV4", "src"))
+from dsatur_engine import dsatur_dict
 
 def greedy_coloring(adj_list):
     """
@@ -55,59 +60,11 @@ def dsatur_coloring(adj_list):
             - int: The number of colors used.
             - dict: A dictionary mapping each vertex to its assigned color.
     """
-    nodes = set(adj_list.keys())
-    if not nodes:
+    if not adj_list:
         return 0, {}
 
-    colors = {}
-    
-    # Calculate initial degrees and saturation degrees
-    degrees = {node: len(adj_list.get(node, [])) for node in nodes}
-    saturation_degrees = {node: 0 for node in nodes}
-    
-    while len(colors) < len(nodes):
-        uncolored_nodes = nodes - set(colors.keys())
-
-        # Select the next node to color
-        # Find the node with the maximum saturation degree.
-        # Tie-break with the maximum degree.
-        max_saturation = -1
-        max_degree = -1
-        next_node = None
-        
-        for node in uncolored_nodes:
-            sat = saturation_degrees[node]
-            deg = degrees[node]
-            if sat > max_saturation:
-                max_saturation = sat
-                max_degree = deg
-                next_node = node
-            elif sat == max_saturation:
-                if deg > max_degree:
-                    max_degree = deg
-                    next_node = node
-        
-        # If multiple nodes have the same saturation and degree, pick one
-        if next_node is None:
-            next_node = list(uncolored_nodes)[0]
-
-
-        # Assign the smallest possible color
-        neighbor_colors = {colors[neighbor] for neighbor in adj_list.get(next_node, []) if neighbor in colors}
-        
-        current_color = 1
-        while current_color in neighbor_colors:
-            current_color += 1
-        colors[next_node] = current_color
-
-        # Update saturation degrees of neighbors
-        for neighbor in adj_list.get(next_node, []):
-            if neighbor not in colors:
-                # Check if the new color is a new color for the neighbor's neighborhood
-                neighbor_neighbor_colors = {colors[nn] for nn in adj_list.get(neighbor, []) if nn in colors}
-                if current_color not in neighbor_neighbor_colors:
-                     saturation_degrees[neighbor] += 1
-    
+    # Shared heap-based DSatur engine (PV4/src/dsatur_engine.py), colors start at 1
+    colors = dsatur_dict(adj_list, first_color=1)
     num_colors = len(set(colors.values()))
     return num_colors, colors 
 
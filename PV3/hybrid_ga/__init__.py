@@ -1,4 +1,4 @@
-from .hybrid_ga import HybridGA
+from .hybrid_ga import HybridGA, solve
 
 """
 This package contains hybrid and advanced genetic algorithm implementations for Graph Coloring,
@@ -1,21 +1,39 @@
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "PV4", "src"))
 
 import random
-import math
-import time
-from heuristics import dsatur_coloring, get_diverse_initial_solutions
+from itertools import count
+from heuristics import get_diverse_initial_solutions
 from graph_loader import load_graph
+try:
+    from batch_evaluation import BatchEvaluator
+except ImportError:  # numpy isteğe bağlı; yoksa fitness kromozom başına hesaplanır
+    BatchEvaluator = None
+from fitness_cache import FitnessCache, ZobristHasher
+from selection import tournament_indices
+from anytime import Deadline, Incumbent, solve_result
+from crossover_engine import conflict_aware_uniform, gpx
+from annealing_engine import SimulatedAnnealing
+from population_store import PopulationStore
 
 class HybridGA:
-    def __init__(self, adj_list, num_vertices, num_colors, population_size=150, generations=500, verbose=True):
+    def __init__(self, adj_list, num_vertices, num_colors, population_size=150, generations=500, verbose=True,
+                 crossover='conflict_aware'):
+        # crossover: 'conflict_aware' (komşu renk sayaçlı uniform) veya 'gpx'
+        if crossover not in ('conflict_aware', 'gpx'):
+            raise ValueError(f"Unknown crossover '{crossover}', expected 'conflict_aware' or 'gpx'.")
         self.adj_list = adj_list
         self.num_vertices = num_vertices
         self.num_colors = num_colors
         self.population_size = population_size
         self.generations = generations
         self.verbose = verbose
+        self.neighbors = [adj_list.get(v, []) for v in range(num_vertices)]
+        self.crossover = self.gpx_crossover if crossover == 'gpx' else self.conflict_aware_crossover
+        # Tek gen yeniden boyama hamlesi, O(deg) delta enerji; sıcaklık her çağrıda self.temperature
+        self.annealer = SimulatedAnnealing(self.neighbors, num_colors, move='recolor', first_color=1)
         # Adaptif parametreler
         self.base_mutation_rate = 0.15
         self.crossover_rate = 0.9
@@ -24,8 +42,21 @@ class HybridGA:
         self.stagnation_limit = 50
         self.temperature = 1.0  # Simulated Annealing için başlangıç sıcaklığı
         self.cooling_rate = 0.995
+        self.batch_evaluator = None
+        if BatchEvaluator is not None:
+            self.batch_evaluator = BatchEvaluator.from_adjacency(adj_list, num_vertices)
+        # Zobrist hash ile anahtarlanan LRU fitness önbelleği
+        self.fitness_cache = FitnessCache(hasher=ZobristHasher(num_vertices, num_colors))
 
     def calculate_fitness(self, chromosome):
+        key = self.fitness_cache.hasher.hash(chromosome)
+        fitness = self.fitness_cache.get(key)
+        if fitness is None:
+            fitness = self._compute_fitness(chromosome)
+            self.fitness_cache.put(key, fitness)
+        return fitness
+
+    def _compute_fitness(self, chromosome):
         conflicts = 0
         for u in self.adj_list:
             for v in self.adj_list[u]:
@@ -36,12 +67,22 @@ class HybridGA:
         color_penalty = max(0, colors_used - self.num_colors) * 1000
         return conflicts + color_penalty
 
+    def calculate_population_fitness(self, population):
+        # calculate_fitness'ın tüm popülasyon için vektörize hali
+        return self.fitness_cache.get_or_compute_many(population, self._compute_population_fitness)
+
+    def _compute_population_fitness(self, population):
+        if self.batch_evaluator is None:
+            return [self._compute_fitness(chromosome) for chromosome in population]
+        conflicts, colors_used = self.batch_evaluator.evaluate(population)
+        return [c + max(0, used - self.num_colors) * 1000 for c, used in zip(conflicts.tolist(), colors_used.tolist())]
+
     def repair_solution(self, chromosome):
         # Fazla renkleri k aralığına indir
         unique_colors = list(set(chromosome))
         if len(unique_colors) > self.num_colors:
             color_map = {old: ((i % self.num_colors) + 1) for i, old in enumerate(unique_colors)}
-            chromosome = [color_map[c] for c in chromosome]
+            chromosome[:] = [color_map[c] for c in chromosome]
         # Çatışmaları düzelt
         for u in self.adj_list:
             neighbor_colors = {chromosome[v] for v in self.adj_list[u] if v != u}
@@ -52,20 +93,16 @@ class HybridGA:
                         break
         return chromosome
 
-    def conflict_aware_crossover(self, parent1, parent2):
-        child = [0] * self.num_vertices
-        for i in range(self.num_vertices):
-            color1 = parent1[i]
-            color2 = parent2[i]
-            # Daha az çatışma yaratanı seç
-            conflicts1 = sum(1 for v in self.adj_list.get(i, []) if parent1[v] == color1)
-            conflicts2 = sum(1 for v in self.adj_list.get(i, []) if parent2[v] == color2)
-            if conflicts1 < conflicts2:
-                child[i] = color1
-            elif conflicts2 < conflicts1:
-                child[i] = color2
-            else:
-                child[i] = random.choice([color1, color2])
+    def conflict_aware_crossover(self, parent1, parent2, out=None):
+        # Her gen, çocukta yerleşmiş komşularla daha az çatışan ebeveyn rengini alır;
+        # komşu renk sayaçları artımlı tutulduğu için maliyet O(n + m)
+        # out: çocuğun yazılacağı satır (verilmezse yeni liste)
+        child = conflict_aware_uniform(self.neighbors, parent1, parent2, out=out)
+        return self.repair_solution(child)
+
+    def gpx_crossover(self, parent1, parent2, out=None):
+        # Greedy partition crossover: ebeveynler sırayla en büyük renk sınıfını verir
+        child = gpx(parent1, parent2, self.num_colors, first_color=1, out=out)
         return self.repair_solution(child)
 
     def classic_mutation(self, chromosome, mutation_rate):
@@ -86,21 +123,10 @@ class HybridGA:
             chromosome[i:j] = reversed(chromosome[i:j])
         return chromosome
 
-    def simulated_annealing(self, chromosome, fitness):
-        # Basit SA: Rastgele bir gen değiştir, kabul olasılığına göre uygula
-        i = random.randint(0, self.num_vertices - 1)
-        old_color = chromosome[i]
-        new_color = random.randint(1, self.num_colors)
-        chromosome[i] = new_color
-        new_fitness = self.calculate_fitness(chromosome)
-        delta = new_fitness - fitness
-        if delta < 0 or random.random() < math.exp(-delta / self.temperature):
-            return chromosome, new_fitness
-        else:
-            chromosome[i] = old_color
-            return chromosome, fitness
-
-    def run(self, mutation_strategy='classic'):
+    def run(self, mutation_strategy='classic', deadline=None, incumbent=None, target=0):
+        # deadline: her nesilde ve SA döngüsünde kontrol edilir (zaman bütçesi / iptal)
+        # incumbent: her iyileşmede en iyi çözüm buraya bildirilir
+        # target: en iyi fitness bu değere inince durulur
         # Başlangıç popülasyonu: Sadece 1..k arası renk
         population = []
         diverse_solutions = get_diverse_initial_solutions(self.adj_list, num_solutions=10)
@@ -109,22 +135,35 @@ class HybridGA:
             population.append(chromo)
         while len(population) < self.population_size:
             population.append([random.randint(1, self.num_colors) for _ in range(self.num_vertices)])
+        # Çift tamponlu popülasyon: çocuklar bir sonraki tamponun satırlarına yerinde yazılır,
+        # her nesilde tamponlar yer değiştirir (nesil başına yeni kromozom listesi yok)
+        store = PopulationStore(self.population_size, self.num_vertices)
+        store.load(population)
+        size = self.population_size
 
         best_solution = None
         best_fitness = float('inf')
         stagnation = 0
         mutation_rate = self.base_mutation_rate
 
-        for gen in range(self.generations):
-            fitness_scores = [self.calculate_fitness(chromo) for chromo in population]
-            sorted_pop = sorted(zip(population, fitness_scores), key=lambda x: x[1])
-            population = [item[0] for item in sorted_pop]
-            fitness_scores = [item[1] for item in sorted_pop]
+        generations = count() if self.generations is None else range(self.generations)
+        for gen in generations:
+            if deadline is not None and deadline.expired():
+                if self.verbose:
+                    print(f"[Gen {gen}] Time budget exhausted.")
+                break
+            population = store.rows
+            fitness_scores = store.fitness
+            fitness_scores[:] = self.calculate_population_fitness(population)
+            order = store.ranking()
 
-            if fitness_scores[0] < best_fitness:
-                best_fitness = fitness_scores[0]
-                best_solution = population[0][:]
+            if fitness_scores[order[0]] < best_fitness:
+                best_fitness = fitness_scores[order[0]]
+                best_solution = population[order[0]][:]
                 stagnation = 0
+                if incumbent is not None:
+                    # Renkler 1..k aralığında kaldığı için fitness = çatışma sayısı
+                    incumbent.offer(best_solution, best_fitness)
             else:
                 stagnation += 1
 
@@ -137,18 +176,28 @@ class HybridGA:
                 mutation_rate = self.base_mutation_rate
 
             # Elitizm
-            elite_count = int(self.population_size * self.elite_ratio)
-            new_population = [ind[:] for ind in population[:elite_count]]
+            elite_count = int(size * self.elite_ratio)
+            new_population = store.next_rows
+            for slot in range(elite_count):
+                new_population[slot][:] = population[order[slot]]
 
             # Hibrit üretim: GA + SA
-            while len(new_population) < self.population_size:
-                # Gelişmiş turnuva seçimi
-                parent1 = min(random.sample(list(zip(population, fitness_scores)), self.tournament_size), key=lambda x: x[1])[0]
-                parent2 = min(random.sample(list(zip(population, fitness_scores)), self.tournament_size), key=lambda x: x[1])[0]
+            # Gelişmiş turnuva seçimi: tüm turnuvalar fitness vektörü üzerinden tek seferde çekilir
+            parents = iter(tournament_indices(fitness_scores, 2 * (size - elite_count), self.tournament_size))
+            slot = elite_count
+            while slot < size:
+                if deadline is not None and deadline.expired():
+                    # Kalan bireyler mevcut popülasyondan kopyalanır
+                    for rest in range(slot, size):
+                        new_population[rest][:] = population[order[rest]]
+                    break
+                parent1 = population[next(parents)]
+                parent2 = population[next(parents)]
+                child = new_population[slot]
                 if random.random() < self.crossover_rate:
-                    child = self.conflict_aware_crossover(parent1, parent2)
+                    self.crossover(parent1, parent2, out=child)
                 else:
-                    child = parent1[:]
+                    child[:] = parent1
                 # Seçilen mutasyon stratejisine göre uygula
                 if mutation_strategy == 'classic':
                     child = self.classic_mutation(child, mutation_rate)
@@ -158,11 +207,14 @@ class HybridGA:
                     child = self.inversion_mutation(child, mutation_rate)
                 else:
                     child = self.classic_mutation(child, mutation_rate)
-                # Simulated Annealing ile lokal arama
-                child, child_fitness = self.simulated_annealing(child, self.calculate_fitness(child))
-                new_population.append(child)
+                slot += 1
 
-            population = new_population[:self.population_size]
+            # Simulated Annealing ile lokal arama: neslin tüm çocukları tek çağrıda, yerinde.
+            # Çocukların enerjisi bir sonraki nesilde zaten hesaplandığından burada taranmaz.
+            self.annealer.anneal_many(new_population[elite_count:slot], 1, initial_temp=self.temperature,
+                                      track_energy=False)
+
+            store.swap()
             self.temperature *= self.cooling_rate
 
             # Gerçek zamanlı terminal çıktısı
@@ -171,9 +223,39 @@ class HybridGA:
             if best_fitness == 0:
                 print(f"[Gen {gen}] Valid coloring found!")
                 break
+            if best_fitness <= target:
+                break
 
+        if self.verbose:
+            stats = self.fitness_cache.stats()
+            print(f"Fitness cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.1%} hit rate)")
         return best_solution, best_fitness
 
+def solve(adj_list, k, time_budget=None, target=0, deadline=None, incumbent=None,
+          mutation_strategy='classic', **kwargs):
+    """
+    Anytime entry point of HybridGA: runs until the target, the time budget or
+    the generation limit (kwargs['generations'], default: none).
+
+    Args:
+        adj_list (dict): The adjacency list of the graph (vertices 0..n-1).
+        k (int): The number of available colors.
+        time_budget (float): Wall-clock limit in seconds (ignored if deadline is given).
+        target (int): Stop once the best solution has at most this many conflicts.
+        deadline (Deadline): Shared budget; cancel() stops the run from another thread.
+        incumbent (Incumbent): Receives every improvement while the run is going.
+        **kwargs: Further HybridGA arguments (population_size, generations, verbose).
+
+    Returns:
+        dict: See anytime.solve_result.
+    """
+    deadline = deadline if deadline is not None else Deadline(time_budget)
+    incumbent = incumbent if incumbent is not None else Incumbent(max_colors=k)
+    kwargs.setdefault('generations', None)
+    ga = HybridGA(adj_list, len(adj_list), k, **kwargs)
+    ga.run(mutation_strategy, deadline=deadline, incumbent=incumbent, target=target)
+    return solve_result(incumbent, deadline, target)
+
 # Örnek kullanım:
 if __name__ == "__main__":
     num_vertices, num_edges, adj_list = load_graph('gc_50_9.txt')
@@ -4,9 +4,17 @@ TRUE K-COLORING Algorithm
 This enforces the k-color constraint DURING the GA process, not just at validation.
 """
 
+import os
 import random
+import sys
 from graph_loader import load_graph
 from heuristics import dsatur_coloring, welsh_powell_coloring, smallest_last_coloring
+from chromatic_search import minimize_colors
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "PV4", "src"))
+from selection import tournament_indices
+from anytime import Deadline, Incumbent, solve_result
+from population_store import PopulationStore
 
 def calculate_fitness_k_coloring(chromosome, adj_list, k):
     """
@@ -26,18 +34,24 @@ def calculate_fitness_k_coloring(chromosome, adj_list, k):
     
     return conflicts + color_penalty
 
-def enforce_k_constraint(chromosome, k):
+def enforce_k_constraint(chromosome, k, out=None):
     """
     Force chromosome to use only colors 1 to k
+    (written into out when given, which may be the chromosome itself)
     """
-    return [(color - 1) % k + 1 for color in chromosome]
+    if out is None:
+        return [(color - 1) % k + 1 for color in chromosome]
+    for i, color in enumerate(chromosome):
+        out[i] = (color - 1) % k + 1
+    return out
 
-def k_coloring_crossover(parent1, parent2, adj_list, k):
+def k_coloring_crossover(parent1, parent2, adj_list, k, out=None):
     """
     K-coloring aware crossover
+    (the child is written into out when given)
     """
     num_vertices = len(parent1)
-    child = [0] * num_vertices
+    child = [0] * num_vertices if out is None else out
     
     for vertex in range(num_vertices):
         # Choose color from parent that causes fewer conflicts
@@ -61,21 +75,24 @@ def k_coloring_crossover(parent1, parent2, adj_list, k):
     
     return child
 
-def k_coloring_mutation(chromosome, k, mutation_rate=0.15):
+def k_coloring_mutation(chromosome, k, mutation_rate=0.15, in_place=False):
     """
     Mutation that respects k constraint
     """
-    mutated = chromosome[:]
+    mutated = chromosome if in_place else chromosome[:]
     for i in range(len(mutated)):
         if random.random() < mutation_rate:
             mutated[i] = random.randint(1, k)
     return mutated
 
-def smart_k_coloring_initialization(adj_list, num_vertices, k, population_size=100):
+def smart_k_coloring_initialization(adj_list, num_vertices, k, population_size=100, initial=None):
     """
-    Smart population initialization for k-coloring
+    Smart population initialization for k-coloring.
+    An initial k-coloring (warm start) is kept as the first individual.
     """
     population = []
+    if initial is not None:
+        population.append(enforce_k_constraint(list(initial), k))
     
     # Try to get a good base solution from heuristics
     try:
@@ -95,9 +112,12 @@ def smart_k_coloring_initialization(adj_list, num_vertices, k, population_size=1
     
     return population
 
-def run_true_k_coloring_ga(adj_list, num_vertices, k, max_generations=500, verbose=True):
+def run_true_k_coloring_ga(adj_list, num_vertices, k, max_generations=500, verbose=True,
+                           initial=None, deadline=None, incumbent=None):
     """
-    Genetic Algorithm specifically designed for k-coloring
+    Genetic Algorithm specifically designed for k-coloring.
+    initial warm-starts the population, the deadline is checked every generation
+    and every improvement is offered to the incumbent.
     """
     if verbose:
         print(f"\n🎯 TRUE K-COLORING GA for k={k}")
@@ -111,32 +131,40 @@ def run_true_k_coloring_ga(adj_list, num_vertices, k, max_generations=500, verbo
     elite_size = int(population_size * 0.1)
     
     # Initialize population
-    population = smart_k_coloring_initialization(adj_list, num_vertices, k, population_size)
+    population = smart_k_coloring_initialization(adj_list, num_vertices, k, population_size, initial)
+    # Double-buffered population: children are written in place into the rows of the
+    # next buffer and the buffers swap every generation
+    store = PopulationStore(population_size, num_vertices)
+    store.load(population)
     
     best_solution = None
     best_fitness = float('inf')
     stagnation = 0
     
     for generation in range(max_generations):
+        if deadline is not None and deadline.expired():
+            if verbose:
+                print(f"⏰ Time budget exhausted at generation {generation}")
+            break
         # Evaluate fitness
-        fitness_scores = []
-        for chromo in population:
+        population = store.rows
+        fitness_scores = store.fitness
+        for i, chromo in enumerate(population):
             # Enforce k constraint
-            chromo = enforce_k_constraint(chromo, k)
-            fitness = calculate_fitness_k_coloring(chromo, adj_list, k)
-            fitness_scores.append(fitness)
+            enforce_k_constraint(chromo, k, out=chromo)
+            fitness_scores[i] = calculate_fitness_k_coloring(chromo, adj_list, k)
         
-        # Sort by fitness
-        sorted_pop = sorted(zip(population, fitness_scores), key=lambda x: x[1])
-        population = [item[0] for item in sorted_pop]
-        fitness_scores = [item[1] for item in sorted_pop]
+        # Rank by fitness (indices sorted in place, rows stay where they are)
+        order = store.ranking()
         
         # Track best solution
-        current_best = fitness_scores[0]
+        current_best = fitness_scores[order[0]]
         if current_best < best_fitness:
             best_fitness = current_best
-            best_solution = population[0][:]
+            best_solution = population[order[0]][:]
             stagnation = 0
+            if incumbent is not None:
+                incumbent.offer(best_solution, best_fitness)
             if verbose and generation % 20 == 0:
                 colors_used = len(set(best_solution))
                 print(f"Generation {generation}: fitness={best_fitness}, colors_used={colors_used}")
@@ -158,34 +186,33 @@ def run_true_k_coloring_ga(adj_list, num_vertices, k, max_generations=500, verbo
             break
         
         # Create new generation
-        new_population = []
+        new_population = store.next_rows
         
         # Elitism
-        new_population.extend([enforce_k_constraint(ind[:], k) for ind in population[:elite_size]])
+        for i in range(elite_size):
+            enforce_k_constraint(population[order[i]], k, out=new_population[i])
         
         # Crossover and mutation
-        while len(new_population) < population_size:
-            # Tournament selection
-            parent1 = min(random.sample(list(zip(population, fitness_scores)), tournament_size), 
-                         key=lambda x: x[1])[0]
-            parent2 = min(random.sample(list(zip(population, fitness_scores)), tournament_size), 
-                         key=lambda x: x[1])[0]
+        # Tournament selection: all tournaments of the generation drawn at once from the fitness vector
+        parents = iter(tournament_indices(fitness_scores, 2 * (population_size - elite_size), tournament_size))
+        for slot in range(elite_size, population_size):
+            parent1 = population[next(parents)]
+            parent2 = population[next(parents)]
+            child = new_population[slot]
             
             # Crossover
             if random.random() < crossover_rate:
-                child = k_coloring_crossover(parent1, parent2, adj_list, k)
+                k_coloring_crossover(parent1, parent2, adj_list, k, out=child)
             else:
-                child = parent1[:]
+                child[:] = parent1
             
             # Mutation
-            child = k_coloring_mutation(child, k, mutation_rate)
+            k_coloring_mutation(child, k, mutation_rate, in_place=True)
             
             # Ensure k constraint
-            child = enforce_k_constraint(child, k)
-            
-            new_population.append(child)
+            enforce_k_constraint(child, k, out=child)
         
-        population = new_population[:population_size]
+        store.swap()
     
     # Final validation
     if best_solution:
@@ -203,7 +230,21 @@ def run_true_k_coloring_ga(adj_list, num_vertices, k, max_generations=500, verbo
     
     return None
 
-def test_true_k_coloring():
+def solve_true_k_coloring(adj_list, k, time_budget=None, target=0, deadline=None, incumbent=None,
+                          initial=None, max_generations=500):
+    """
+    Anytime entry point of the true k-coloring GA (common solver protocol).
+
+    Returns:
+        dict: See anytime.solve_result.
+    """
+    deadline = deadline if deadline is not None else Deadline(time_budget)
+    incumbent = incumbent if incumbent is not None else Incumbent(max_colors=k)
+    run_true_k_coloring_ga(adj_list, len(adj_list), k, max_generations=max_generations, verbose=False,
+                           initial=initial, deadline=deadline, incumbent=incumbent)
+    return solve_result(incumbent, deadline, target)
+
+def test_true_k_coloring(time_budget=60.0):
     """
     Test the true k-coloring algorithm on gc_50_9.txt
     """
@@ -221,33 +262,17 @@ def test_true_k_coloring():
     # Test our true k-coloring algorithm
     print(f"\n🎯 Testing True K-Coloring Algorithm...")
     
-    # Try to improve upon DSatur
-    for k_target in range(k_dsatur - 1, max(k_dsatur - 5, 1), -1):
-        print(f"\n--- Attempting k={k_target} ---")
-        
-        solution = run_true_k_coloring_ga(graph, num_vertices, k_target, max_generations=300, verbose=True)
-        
-        if solution:
-            actual_colors = len(set(solution))
-            conflicts = sum(1 for u in graph for v in graph[u] 
-                          if u < v and solution[u] == solution[v])
-            
-            print(f"🎉 SUCCESS! Found valid {k_target}-coloring")
-            print(f"   Uses {actual_colors} distinct colors")
-            print(f"   Conflicts: {conflicts}")
-            
-            # Verify it's truly valid
-            if conflicts == 0 and actual_colors <= k_target:
-                print(f"✅ VERIFIED: True {k_target}-coloring achieved!")
-                return k_target
-            else:
-                print(f"❌ VERIFICATION FAILED")
-        else:
-            print(f"❌ Failed to find {k_target}-coloring")
-            break
-    
-    print(f"\n📊 CONCLUSION: Could not improve upon DSatur's {k_dsatur} colors")
-    return k_dsatur
+    # k-descent from DSatur: every attempt is warm-started from the last valid coloring
+    result = minimize_colors(graph, time_budget=time_budget, solver=solve_true_k_coloring)
+    solution = result["coloring"]
+    conflicts = sum(1 for u in graph for v in graph[u]
+                    if u < v and solution[u] == solution[v])
+
+    if result["k"] < k_dsatur and conflicts == 0:
+        print(f"✅ VERIFIED: True {result['k']}-coloring achieved!")
+    else:
+        print(f"\n📊 CONCLUSION: Could not improve upon DSatur's {k_dsatur} colors")
+    return result["k"]
 
 if __name__ == "__main__":
     test_true_k_coloring() 
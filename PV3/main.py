@@ -3,26 +3,24 @@ import csv
 
 from graph_loader import load_graph
 from heuristics import dsatur_coloring, welsh_powell_coloring, smallest_last_coloring, get_diverse_initial_solutions
-from genetic_algorithm import run_multistart_enhanced_algorithm, calculate_fitness
+from genetic_algorithm import solve_enhanced_memetic, calculate_fitness
+from chromatic_search import minimize_colors
 
-def find_best_coloring(graph, num_vertices, start_k, algorithm_func, verbose_name):
-    """Helper function to iteratively find the best k for a given algorithm."""
-    final_k = start_k
-    k_to_try = start_k - 1
-    
-    while k_to_try > 0:  # Prevent trying 0 colors
-        print(f"\n[{verbose_name}] Attempting to find a solution with {k_to_try} colors...")
-        # verbose=True to show step-by-step progress
-        solution = algorithm_func(graph, num_vertices, k_to_try, verbose=True) 
-        
-        if solution and calculate_fitness(solution, graph) == 0:
-            final_k = k_to_try
-            print(f"[{verbose_name}] Success! Found a valid coloring with {final_k} colors.")
-            k_to_try -= 1
-        else:
-            print(f"[{verbose_name}] Failed to find a better solution. Best is {final_k} colors.")
-            break
-    return final_k
+def find_best_coloring(graph, initial, solver, verbose_name, time_budget=120.0):
+    """
+    Finds the best k for a given algorithm within a time budget.
+
+    The search starts from the heuristic coloring and steps k down; every
+    attempt is warm-started from the last valid coloring (see chromatic_search).
+
+    Returns:
+        dict: The minimize_colors result (k, coloring, lower_bound, ...).
+    """
+    print(f"\n[{verbose_name}] Searching for the smallest k ({time_budget:.0f}s budget)...")
+    result = minimize_colors(graph, time_budget=time_budget, solver=solver, initial=initial)
+    if calculate_fitness(result["coloring"], graph) == 0:
+        print(f"[{verbose_name}] Best is {result['k']} colors (lower bound {result['lower_bound']}).")
+    return result
 
 def test_all_heuristics(graph):
     """Test all available heuristics and return the best result as starting point."""
@@ -36,16 +34,18 @@ def test_all_heuristics(graph):
     
     best_k = float('inf')
     best_name = ""
+    best_coloring = None
     
     for name, func in heuristics:
-        k, _ = func(graph)
+        k, coloring = func(graph)
         print(f"{name}: {k} colors")
         if k < best_k:
             best_k = k
             best_name = name
+            best_coloring = coloring
     
     print(f"\nBest heuristic: {best_name} with {best_k} colors")
-    return best_k
+    return best_k, best_coloring
 
 def main():
     """
@@ -75,18 +75,19 @@ def main():
         print(f"Graph loaded: {num_vertices} vertices, {num_edges} edges.")
         
         # Test all heuristics first
-        best_heuristic_k = test_all_heuristics(graph)
+        best_heuristic_k, best_heuristic_coloring = test_all_heuristics(graph)
         
-        # Run the advanced hybrid algorithm with multistart
-        print(f"\n=== Running Advanced Hybrid Algorithm (MULTISTART) ===")
-        final_k = find_best_coloring(graph, num_vertices, best_heuristic_k, run_multistart_enhanced_algorithm, "MULTISTART Hybrid MA")
+        # Run the advanced hybrid algorithm, warm-started k-descent from the best heuristic
+        print(f"\n=== Running Advanced Hybrid Algorithm (k-descent) ===")
+        search = find_best_coloring(graph, best_heuristic_coloring, solve_enhanced_memetic, "Hybrid MA")
 
         results.append({
             'File': file_name,
             'Vertices': num_vertices,
             'Edges': num_edges,
+            'Clique Bound (k)': search['lower_bound'],
             'Best Heuristic (k)': best_heuristic_k,
-                         'MULTISTART Hybrid MA (k)': final_k
+            'Hybrid MA (k)': search['k']
         })
 
     if results:
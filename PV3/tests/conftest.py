@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+PV3_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PV3_DIR)
+# The shared engines, as the PV3 modules import them
+sys.path.insert(0, os.path.join(os.path.dirname(PV3_DIR), "PV4", "src"))
+
+
+def _count_conflicts(adj_list, coloring):
+    return sum(1 for u, neighbors in adj_list.items() for v in neighbors
+               if u < v and coloring[u] == coloring[v])
+
+
+@pytest.fixture
+def random_adj_list(random_edges):
+    """{vertex: neighbors} graphs on 0..n-1 built from the shared random_edges."""
+    def build(n, p, seed, colors=None):
+        adj_list = {v: [] for v in range(n)}
+        for u, v in random_edges(n, p, seed, colors):
+            adj_list[u].append(v)
+            adj_list[v].append(u)
+        return adj_list
+    return build
+
+
+@pytest.fixture
+def count_conflicts():
+    return _count_conflicts
@@ -0,0 +1,48 @@
+import random
+
+from anytime import Deadline
+from chromatic_search import minimize_colors, tabucol_solve
+
+
+def test_tabucol_solve_finds_a_planted_coloring(random_adj_list, count_conflicts):
+    adj_list = random_adj_list(40, 0.3, seed=50, colors=4)
+    random.seed(51)
+    result = tabucol_solve(adj_list, 4, time_budget=10, max_iterations=20000)
+    assert result["status"] == "target" and result["valid"]
+    coloring = result["coloring"]
+    assert all(1 <= c <= 4 for c in coloring)
+    assert count_conflicts(adj_list, coloring) == 0
+
+
+def test_tabucol_solve_reports_its_best_when_stopped(random_adj_list, count_conflicts):
+    adj_list = random_adj_list(40, 0.5, seed=52)
+    deadline = Deadline()
+    deadline.cancel()
+    result = tabucol_solve(adj_list, 3, deadline=deadline)
+    assert result["status"] == "cancelled"
+    assert result["conflicts"] == count_conflicts(adj_list, result["coloring"]) > 0
+
+
+def test_minimize_colors_returns_a_valid_coloring(random_adj_list, count_conflicts):
+    adj_list = random_adj_list(30, 0.3, seed=53)
+    random.seed(54)
+    result = minimize_colors(adj_list, time_budget=3, verbose=False, clique_budget=0.5)
+    coloring = result["coloring"]
+    assert count_conflicts(adj_list, coloring) == 0
+    assert len(set(coloring)) == result["k"]
+    assert result["lower_bound"] <= result["k"] <= result["upper_bound"]
+
+
+def test_minimize_colors_stops_without_a_time_budget(random_adj_list):
+    adj_list = random_adj_list(30, 0.3, seed=55)
+    calls = []
+
+    def never_valid(adj_list, k, deadline=None, incumbent=None, initial=None):
+        calls.append(k)
+        return {"status": "finished", "valid": False, "coloring": initial, "conflicts": 1, "elapsed": 0.0}
+
+    result = minimize_colors(adj_list, time_budget=None, solver=never_valid, verbose=False,
+                             clique_budget=0.5, max_failures=3)
+    assert calls == [result["upper_bound"] - 1] * 3
+    assert result["k"] == result["upper_bound"]
+    assert all(attempt["budget"] is None for attempt in result["attempts"])
@@ -0,0 +1,37 @@
+import random
+
+from genetic_algorithm.kempe import KempeChainEngine
+
+
+def test_chain_swap_delta_matches_a_recount(random_adj_list, count_conflicts):
+    adj_list = random_adj_list(40, 0.2, seed=40)
+    rng = random.Random(41)
+    engine = KempeChainEngine(adj_list, 40)
+    chromosome = [rng.randrange(4) for _ in range(40)]
+    engine.load(chromosome)
+    assert engine.conflicts == count_conflicts(adj_list, chromosome)
+    for _ in range(100):
+        color1, color2 = rng.sample(range(4), 2)
+        start = rng.randrange(40)
+        if chromosome[start] not in (color1, color2):
+            continue
+        stamp = engine._new_stamp()
+        component = engine.chain(start, color1, color2, stamp, stamp)
+        assert all(chromosome[v] in (color1, color2) for v in component)
+        delta = engine.swap_delta(component, color1, color2, stamp)
+        before = count_conflicts(adj_list, chromosome)
+        engine.swap(component, color1, color2, delta)
+        assert count_conflicts(adj_list, chromosome) == before + delta == engine.conflicts
+        for color in range(4):
+            assert engine.color_classes.get(color, set()) == {v for v in range(40) if chromosome[v] == color}
+
+
+def test_search_never_worsens(random_adj_list, count_conflicts):
+    adj_list = random_adj_list(50, 0.15, seed=42, colors=4)
+    random.seed(43)
+    engine = KempeChainEngine(adj_list, 50)
+    chromosome = [random.randrange(5) for _ in range(50)]
+    before = count_conflicts(adj_list, chromosome)
+    result = engine.search(chromosome, max_attempts=30)
+    assert result is chromosome
+    assert engine.conflicts == count_conflicts(adj_list, chromosome) <= before
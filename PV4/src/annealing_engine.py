@@ -0,0 +1,182 @@
+import math
+import random
+
+MOVES = ("recolor", "swap")
+
+
+class SimulatedAnnealing:
+    """
+    Simulated annealing local search on the conflict count of a coloring.
+
+    A move either recolors one vertex ('recolor') or exchanges the colors of two
+    vertices ('swap'); its energy change only involves the neighborhoods of the
+    moved vertices, so it is scored in O(deg) without rescoring the chromosome.
+    The temperature of every step follows a geometric cooling schedule that is
+    precomputed together with the Metropolis base exp(-weight / T) of the step;
+    a worse move of delta d is accepted with probability base ** d. When
+    reheat_after consecutive moves are rejected, the schedule restarts from the
+    initial temperature.
+    """
+    def __init__(self, neighbors, num_colors=None, move="recolor", initial_temp=1.0, cooling_rate=0.95,
+                 min_temp=0.0, reheat_after=None, weight=1.0, first_color=0, rng=random):
+        """
+        Args:
+            neighbors (list): neighbors[v] lists the neighbors of vertex v (0..n-1).
+            num_colors (int): Colors first_color..first_color + k - 1 of the 'recolor' move.
+            move (str): One of MOVES.
+            initial_temp (float): Temperature of the first step.
+            cooling_rate (float): Factor applied to the temperature after every step.
+            min_temp (float): Lower bound of the temperature.
+            reheat_after (int): Consecutive rejections that restart the schedule (None: never).
+            weight (float): Energy of one conflict (e.g. the conflict penalty of a fitness).
+            first_color (int): Label of the first color (1 for 1-based chromosomes).
+            rng: random.Random-compatible generator.
+        """
+        if move not in MOVES:
+            raise ValueError(f"Unknown annealing move '{move}', expected one of {MOVES}.")
+        if move == "recolor" and not num_colors:
+            raise ValueError("The 'recolor' move needs num_colors.")
+        self.neighbors = neighbors
+        self.num_colors = num_colors
+        self.move = move
+        self.initial_temp = initial_temp
+        self.cooling_rate = cooling_rate
+        self.min_temp = min_temp
+        self.reheat_after = reheat_after
+        self.weight = weight
+        self.first_color = first_color
+        self.rng = rng
+        self._schedule_key = None
+        self._bases = []
+
+    def energy(self, chromosome):
+        """Number of conflicting edges, O(n + m)."""
+        conflicts = 0
+        for v, row in enumerate(self.neighbors):
+            color = chromosome[v]
+            for u in row:
+                if v < u and color == chromosome[u]:
+                    conflicts += 1
+        return conflicts
+
+    def schedule(self, steps, initial_temp=None):
+        """
+        Metropolis bases exp(-weight / T) of the first `steps` temperatures,
+        cached for the last (initial_temp, steps) pair.
+        """
+        initial_temp = self.initial_temp if initial_temp is None else initial_temp
+        key = (initial_temp, steps)
+        if key != self._schedule_key:
+            bases = []
+            temp = initial_temp
+            for _ in range(steps):
+                temp = max(temp, self.min_temp)
+                bases.append(math.exp(-self.weight / temp) if temp > 0 else 0.0)
+                temp *= self.cooling_rate
+            self._schedule_key, self._bases = key, bases
+        return self._bases
+
+    def _recolor_move(self, chromosome):
+        """Random (vertex, new color) pair and its conflict delta."""
+        v = self.rng.randrange(len(chromosome))
+        new = self.first_color + self.rng.randrange(self.num_colors)
+        old = chromosome[v]
+        delta = 0
+        if new != old:
+            for u in self.neighbors[v]:
+                color = chromosome[u]
+                if color == new:
+                    delta += 1
+                elif color == old:
+                    delta -= 1
+        return v, new, delta
+
+    def _swap_delta(self, chromosome, i, j):
+        """Conflict delta of exchanging the colors of i and j."""
+        a, b = chromosome[i], chromosome[j]
+        if a == b:
+            return 0
+        delta = 0
+        for u in self.neighbors[i]:
+            color = chromosome[u]
+            if u == j:
+                continue
+            if color == b:
+                delta += 1
+            elif color == a:
+                delta -= 1
+        for u in self.neighbors[j]:
+            color = chromosome[u]
+            if u == i:
+                continue
+            if color == a:
+                delta += 1
+            elif color == b:
+                delta -= 1
+        return delta
+
+    def anneal(self, chromosome, steps, energy=None, initial_temp=None, track_energy=True):
+        """
+        Anneals a chromosome in place.
+
+        Args:
+            chromosome (list): The coloring, modified in place.
+            steps (int): Number of moves.
+            energy (int): Its known conflict count (computed if None).
+            initial_temp (float): Overrides the initial temperature of this call.
+            track_energy (bool): False only applies the moves: the O(n + m) scan
+                of an unknown energy is skipped and None is returned.
+
+        Returns:
+            int: The conflict count of the final chromosome (None if not tracked).
+        """
+        if not track_energy:
+            energy = 0
+        elif energy is None:
+            energy = self.energy(chromosome)
+        if steps <= 0 or len(chromosome) < 2:
+            return energy if track_energy else None
+        bases = self.schedule(steps, initial_temp)
+        rng = self.rng
+        n = len(chromosome)
+        swap = self.move == "swap"
+        step = 0
+        rejected = 0
+        for _ in range(steps):
+            if swap:
+                i, j = rng.sample(range(n), 2)
+                delta = self._swap_delta(chromosome, i, j)
+            else:
+                v, color, delta = self._recolor_move(chromosome)
+            if delta <= 0 or rng.random() < bases[step] ** delta:
+                if swap:
+                    chromosome[i], chromosome[j] = chromosome[j], chromosome[i]
+                else:
+                    chromosome[v] = color
+                energy += delta
+                rejected = 0
+            else:
+                rejected += 1
+            step += 1
+            if self.reheat_after is not None and rejected >= self.reheat_after:
+                step = rejected = 0
+        return energy if track_energy else None
+
+    def anneal_many(self, chromosomes, steps, energies=None, initial_temp=None, track_energy=True):
+        """
+        Batched mode: anneals every chromosome in place with one shared schedule.
+
+        Args:
+            chromosomes (list): The offspring of a generation.
+            steps (int): Number of moves per chromosome.
+            energies (list): Their known conflict counts (computed if None).
+            initial_temp (float): Overrides the initial temperature of this call.
+            track_energy (bool): False only applies the moves (see anneal).
+
+        Returns:
+            list: The final conflict count of every chromosome (None if not tracked).
+        """
+        if energies is None:
+            energies = [None] * len(chromosomes)
+        return [self.anneal(chromosome, steps, energy, initial_temp, track_energy)
+                for chromosome, energy in zip(chromosomes, energies)]
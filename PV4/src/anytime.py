@@ -0,0 +1,155 @@
+import threading
+import time
+
+STATUSES = ("target", "timeout", "cancelled", "infeasible", "finished")
+
+
+class Deadline:
+    """
+    Wall-clock budget with cooperative cancellation.
+
+    Solvers poll expired() in their hot loops and return their incumbent as
+    soon as it is True: once time_budget seconds have passed, or after
+    cancel() was called (from any thread). A deadline with a parent also
+    expires with its parent, e.g. a per-attempt budget inside a global one.
+    """
+    def __init__(self, time_budget=None, parent=None):
+        """
+        Args:
+            time_budget (float): Seconds from now; None means no time limit.
+            parent (Deadline): Enclosing budget; its end caps this one.
+        """
+        self.start = time.perf_counter()
+        self.end = None if time_budget is None else self.start + time_budget
+        self.parent = parent
+        if parent is not None and parent.end is not None:
+            self.end = parent.end if self.end is None else min(self.end, parent.end)
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Asks every solver polling this deadline to stop."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set() or (self.parent is not None and self.parent.cancelled)
+
+    def expired(self):
+        """True when the budget is used up or the run was cancelled."""
+        if self.cancelled:
+            return True
+        return self.end is not None and time.perf_counter() >= self.end
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def remaining(self):
+        """Seconds left (infinite without a time limit)."""
+        if self.end is None:
+            return float('inf')
+        return max(0.0, self.end - time.perf_counter())
+
+
+class Incumbent:
+    """
+    Best coloring found so far by a solver.
+
+    Solutions are ranked by (conflicts, colors used); with max_colors set,
+    colorings that use more colors rank after all colorings that fit. The
+    incumbent can be read from another thread at any moment while the solver
+    is running.
+    """
+    def __init__(self, on_improvement=None, max_colors=None):
+        """
+        Args:
+            on_improvement (callable): Called with the incumbent after every improvement.
+            max_colors (int): The k of the run, if colorings above k are possible.
+        """
+        self.max_colors = max_colors
+        self.coloring = None
+        self.conflicts = float('inf')
+        self.colors_used = float('inf')
+        self.found_at = None
+        self.on_improvement = on_improvement
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    def offer(self, coloring, conflicts, colors_used=None):
+        """
+        Proposes a coloring; it is copied and kept when it beats the incumbent.
+
+        Args:
+            coloring (list or dict): The coloring, in the representation of the solver.
+            conflicts (int): Number of conflicting edges of the coloring.
+            colors_used (int): Number of distinct colors (computed when omitted).
+
+        Returns:
+            bool: Whether the coloring became the new incumbent.
+        """
+        if colors_used is None:
+            colors_used = len(set(coloring.values() if isinstance(coloring, dict) else coloring))
+        with self._lock:
+            if self._rank(conflicts, colors_used) >= self._rank(self.conflicts, self.colors_used):
+                return False
+            self.coloring = dict(coloring) if isinstance(coloring, dict) else list(coloring)
+            self.conflicts = conflicts
+            self.colors_used = colors_used
+            self.found_at = time.perf_counter() - self._start
+        if self.on_improvement is not None:
+            self.on_improvement(self)
+        return True
+
+    def _rank(self, conflicts, colors_used):
+        over_k = self.max_colors is not None and colors_used > self.max_colors
+        return over_k, conflicts, colors_used
+
+    def snapshot(self):
+        """
+        Returns:
+            tuple: (coloring, conflicts, colors_used) of the current incumbent.
+        """
+        with self._lock:
+            coloring = self.coloring
+            if coloring is not None:
+                coloring = dict(coloring) if isinstance(coloring, dict) else list(coloring)
+            return coloring, self.conflicts, self.colors_used
+
+
+def solve_result(incumbent, deadline, target=0, infeasible=False):
+    """
+    Builds the result dict shared by all solve() entry points.
+
+    Args:
+        incumbent (Incumbent): The best solution of the run.
+        deadline (Deadline): The budget of the run.
+        target (int): Conflict count at which the run was allowed to stop.
+        infeasible (bool): An exact solver exhausted its search space, i.e.
+            proved that no solution exists.
+
+    Returns:
+        dict: coloring, conflicts, colors_used, valid, elapsed, found_at and
+        status (one of STATUSES).
+    """
+    coloring, conflicts, colors_used = incumbent.snapshot()
+    max_colors = incumbent.max_colors
+    fits = coloring is not None and (max_colors is None or colors_used <= max_colors)
+    if fits and conflicts <= target:
+        status = "target"
+    elif deadline.cancelled:
+        status = "cancelled"
+    elif infeasible:
+        status = "infeasible"
+    elif deadline.expired():
+        status = "timeout"
+    else:
+        # The solver ran out of generations/iterations
+        status = "finished"
+    return {
+        "coloring": coloring,
+        "conflicts": conflicts if coloring is not None else None,
+        "colors_used": colors_used if coloring is not None else None,
+        "valid": fits and conflicts == 0,
+        "elapsed": deadline.elapsed(),
+        "found_at": incumbent.found_at,
+        "status": status
+    }
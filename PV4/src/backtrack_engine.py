@@ -0,0 +1,113 @@
+from domain_store import DomainStore
+
+
+class KColoringSearch:
+    """
+    Iterative exact search for a proper k-coloring.
+
+    The search runs on an explicit stack (no recursion limit) over the bitset
+    DomainStore, so every assignment is forward checked and singleton domains
+    are propagated. The next vertex is the uncolored one with the fewest
+    remaining colors (MRV, i.e. DSATUR's highest saturation), ties broken by
+    degree. Colors are interchangeable until used, so a vertex may only take
+    the used colors or the next unused one (symmetry breaking).
+
+    The number of search nodes is kept in self.nodes while the search runs
+    and passed to on_progress every progress_interval nodes.
+    """
+    def __init__(self, masks, k, precolored=None, node_limit=None, deadline=None,
+                 on_progress=None, progress_interval=10000):
+        """
+        Args:
+            masks (list): masks[v] is the neighbor bitset of vertex v (0..n-1),
+                e.g. CSRGraph.build_bitmatrix().
+            k (int): The number of colors (0..k-1).
+            precolored (dict): Fixed colors {vertex: color} of some vertices.
+            node_limit (int): Maximum number of search nodes (None: unlimited).
+            deadline (Deadline): Checked every 256 nodes.
+            on_progress (callable): Called with the search every progress_interval nodes.
+            progress_interval (int): Nodes between two on_progress calls.
+        """
+        self.masks = masks
+        self.k = k
+        self.precolored = precolored or {}
+        self.node_limit = node_limit
+        self.deadline = deadline
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self.degrees = [mask.bit_count() for mask in masks]
+        self.nodes = 0
+        self.exhausted = False
+        self.store = None
+
+    def _select(self, store):
+        """Uncolored vertex with the smallest domain, the highest degree on ties."""
+        domains = store.domains
+        degrees = self.degrees
+        best, best_key = -1, None
+        rest = store.uncolored
+        while rest:
+            low = rest & -rest
+            v = low.bit_length() - 1
+            rest ^= low
+            key = (domains[v].bit_count(), -degrees[v])
+            if best_key is None or key < best_key:
+                best, best_key = v, key
+                if key[0] == 1:
+                    break
+        return best
+
+    def _stopped(self):
+        if self.node_limit is not None and self.nodes >= self.node_limit:
+            return True
+        return self.nodes & 255 == 0 and self.deadline is not None and self.deadline.expired()
+
+    def run(self):
+        """
+        Returns:
+            list: The color (0..k-1) of every vertex, or None when there is no
+            k-coloring (self.exhausted is True) or the budget ran out.
+        """
+        k = self.k
+        store = self.store = DomainStore(self.masks, k)
+        self.nodes = 0
+        self.exhausted = False
+        used = 0
+        for vertex, color in self.precolored.items():
+            if not 0 <= color < k or not store.assign(vertex, color):
+                self.exhausted = True
+                return None
+            used = max(used, color + 1)
+        if not store.uncolored:
+            return list(store.colors)
+
+        vertex = self._select(store)
+        # Frame: vertex, colors left to try, trail mark, colors used before the vertex
+        stack = [[vertex, store.domains[vertex] & ((1 << min(used + 1, k)) - 1), store.mark(), used]]
+        while stack:
+            if self._stopped():
+                return None
+            frame = stack[-1]
+            vertex, options, mark, used = frame
+            store.undo(mark)
+            if not options:
+                stack.pop()
+                continue
+            low = options & -options
+            frame[1] = options ^ low
+            color = low.bit_length() - 1
+
+            self.nodes += 1
+            if self.on_progress is not None and self.nodes % self.progress_interval == 0:
+                self.on_progress(self)
+            if not store.assign(vertex, color):
+                continue
+            if not store.uncolored:
+                return list(store.colors)
+
+            used = max(used, color + 1)
+            vertex = self._select(store)
+            stack.append([vertex, store.domains[vertex] & ((1 << min(used + 1, k)) - 1), store.mark(), used])
+
+        self.exhausted = True
+        return None
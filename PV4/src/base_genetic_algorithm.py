@@ -1,11 +1,18 @@
 import random
+from itertools import count
+from anytime import Deadline, Incumbent, solve_result
 from initializers import dsatur_initializer, greedy_initializer
+from evaluation import ConflictEvaluator, ConflictState
+from population_store import PopulationStore
+from selection import SELECTION_METHODS, select_indices, tournament_indices
+from telemetry import RunTelemetry
 
 class GeneticAlgorithm:
     """
     A Genetic Algorithm to solve the Graph Coloring problem.
     """
-    def __init__(self, graph, population_size, num_colors, conflict_penalty=1.0, initializer="random"):
+    def __init__(self, graph, population_size, num_colors, conflict_penalty=1.0, initializer="random",
+                 selection="tournament", tournament_size=3, telemetry=None):
         """
         Initializes the Genetic Algorithm.
 
@@ -15,13 +22,43 @@ class GeneticAlgorithm:
             num_colors (int): The number of available colors (k).
             conflict_penalty (float): The weight for constraint violations (conflicts).
             initializer (str): 'random', 'dsatur', or 'greedy'.
+            selection (str): 'tournament', 'sus', 'rank' or 'truncation'.
+            tournament_size (int): Number of individuals in each tournament.
+            telemetry (RunTelemetry): Receives the per-generation events (default: a
+                telemetry without listeners, which only keeps the timings).
+        """
+        self._init_state(graph, population_size, num_colors, conflict_penalty, initializer,
+                         selection, tournament_size, telemetry)
+        self.population = self._initialize_population()
+
+    def _init_state(self, graph, population_size, num_colors, conflict_penalty=1.0, initializer="random",
+                    selection="tournament", tournament_size=3, telemetry=None):
+        """
+        Sets up everything but the population (see __init__ for the arguments).
+
+        Subclasses that need their own components before the population is
+        built call this instead of __init__, then assign self.population.
         """
+        if selection not in SELECTION_METHODS:
+            raise ValueError(f"Unknown selection method '{selection}', expected one of {SELECTION_METHODS}.")
         self.graph = graph
         self.population_size = population_size
         self.num_colors = num_colors
         self.conflict_penalty = conflict_penalty
         self.initializer = initializer
-        self.population = self._initialize_population()
+        self.selection = selection
+        self.tournament_size = tournament_size
+        self._selection_states = []
+        self._selection_fitness = []
+        self._parent_pool = []
+        self.evaluator = ConflictEvaluator(graph, num_colors)
+        self.telemetry = telemetry if telemetry is not None else RunTelemetry()
+        self.runtime_seconds = 0.0
+        self.deadline = None
+        self._states = {}
+        self.store = PopulationStore(population_size, graph.num_vertices)
+        self._buffer_states = [None, None]
+        self._spare_state = None
 
     def _initialize_population(self):
         """
@@ -66,26 +103,64 @@ class GeneticAlgorithm:
         Calculates the fitness of a given chromosome.
 
         Fitness is defined as: (number of conflicts * penalty) + (number of unique colors).
-        A lower fitness score is better.
-        """
-        conflicts = 0
-        # Iterate over each vertex and its neighbors to find conflicts
-        for vertex, neighbors in self.graph.adj.items():
-            for neighbor in neighbors:
-                # To avoid double counting (e.g., edge 1-2 and 2-1), only check one way
-                if vertex < neighbor and chromosome[vertex] == chromosome[neighbor]:
-                    conflicts += 1
-        
-        # Calculate the number of unique colors used in the chromosome
-        num_unique_colors = len(set(chromosome))
-        
-        # The penalty ensures that conflict-free solutions are always preferred
-        fitness = (conflicts * self.graph.num_vertices) + num_unique_colors
-        return fitness, conflicts
+        A lower fitness score is better. Chromosomes of the current population are
+        answered from the cached evaluation state without rescanning the edges.
+        """
+        state = self._get_state(chromosome)
+        return state.fitness, state.conflicts
+
+    def _get_state(self, chromosome):
+        """
+        Returns the cached ConflictState of a chromosome, evaluating it if needed.
+        """
+        state = self._states.get(id(chromosome))
+        if state is None or state.chromosome is not chromosome:
+            state = self.evaluator.evaluate(chromosome)
+        return state
+
+    def _population_states(self):
+        """
+        Returns the evaluation states of the current population (one per individual).
+
+        States produced during the last generation are reused, so only chromosomes
+        created outside the incremental operators are evaluated from scratch.
+        """
+        states = [self._states.get(id(chromo)) for chromo in self.population]
+        missing = [i for i, state in enumerate(states)
+                   if state is None or state.chromosome is not self.population[i]]
+        # Chromosomes without a cached state are evaluated together in one batch
+        for i, state in zip(missing, self.evaluator.evaluate_many([self.population[i] for i in missing])):
+            states[i] = state
+        self._states = {id(state.chromosome): state for state in states}
+        self._prepare_selection(states)
+        return states
+
+    def _prepare_selection(self, states):
+        """
+        Takes the fitness vector of the population once per generation.
+        Parents are then drawn from it in bulk instead of scoring contestants per call.
+        """
+        self._selection_states = states
+        fitness = self.store.fitness
+        if len(fitness) == len(states):
+            for i, state in enumerate(states):
+                fitness[i] = state.fitness
+        else:
+            fitness = [state.fitness for state in states]
+        self._selection_fitness = fitness
+        self._parent_pool = []
+
+    def _copy_state(self, state):
+        """
+        Copies an evaluation state and caches the copy, e.g. for elitism.
+        """
+        copied = state.copy()
+        self._states[id(copied.chromosome)] = copied
+        return copied
 
-    def _selection(self, tournament_size=3):
+    def _selection(self, tournament_size=None):
         """
-        Tournament selection to choose parents for reproduction.
+        Selection of a parent for reproduction (tournament by default).
         
         Args:
             tournament_size (int): Number of individuals in each tournament.
@@ -93,13 +168,31 @@ class GeneticAlgorithm:
         Returns:
             list: Selected chromosome (parent).
         """
-        # Randomly select tournament_size individuals
-        tournament = random.sample(self.population, tournament_size)
-        
-        # Return the best individual from the tournament
-        return min(tournament, key=lambda c: self._calculate_fitness(c)[0])
+        return self._select_state(tournament_size).chromosome
+
+    def _select_state(self, tournament_size=None):
+        """
+        Selects a parent from the fitness vector of the current generation.
+
+        Parent indices are drawn for a whole generation at once with the configured
+        selection method; a tournament size other than the configured one is
+        served by a single tournament.
+
+        Returns:
+            ConflictState: State of the selected parent.
+        """
+        states = self._selection_states
+        if len(states) != len(self.population) or (states and states[0].chromosome is not self.population[0]):
+            self._population_states()
+        if tournament_size is not None and tournament_size != self.tournament_size:
+            return self._selection_states[tournament_indices(self._selection_fitness, 1, tournament_size)[0]]
+        if not self._parent_pool:
+            self._parent_pool = select_indices(self.selection, self._selection_fitness, self.population_size,
+                                               tournament_size=self.tournament_size)
+            self._parent_pool.reverse()
+        return self._selection_states[self._parent_pool.pop()]
 
-    def _crossover(self, parent1, parent2, crossover_rate=0.8):
+    def _crossover(self, parent1, parent2, crossover_rate=0.8, out=None):
         """
         Single-point crossover between two parents.
         
@@ -107,51 +200,157 @@ class GeneticAlgorithm:
             parent1 (list): First parent chromosome.
             parent2 (list): Second parent chromosome.
             crossover_rate (float): Probability of performing crossover.
+            out (tuple): Two rows overwritten with the offspring (default: new lists).
             
         Returns:
             tuple: Two offspring chromosomes.
         """
+        if out is None:
+            offspring1, offspring2 = parent1[:], parent2[:]
+        else:
+            offspring1, offspring2 = out
+            offspring1[:] = parent1
+            offspring2[:] = parent2
         if random.random() > crossover_rate:
-            return parent1[:], parent2[:]
+            return offspring1, offspring2
         
         # Choose a random crossover point
         crossover_point = random.randint(1, len(parent1) - 1)
         
         # Create offspring by swapping parts
-        offspring1 = parent1[:crossover_point] + parent2[crossover_point:]
-        offspring2 = parent2[:crossover_point] + parent1[crossover_point:]
+        offspring1[crossover_point:] = parent2[crossover_point:]
+        offspring2[crossover_point:] = parent1[crossover_point:]
         
         return offspring1, offspring2
 
-    def _mutation(self, chromosome, mutation_rate=0.1):
+    def _mutation(self, chromosome, mutation_rate=0.1, in_place=False):
         """
         Random mutation of genes in a chromosome.
         
         Args:
             chromosome (list): The chromosome to mutate.
             mutation_rate (float): Probability of mutating each gene.
+            in_place (bool): Mutate the chromosome itself instead of a copy.
             
         Returns:
             list: Mutated chromosome.
         """
-        mutated = chromosome[:]
+        mutated = chromosome if in_place else chromosome[:]
         for i in range(len(mutated)):
             if random.random() < mutation_rate:
                 # Change to a random color (different from current)
-                current_color = mutated[i]
-                new_color = random.randint(0, self.num_colors - 1)
-                while new_color == current_color and self.num_colors > 1:
-                    new_color = random.randint(0, self.num_colors - 1)
-                mutated[i] = new_color
+                mutated[i] = self._random_other_color(mutated[i])
         return mutated
 
-    def run(self, generations=100):
+    def _random_other_color(self, current_color):
+        """
+        Draws a random color different from current_color with a single draw.
+        """
+        if self.num_colors < 2:
+            return 0
+        new_color = random.randint(0, self.num_colors - 2)
+        if new_color >= current_color:
+            new_color += 1
+        return new_color
+
+    def _crossover_states(self, parent1, parent2, crossover_rate=0.8, out=None):
+        """
+        Single-point crossover on evaluation states.
+
+        Each offspring state is derived from the parent that provides its head by
+        recoloring only the tail genes that differ, in O(deg(v)) per gene.
+
+        Args:
+            parent1 (ConflictState): State of the first parent.
+            parent2 (ConflictState): State of the second parent.
+            crossover_rate (float): Probability of performing crossover.
+            out (tuple): Two states overwritten with the offspring (default: new copies).
+
+        Returns:
+            tuple: Two offspring states.
+        """
+        if out is None:
+            offspring1, offspring2 = parent1.copy(), parent2.copy()
+        else:
+            offspring1, offspring2 = out[0].assign(parent1), out[1].assign(parent2)
+        if random.random() > crossover_rate:
+            return offspring1, offspring2
+
+        crossover_point = random.randint(1, len(parent1.chromosome) - 1)
+        genes1 = parent1.chromosome
+        genes2 = parent2.chromosome
+        for i in range(crossover_point, len(genes1)):
+            if genes1[i] != genes2[i]:
+                offspring1.recolor(i, genes2[i])
+                offspring2.recolor(i, genes1[i])
+
+        return offspring1, offspring2
+
+    def _mutation_state(self, state, mutation_rate=0.1):
+        """
+        Random mutation applied in place to an evaluation state.
+
+        Args:
+            state (ConflictState): The offspring state to mutate.
+            mutation_rate (float): Probability of mutating each gene.
+
+        Returns:
+            ConflictState: The mutated state.
+        """
+        chromosome = state.chromosome
+        for i in range(len(chromosome)):
+            if random.random() < mutation_rate:
+                # Change to a random color (different from current)
+                state.recolor(i, self._random_other_color(chromosome[i]))
+        return state
+
+    @classmethod
+    def solve(cls, graph, k, time_budget=None, target=0, deadline=None, incumbent=None,
+              population_size=50, generations=None, **kwargs):
+        """
+        Anytime entry point: evolves until the target, the time budget or the generation limit.
+
+        Args:
+            graph (Graph): The graph to be colored.
+            k (int): The number of available colors.
+            time_budget (float): Wall-clock limit in seconds (ignored if deadline is given).
+            target (int): Stop as soon as a coloring with at most this many conflicts is found.
+            deadline (Deadline): Shared budget; cancel() stops the run from another thread.
+            incumbent (Incumbent): Receives every improvement while the run is going.
+            population_size (int): The number of individuals in the population.
+            generations (int): Optional generation limit.
+            **kwargs: Further constructor arguments of the GA class.
+
+        Returns:
+            dict: See anytime.solve_result.
+        """
+        deadline = deadline if deadline is not None else Deadline(time_budget)
+        incumbent = incumbent if incumbent is not None else Incumbent(max_colors=k)
+        ga = cls(graph, population_size, k, **kwargs)
+        ga.run(generations, deadline=deadline, incumbent=incumbent, target=target)
+        return solve_result(incumbent, deadline, target)
+
+    def run(self, generations=100, deadline=None, incumbent=None, target=0):
         """
         The main loop of the Genetic Algorithm.
         
         Args:
-            generations (int): Number of generations to evolve.
+            generations (int): Number of generations to evolve; None runs until the
+                target is reached or the deadline expires.
+            deadline (Deadline): Checked after every generation; the run stops when it expires.
+            incumbent (Incumbent): Receives every improvement of the best solution.
+            target (int): Stop once the best solution has at most this many conflicts.
         """
+        self.deadline = deadline
+        telemetry = self.telemetry
+        telemetry.start_run(
+            self.evaluator,
+            algorithm=type(self).__name__,
+            num_vertices=self.graph.num_vertices,
+            population_size=self.population_size,
+            num_colors=self.num_colors,
+            generations=generations
+        )
         print("Genetic Algorithm started.")
         print(f"Population size: {self.population_size}, Num colors: {self.num_colors}")
         print(f"Generations: {generations}")
@@ -167,22 +366,30 @@ class GeneticAlgorithm:
         best_conflicts_history = []
         
         # Main loop
-        for generation in range(generations):
+        for generation in (count() if generations is None else range(generations)):
+            if deadline is not None and deadline.expired():
+                print(f"\n⏰ Time budget exhausted after {generation} generations.")
+                break
             self.population = self._run_generation()
+            with telemetry.phase("evaluation"):
+                states = self._population_states()
+            telemetry.end_generation(generation, states, self.evaluator)
             
             # Find and log the best chromosome of the current generation
-            current_best_chromosome, best_fitness_in_gen = min(
-                [(chromo, self._calculate_fitness(chromo)[0]) for chromo in self.population], 
-                key=lambda x: x[1]
-            )
-            
-            _, best_fitness, best_conflicts, colors_used = self._get_chromosome_details(current_best_chromosome)
+            best_state = min(states, key=lambda state: state.fitness)
+            current_best_chromosome = best_state.chromosome
+            best_fitness = best_state.fitness
+            best_conflicts = best_state.conflicts
+            colors_used = best_state.colors_used
 
             if best_fitness < overall_best_fitness:
-                overall_best_chromosome = current_best_chromosome
+                # Population rows are reused by later generations, so the best is copied
+                overall_best_chromosome = self._copy_chromosome(current_best_chromosome)
                 overall_best_fitness = best_fitness
                 overall_best_conflicts = best_conflicts
                 overall_best_colors_used = colors_used
+                if incumbent is not None:
+                    incumbent.offer(overall_best_chromosome, best_conflicts, colors_used)
 
             if (generation + 1) % 10 == 0 or generation == 0:
                 print(f"Generation {generation:3d}: Best Fitness = {best_fitness:.2f}, Conflicts = {best_conflicts:2d}, Colors = {colors_used}")
@@ -191,12 +398,24 @@ class GeneticAlgorithm:
                 print(f"\n🎉 VALID SOLUTION FOUND at generation {generation}!")
                 print(f"Colors used: {overall_best_colors_used}\n")
                 break
+            if overall_best_conflicts <= target:
+                break
         
+        self.runtime_seconds = telemetry.end_run(
+            best_fitness=overall_best_fitness,
+            best_conflicts=overall_best_conflicts,
+            best_colors=overall_best_colors_used
+        )
+
         print("\n" + "="*50)
         print("FINAL RESULTS:")
         print(f"Best Fitness: {overall_best_fitness:.2f}")
         print(f"Conflicts: {overall_best_conflicts}")
         print(f"Colors Used: {overall_best_colors_used}")
+        print(f"Runtime: {self.runtime_seconds:.2f} seconds")
+        if self.evaluator.cache is not None:
+            cache = self.evaluator.cache
+            print(f"Fitness cache: {cache.hits} hits, {cache.misses} misses ({cache.hit_rate:.1%} hit rate)")
         if overall_best_conflicts == 0:
             print("✅ VALID SOLUTION ACHIEVED!")
         else:
@@ -209,39 +428,97 @@ class GeneticAlgorithm:
 
         return overall_best_chromosome, overall_best_fitness, overall_best_conflicts, overall_best_colors_used
 
+    def _copy_chromosome(self, chromosome):
+        """
+        Copies a chromosome of the population into a plain list.
+        """
+        return list(chromosome)
+
+    def _next_states(self):
+        """
+        Evaluation states over the rows of the next buffer of the population
+        store, created on first use and reused every other generation.
+        """
+        store = self.store
+        states = self._buffer_states[1 - store.current]
+        n = self.graph.num_vertices
+        if states is None:
+            states = [ConflictState(self.evaluator, row, [0] * n, 0, {}, 0) for row in store.next_rows]
+            self._buffer_states[1 - store.current] = states
+        if self._spare_state is None:
+            # Scratch state for the second child of a last pair that does not fit
+            self._spare_state = ConflictState(self.evaluator, [0] * n, [0] * n, 0, {}, 0)
+        return states
+
+    def _offspring_rows(self, new_states, filled):
+        """
+        Rows of the next buffer receiving the pair of offspring at position
+        filled; the second child of a last pair that does not fit goes to a
+        scratch row.
+        """
+        second = new_states[filled + 1] if filled + 1 < len(new_states) else self._spare_state
+        return new_states[filled].chromosome, second.chromosome
+
+    def _swap_rows(self, elite):
+        """
+        Ends a generation whose offspring were written as plain chromosomes into
+        the rows of the next buffer (e.g. by local search operators).
+
+        The buffers are swapped; only the elite keeps its state, the other rows
+        are evaluated again by _population_states().
+
+        Args:
+            elite (ConflictState): State of row 0 of the next buffer.
+
+        Returns:
+            list: The new population (the rows of the now current buffer).
+        """
+        self.store.swap()
+        self._states = {id(elite.chromosome): elite}
+        return list(self.store.rows)
+
     def _run_generation(self):
         """
         Runs a single generation of the genetic algorithm.
+
+        The offspring are written in place into the next buffer of the
+        population store, so a generation allocates no chromosomes.
         """
-        # Calculate fitness for all individuals
-        fitness_scores = [(chromo, self._calculate_fitness(chromo)) for chromo in self.population]
-        
-        # Sort by fitness (lower is better)
-        fitness_scores.sort(key=lambda x: x[1][0])
+        telemetry = self.telemetry
+        # Fitness of all individuals is cached in their evaluation states
+        with telemetry.phase("evaluation"):
+            states = self._population_states()
         
         # Get the best individual (for elitism)
-        best_chromosome = fitness_scores[0][0]
+        best_state = min(states, key=lambda state: state.fitness)
         
         # Create new population
-        new_population = [best_chromosome[:]] # Elitism
+        new_states = self._next_states()
+        new_states[0].assign(best_state) # Elitism
         
         # Generate the rest of the population
-        while len(new_population) < self.population_size:
-            parent1 = self._selection()
-            parent2 = self._selection()
-            offspring1, offspring2 = self._crossover(parent1, parent2)
-            offspring1 = self._mutation(offspring1)
-            offspring2 = self._mutation(offspring2)
-            new_population.append(offspring1)
-            if len(new_population) < self.population_size:
-                new_population.append(offspring2)
-                
-        return new_population
+        size = self.population_size
+        filled = 1
+        while filled < size:
+            with telemetry.phase("selection"):
+                parent1 = self._select_state()
+                parent2 = self._select_state()
+            # The second child of the last pair does not fit and goes to a scratch state
+            out = (new_states[filled], new_states[filled + 1] if filled + 1 < size else self._spare_state)
+            with telemetry.phase("crossover"):
+                offspring1, offspring2 = self._crossover_states(parent1, parent2, out=out)
+            with telemetry.phase("mutation"):
+                self._mutation_state(offspring1)
+                self._mutation_state(offspring2)
+            filled += 2
+
+        self.store.swap()
+        self._states = {id(state.chromosome): state for state in new_states}
+        return [state.chromosome for state in new_states]
 
     def _get_chromosome_details(self, chromosome):
         """
         Returns the details of a chromosome.
         """
-        fitness, conflicts = self._calculate_fitness(chromosome)
-        colors_used = len(set(chromosome))
-        return chromosome, fitness, conflicts, colors_used 
+        state = self._get_state(chromosome)
+        return chromosome, state.fitness, state.conflicts, state.colors_used 
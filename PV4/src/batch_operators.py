@@ -0,0 +1,332 @@
+import random
+import numpy as np
+from base_genetic_algorithm import GeneticAlgorithm
+from selection import select_indices
+from telemetry import RunTelemetry
+
+CROSSOVERS = ("one_point", "uniform", "conflict_aware")
+
+
+def one_point_crossover(parents1, parents2, points, out, genes=None):
+    """
+    One-point crossover of whole parent batches.
+
+    Child i takes genes [0, points[i]) from parents1[i] and the rest from parents2[i].
+
+    Args:
+        parents1, parents2 (numpy.ndarray): Parent arrays of shape (batch, n).
+        points (numpy.ndarray): Crossover point of every pair; n copies parents1.
+        out (numpy.ndarray): Preallocated (batch, n) array receiving the children.
+        genes (numpy.ndarray): Optional cached np.arange(n).
+
+    Returns:
+        numpy.ndarray: out.
+    """
+    if genes is None:
+        genes = np.arange(parents1.shape[1])
+    np.copyto(out, parents2)
+    np.copyto(out, parents1, where=genes[None, :] < points[:, None])
+    return out
+
+
+def uniform_crossover(parents1, parents2, mask, out):
+    """
+    Uniform crossover: child genes come from parents1 where mask is True, else from parents2.
+    """
+    np.copyto(out, parents2)
+    np.copyto(out, parents1, where=mask)
+    return out
+
+
+def conflict_aware_crossover(parents1, parents2, conflicts1, conflicts2, tie_mask, out):
+    """
+    Conflict-aware crossover: every gene is taken from the parent in which that
+    vertex has fewer conflicts, ties are broken by tie_mask (True -> parents1).
+
+    Args:
+        conflicts1, conflicts2 (numpy.ndarray): Per-vertex conflicts of the parents, shape (batch, n).
+    """
+    np.copyto(out, parents2)
+    np.copyto(out, parents1, where=(conflicts1 < conflicts2) | ((conflicts1 == conflicts2) & tie_mask))
+    return out
+
+
+def mutate(offspring, mask, shifts, num_colors):
+    """
+    Per-gene mutation of a whole batch, in place.
+
+    Every gene where mask is True moves to a different color by adding a shift
+    in 1..num_colors-1 modulo num_colors, so no redraw loop is needed.
+    """
+    np.add(offspring, shifts, out=offspring, where=mask)
+    np.remainder(offspring, num_colors, out=offspring, where=mask)
+    return offspring
+
+
+class BatchOperators:
+    """
+    Selection, crossover and mutation on population arrays.
+
+    All per-generation arrays (parents, random draws, masks and the two
+    population buffers) are allocated once; every generation writes into the
+    buffer that is not holding the current population.
+    """
+    def __init__(self, population_size, num_vertices, num_colors, rng, telemetry=None):
+        """
+        Args:
+            population_size (int): Rows of the population arrays.
+            num_vertices (int): Genes per chromosome.
+            num_colors (int): The number of available colors (k).
+            rng (numpy.random.Generator): Source of all random draws.
+            telemetry (RunTelemetry): Times the selection, crossover and mutation steps.
+        """
+        shape = (population_size, num_vertices)
+        self.num_colors = num_colors
+        self.rng = rng
+        self.telemetry = telemetry if telemetry is not None else RunTelemetry(keep_events=False)
+        self.genes = np.arange(num_vertices)
+        self.buffers = [np.empty(shape, dtype=np.int32), np.empty(shape, dtype=np.int32)]
+        self.current = 0
+        self.parents1 = np.empty(shape, dtype=np.int32)
+        self.parents2 = np.empty(shape, dtype=np.int32)
+        self.conflicts1 = np.empty(shape, dtype=np.int64)
+        self.conflicts2 = np.empty(shape, dtype=np.int64)
+        self.uniform = np.empty(shape, dtype=np.float64)
+        self.mask = np.empty(shape, dtype=bool)
+        self.shifts = np.empty(shape, dtype=np.int32)
+
+    def load(self, population):
+        """
+        Copies a population (list of chromosomes) into the current buffer.
+        """
+        population_array = self.buffers[self.current]
+        population_array[:] = population
+        return population_array
+
+    def contestants(self, size, count, tournament_size=3):
+        """
+        Draws count tournaments of distinct individuals out of size in one batch.
+
+        Every row takes the tournament_size smallest of size random keys, i.e. a
+        sample without replacement like selection.tournament_indices.
+
+        Returns:
+            numpy.ndarray: Array of shape (count, min(tournament_size, size)).
+        """
+        tournament_size = max(1, min(tournament_size, size))
+        keys = self.rng.random((count, size))
+        if tournament_size == size:
+            return np.argsort(keys, axis=1)
+        return np.argpartition(keys, tournament_size - 1, axis=1)[:, :tournament_size]
+
+    def tournament(self, fitness, count, tournament_size=3):
+        """
+        Indices of count tournament winners (lowest fitness) drawn in one batch.
+        """
+        candidates = self.contestants(len(fitness), count, tournament_size)
+        return candidates[np.arange(count), np.argmin(fitness[candidates], axis=1)]
+
+    def next_generation(self, fitness, vertex_conflicts=None, crossover="one_point",
+                        crossover_rate=0.8, mutation_rate=0.1, tournament_size=3, selection="tournament"):
+        """
+        Builds the next generation from the population in the current buffer.
+
+        Row 0 keeps the best individual (elitism); every other row is a child of
+        two selected parents.
+
+        Args:
+            fitness (numpy.ndarray): Fitness of every individual (lower is better).
+            vertex_conflicts (numpy.ndarray): Per-vertex conflicts, needed by 'conflict_aware'.
+            crossover (str): 'one_point', 'uniform' or 'conflict_aware'.
+            crossover_rate (float): Probability that a pair is recombined.
+            mutation_rate (float): Probability of mutating each gene.
+            tournament_size (int): Number of individuals in each tournament.
+            selection (str): One of selection.SELECTION_METHODS; tournaments are
+                drawn on the arrays, the other methods by selection.select_indices.
+
+        Returns:
+            numpy.ndarray: The new population; it stays valid until the generation after next.
+        """
+        population = self.buffers[self.current]
+        out = self.buffers[1 - self.current]
+        size = population.shape[0]
+        rng = self.rng
+        telemetry = self.telemetry
+
+        with telemetry.phase("selection"):
+            if selection == "tournament":
+                index1 = self.tournament(fitness, size, tournament_size)
+                index2 = self.tournament(fitness, size, tournament_size)
+            else:
+                indices = np.asarray(select_indices(selection, fitness.tolist(), 2 * size,
+                                                    tournament_size=tournament_size))
+                index1, index2 = indices[:size], indices[size:]
+            np.take(population, index1, axis=0, out=self.parents1)
+            np.take(population, index2, axis=0, out=self.parents2)
+
+        with telemetry.phase("crossover"):
+            self._recombine(crossover, crossover_rate, vertex_conflicts, index1, index2, out)
+
+        with telemetry.phase("mutation"):
+            if self.num_colors > 1:
+                rng.random(out=self.uniform)
+                np.less(self.uniform, mutation_rate, out=self.mask)
+                rng.random(out=self.uniform)
+                self.uniform *= self.num_colors - 1
+                np.copyto(self.shifts, self.uniform, casting='unsafe')
+                self.shifts += 1
+                mutate(out, self.mask, self.shifts, self.num_colors)
+
+        # Elitism
+        out[0] = population[int(np.argmin(fitness))]
+        self.current = 1 - self.current
+        return out
+
+    def _recombine(self, crossover, crossover_rate, vertex_conflicts, index1, index2, out):
+        """
+        Writes the children of the selected parent pairs into out.
+        """
+        size, n = out.shape
+        rng = self.rng
+        recombine = rng.random(size) < crossover_rate
+
+        if crossover == "one_point":
+            points = rng.integers(1, max(2, n), size=size)
+            points[~recombine] = n
+            one_point_crossover(self.parents1, self.parents2, points, out, self.genes)
+        elif crossover == "uniform":
+            rng.random(out=self.uniform)
+            np.less(self.uniform, 0.5, out=self.mask)
+            self.mask[~recombine] = True
+            uniform_crossover(self.parents1, self.parents2, self.mask, out)
+        elif crossover == "conflict_aware":
+            if vertex_conflicts is None:
+                raise ValueError("conflict_aware crossover needs the per-vertex conflicts.")
+            np.take(vertex_conflicts, index1, axis=0, out=self.conflicts1)
+            np.take(vertex_conflicts, index2, axis=0, out=self.conflicts2)
+            rng.random(out=self.uniform)
+            np.less(self.uniform, 0.5, out=self.mask)
+            self.mask[~recombine] = True
+            self.conflicts2[~recombine] = np.iinfo(np.int64).max
+            conflict_aware_crossover(self.parents1, self.parents2, self.conflicts1, self.conflicts2, self.mask, out)
+        else:
+            raise ValueError(f"Unknown crossover '{crossover}', expected one of {CROSSOVERS}.")
+
+
+class ArrayState:
+    """
+    Evaluation of one row of a population array.
+
+    Offers the read-only part of the ConflictState interface used by the run
+    loop, the telemetry and the island model; chromosome and vertex_conflicts
+    are views into the arrays of BatchGeneticAlgorithm.
+    """
+    __slots__ = ("chromosome", "vertex_conflicts", "conflicts", "colors_used", "fitness")
+
+    def __init__(self, chromosome, vertex_conflicts, conflicts, colors_used, fitness):
+        self.chromosome = chromosome
+        self.vertex_conflicts = vertex_conflicts
+        self.conflicts = conflicts
+        self.colors_used = colors_used
+        self.fitness = fitness
+
+    def copy(self):
+        """Returns a copy that no longer shares the population arrays."""
+        return ArrayState(self.chromosome.copy(), self.vertex_conflicts.copy(),
+                          self.conflicts, self.colors_used, self.fitness)
+
+
+class BatchGeneticAlgorithm(GeneticAlgorithm):
+    """
+    Genetic Algorithm whose operators run on whole population arrays.
+
+    The population lives in the buffers of BatchOperators between generations:
+    selection, crossover and mutation of a generation are a handful of numpy
+    calls on them, and the new population is evaluated from the array in one
+    pass of the batch evaluator. self.population holds views of the rows;
+    a row replaced from outside (e.g. a migrant) is copied back into the array.
+    """
+    def __init__(self, graph, population_size, num_colors, conflict_penalty=1.0, initializer="random",
+                 crossover="one_point", crossover_rate=0.8, mutation_rate=0.1,
+                 selection="tournament", tournament_size=3, telemetry=None):
+        """
+        Args:
+            crossover (str): 'one_point', 'uniform' or 'conflict_aware'.
+            crossover_rate (float): Probability that a pair is recombined.
+            mutation_rate (float): Probability of mutating each gene.
+            selection (str): 'tournament', 'sus', 'rank' or 'truncation'.
+            tournament_size (int): Number of individuals in each tournament.
+        """
+        if crossover not in CROSSOVERS:
+            raise ValueError(f"Unknown crossover '{crossover}', expected one of {CROSSOVERS}.")
+        super().__init__(graph, population_size, num_colors, conflict_penalty, initializer,
+                         selection, tournament_size, telemetry)
+        self.crossover = crossover
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        # Seeded from the random module, so random.seed() also fixes the array operators
+        rng = np.random.default_rng(random.getrandbits(64))
+        self.operators = BatchOperators(population_size, graph.num_vertices, num_colors, rng, self.telemetry)
+        self._buffer_rows = [list(buffer) for buffer in self.operators.buffers]
+        self._array_states = None
+        self._fitness = None
+        self._vertex_conflicts = None
+
+    def _population_states(self):
+        """
+        Evaluates the population straight from the current operator buffer.
+
+        Conflicts, per-vertex conflicts and colors used of all rows come from
+        one pass of the batch evaluator, without hashing or building a
+        ConflictState per chromosome. The result is kept until the population
+        changes.
+
+        Returns:
+            list: One ArrayState per individual.
+        """
+        operators = self.operators
+        array = operators.buffers[operators.current]
+        rows = self._buffer_rows[operators.current]
+        population = self.population
+        for i, chromosome in enumerate(population):
+            if chromosome is not rows[i]:
+                array[i] = chromosome
+                population[i] = rows[i]
+                self._array_states = None
+        if self._array_states is None:
+            batch = self.evaluator.batch
+            vertex_conflicts = batch.vertex_conflicts(array)
+            conflicts = vertex_conflicts.sum(axis=1) // 2
+            colors_used = batch.colors_used(array)
+            fitness = conflicts * self.graph.num_vertices + colors_used
+            self.evaluator.full_evaluations += len(rows)
+            self._fitness = fitness
+            self._vertex_conflicts = vertex_conflicts
+            self._array_states = [
+                ArrayState(row, row_conflicts, c, u, f)
+                for row, row_conflicts, c, u, f in zip(rows, vertex_conflicts, conflicts.tolist(),
+                                                        colors_used.tolist(), fitness.tolist())
+            ]
+        return self._array_states
+
+    def _copy_chromosome(self, chromosome):
+        return chromosome.tolist()
+
+    def _run_generation(self):
+        """
+        Runs a single generation with the array operators.
+        """
+        with self.telemetry.phase("evaluation"):
+            self._population_states()
+        self.operators.next_generation(
+            self._fitness,
+            self._vertex_conflicts if self.crossover == "conflict_aware" else None,
+            crossover=self.crossover,
+            crossover_rate=self.crossover_rate,
+            mutation_rate=self.mutation_rate,
+            tournament_size=self.tournament_size,
+            selection=self.selection
+        )
+        # The offspring are evaluated from the array by _population_states
+        self._array_states = None
+        return list(self._buffer_rows[self.operators.current])
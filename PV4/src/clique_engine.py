@@ -0,0 +1,136 @@
+from anytime import Deadline
+
+
+def greedy_clique(masks):
+    """
+    Greedy clique, the starting lower bound of max_clique.
+
+    Starts once from every vertex and repeatedly adds the candidate with the
+    most neighbors among the remaining candidates.
+
+    Args:
+        masks (list): masks[v] is the neighbor bitset of vertex v (0..n-1).
+
+    Returns:
+        list: The vertices of the largest clique found.
+    """
+    best = []
+    for start in sorted(range(len(masks)), key=lambda v: -masks[v].bit_count()):
+        if masks[start].bit_count() < len(best):
+            continue  # Cannot beat the current clique
+        clique = [start]
+        candidates = masks[start]
+        while candidates:
+            best_u, best_degree = -1, -1
+            rest = candidates
+            while rest:
+                low = rest & -rest
+                u = low.bit_length() - 1
+                rest ^= low
+                degree = (masks[u] & candidates).bit_count()
+                if degree > best_degree:
+                    best_u, best_degree = u, degree
+            clique.append(best_u)
+            candidates &= masks[best_u]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+
+def max_clique(masks, time_budget=None, deadline=None, node_limit=None):
+    """
+    Maximum clique by bit-parallel branch and bound (Tomita's MCQ/MCS with the
+    bitset coloring of San Segundo's BBMC).
+
+    Vertices are renumbered by decreasing degree so that bit order is the
+    branching order. At every node the candidate set is greedily colored one
+    color class at a time (a class is built by repeatedly taking the lowest
+    remaining bit and masking out its neighbors); a vertex with color c can
+    extend the current clique by at most c, so branching goes from the highest
+    color down and stops as soon as |clique| + c cannot beat the incumbent.
+    The search starts from greedy_clique and returns the best clique found
+    when the budget runs out, so any result is a valid lower bound on the
+    chromatic number.
+
+    Args:
+        masks (list): masks[v] is the neighbor bitset of vertex v (0..n-1),
+            e.g. CSRGraph.build_bitmatrix().
+        time_budget (float): Wall-clock limit in seconds (ignored if deadline is given).
+        deadline (Deadline): Shared budget; cancel() stops the search from another thread.
+        node_limit (int): Maximum number of search nodes.
+
+    Returns:
+        tuple: (clique, optimal) - the vertices of the best clique found and
+        whether the search completed, i.e. the clique is proven maximum.
+    """
+    n = len(masks)
+    if n == 0:
+        return [], True
+    deadline = deadline if deadline is not None else Deadline(time_budget)
+    best = greedy_clique(masks)
+
+    order = sorted(range(n), key=lambda v: masks[v].bit_count(), reverse=True)
+    position = [0] * n
+    for i, v in enumerate(order):
+        position[v] = i
+    ordered_masks = []
+    for v in order:
+        mask = 0
+        rest = masks[v]
+        while rest:
+            low = rest & -rest
+            mask |= 1 << position[low.bit_length() - 1]
+            rest ^= low
+        ordered_masks.append(mask)
+
+    clique = []
+    best_size = len(best)
+    best_found = None
+    nodes = 0
+    stopped = False
+
+    def color_sort(candidates):
+        # Greedy sequential coloring; vertices come out in increasing color order
+        vertices, bounds = [], []
+        color = 0
+        uncolored = candidates
+        while uncolored:
+            color += 1
+            available = uncolored
+            while available:
+                low = available & -available
+                v = low.bit_length() - 1
+                available &= ~ordered_masks[v]
+                available ^= low
+                uncolored ^= low
+                vertices.append(v)
+                bounds.append(color)
+        return vertices, bounds
+
+    def expand(candidates):
+        nonlocal nodes, stopped, best_size, best_found
+        nodes += 1
+        if (node_limit is not None and nodes > node_limit) or (nodes & 255 == 0 and deadline.expired()):
+            stopped = True
+            return
+        vertices, bounds = color_sort(candidates)
+        for i in range(len(vertices) - 1, -1, -1):
+            if len(clique) + bounds[i] <= best_size:
+                return
+            v = vertices[i]
+            clique.append(v)
+            extension = candidates & ordered_masks[v]
+            if extension:
+                expand(extension)
+            elif len(clique) > best_size:
+                best_size = len(clique)
+                best_found = list(clique)
+            clique.pop()
+            if stopped:
+                return
+            candidates &= ~(1 << v)
+
+    expand((1 << n) - 1)
+    if best_found is not None:
+        best = [order[i] for i in best_found]
+    return best, not stopped
@@ -0,0 +1,160 @@
+import random
+
+CROSSOVER_METHODS = ("pairwise", "uniform", "gpx")
+
+
+def conflict_aware_uniform(neighbors, parent1, parent2, rng=random, out=None):
+    """
+    Conflict-aware uniform crossover, O(n + m).
+
+    The child is built vertex by vertex; every vertex takes the parent color
+    that conflicts with fewer of its already placed neighbors (random ties).
+    Placed colors are pushed into per-vertex neighbor-color counts, so each
+    decision is a dictionary lookup instead of a neighborhood scan.
+
+    Args:
+        neighbors (list): neighbors[v] lists the neighbors of vertex v (0..n-1).
+        parent1, parent2 (list): The parents (any color labels).
+        rng: random.Random-compatible generator.
+        out (list): Row overwritten with the child (default: a new list).
+
+    Returns:
+        list: The child.
+    """
+    n = len(parent1)
+    counts = [{} for _ in range(n)]
+    child = [None] * n if out is None else out
+    for v in range(n):
+        color1 = parent1[v]
+        color2 = parent2[v]
+        if color1 == color2:
+            color = color1
+        else:
+            placed = counts[v]
+            conflicts1 = placed.get(color1, 0)
+            conflicts2 = placed.get(color2, 0)
+            if conflicts1 < conflicts2:
+                color = color1
+            elif conflicts2 < conflicts1:
+                color = color2
+            else:
+                color = color1 if rng.random() < 0.5 else color2
+        child[v] = color
+        for u in neighbors[v]:
+            if u > v:
+                placed = counts[u]
+                placed[color] = placed.get(color, 0) + 1
+    return child
+
+
+def gpx(parent1, parent2, num_colors, rng=random, first_color=0, out=None):
+    """
+    Greedy partition crossover (GPX, Galinier & Hao).
+
+    The parents alternately hand over their largest remaining color class; the
+    l-th class becomes color first_color + l and its vertices are removed from
+    both parents. Vertices left after num_colors classes get a random color.
+    Class sizes are kept up to date while vertices are removed, so the cost is
+    O(n + k^2) for k colors.
+
+    Args:
+        parent1, parent2 (list): The parents (any color labels).
+        num_colors (int): Number of classes handed over (k).
+        rng: random.Random-compatible generator.
+        first_color (int): Label of the first color (1 for 1-based chromosomes).
+        out (list): Row overwritten with the child (default: a new list).
+
+    Returns:
+        list: The child, with colors first_color..first_color + k - 1.
+    """
+    n = len(parent1)
+    parents = (parent1, parent2)
+    classes = []
+    for parent in parents:
+        members = {}
+        for v, color in enumerate(parent):
+            members.setdefault(color, set()).add(v)
+        classes.append(members)
+
+    child = [None] * n if out is None else out
+    if out is not None:
+        for v in range(n):
+            child[v] = None
+    for label in range(num_colors):
+        side = label % 2
+        members = classes[side]
+        if not members:
+            break
+        color = max(members, key=lambda c: len(members[c]))
+        taken = members.pop(color)
+        if not taken:
+            break
+        for v in taken:
+            child[v] = first_color + label
+            # Remove v from the other parent's class
+            other = classes[1 - side]
+            other_color = parents[1 - side][v]
+            other[other_color].discard(v)
+            if not other[other_color]:
+                del other[other_color]
+
+    for v in range(n):
+        if child[v] is None:
+            child[v] = first_color + rng.randrange(num_colors)
+    return child
+
+
+def pairwise_conflict_crossover(neighbors, parent1, parent2, out=None):
+    """
+    Two-child conflict-aware crossover with the selection rule of the original
+    CustomCrossover, in O(n + m) instead of O(n * m).
+
+    For every position i, the gene of the other parent is moved into the child
+    where it leaves that child's total conflicts lower: child1 takes
+    parent2[i] when child1's resulting conflicts are below child2's, otherwise
+    child2 takes parent1[i]. The totals are computed once and updated from the
+    neighborhood of i only.
+
+    Args:
+        neighbors (list): neighbors[v] lists the neighbors of vertex v (0..n-1).
+        parent1, parent2 (list): The parents.
+        out (tuple): Two rows overwritten with the children (default: new lists).
+
+    Returns:
+        tuple: (child1, child2)
+    """
+    if out is None:
+        child1, child2 = list(parent1), list(parent2)
+    else:
+        child1, child2 = out
+        child1[:] = parent1
+        child2[:] = parent2
+    total1 = sum(1 for v, row in enumerate(neighbors) for u in row if v < u and child1[v] == child1[u])
+    total2 = sum(1 for v, row in enumerate(neighbors) for u in row if v < u and child2[v] == child2[u])
+
+    for i, row in enumerate(neighbors):
+        old1, new1 = child1[i], parent2[i]
+        old2, new2 = child2[i], parent1[i]
+        delta1 = delta2 = 0
+        if new1 != old1:
+            for u in row:
+                color = child1[u]
+                if color == new1:
+                    delta1 += 1
+                elif color == old1:
+                    delta1 -= 1
+        if new2 != old2:
+            for u in row:
+                color = child2[u]
+                if color == new2:
+                    delta2 += 1
+                elif color == old2:
+                    delta2 -= 1
+
+        if total1 + delta1 < total2 + delta2:
+            child1[i] = new1
+            total1 += delta1
+        else:
+            child2[i] = new2
+            total2 += delta2
+    return child1, child2
@@ -0,0 +1,210 @@
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Mapping
+from numbers import Integral
+
+
+def id_base(num_vertices, max_id, base=None):
+    """
+    Vertex-index base of an edge list: 0 for the gc_*.txt files, 1 for classic DIMACS.
+
+    An explicit base wins. Otherwise the ids are 0-based unless one of them
+    equals the declared vertex count, which only a 1-based file can contain.
+    A 1-based file whose last vertex is isolated is then read as 0-based,
+    which gives an isomorphic graph (the isolated vertex becomes vertex 0).
+
+    Args:
+        num_vertices (int): Vertex count from the header.
+        max_id (int): Largest vertex id of the edge list (None if there are no edges).
+        base (int): Explicit base (0 or 1), or None.
+
+    Returns:
+        int: 0 or 1.
+    """
+    if base is not None:
+        if base not in (0, 1):
+            raise ValueError(f"Vertex id base must be 0 or 1, got {base}.")
+        return base
+    return 1 if max_id is not None and max_id == num_vertices else 0
+
+
+def build_csr(num_vertices, edges, base=None):
+    """
+    Builds compressed sparse row arrays from an undirected edge list.
+
+    Vertex ids may be 0-based (the gc_*.txt files) or 1-based (classic DIMACS),
+    see id_base. Self-loops and duplicate edges are dropped and every row is sorted.
+
+    Args:
+        num_vertices (int): Number of vertices of the graph.
+        edges: Iterable of (u, v) pairs.
+        base (int): Vertex id base (default: taken from the header vertex count).
+
+    Returns:
+        tuple: (offsets, indices) arrays of length n + 1 and 2 * m.
+    """
+    edges = list(edges)
+    offset = id_base(num_vertices, max(max(u, v) for u, v in edges) if edges else None, base)
+    rows = [set() for _ in range(num_vertices)]
+    for u, v in edges:
+        u -= offset
+        v -= offset
+        if not (0 <= u < num_vertices and 0 <= v < num_vertices):
+            raise ValueError(f"Edge ({u + offset}, {v + offset}) is out of range for {num_vertices} vertices.")
+        if u != v:
+            rows[u].add(v)
+            rows[v].add(u)
+
+    offsets = array('i', [0]) * (num_vertices + 1)
+    indices = array('i')
+    for v, row in enumerate(rows):
+        indices.extend(sorted(row))
+        offsets[v + 1] = len(indices)
+    return offsets, indices
+
+
+class CSRAdjacency(Mapping):
+    """
+    Read-only adjacency-list view of a CSRGraph.
+
+    Behaves like the {vertex: neighbors} dictionaries used throughout the
+    project. The neighbor lists are the graph's cached adjacency_lists(),
+    so they must not be modified.
+    """
+    __slots__ = ("graph",)
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    def __getitem__(self, vertex):
+        if not isinstance(vertex, Integral) or not 0 <= vertex < self.graph.num_vertices:
+            raise KeyError(vertex)
+        return self.graph.adjacency_lists()[vertex]
+
+    def __iter__(self):
+        return iter(range(self.graph.num_vertices))
+
+    def __len__(self):
+        return self.graph.num_vertices
+
+
+class CSRGraph:
+    """
+    Compact undirected graph in compressed sparse row form.
+
+    The neighbors of vertex v are indices[offsets[v]:offsets[v + 1]], sorted.
+    An optional dense bitmatrix (one Python int per row) answers edge queries
+    in O(1).
+    """
+    __slots__ = ("num_vertices", "num_edges", "offsets", "indices", "_bits", "_lists")
+
+    def __init__(self, num_vertices, offsets, indices):
+        """
+        Args:
+            num_vertices (int): Number of vertices (ids are 0..n-1).
+            offsets: Row offsets, length n + 1.
+            indices: Concatenated sorted neighbor lists, length 2 * m.
+        """
+        self.num_vertices = num_vertices
+        self.offsets = offsets
+        self.indices = indices
+        self.num_edges = len(indices) // 2
+        self._bits = None
+        self._lists = None
+
+    @classmethod
+    def from_edges(cls, num_vertices, edges, base=None):
+        """
+        Builds a graph from a list of (u, v) pairs (ids with the given base, see build_csr).
+        """
+        return cls(num_vertices, *build_csr(num_vertices, edges, base))
+
+    @classmethod
+    def from_file(cls, file_path, base=None):
+        """
+        Reads a graph file whose first line is '<vertices> <edges>' followed by one edge per line.
+        """
+        edges = []
+        with open(file_path, 'r') as f:
+            parts = f.readline().split()
+            if len(parts) < 2:
+                raise ValueError("Invalid file format: First line should contain number of vertices and edges.")
+            num_vertices = int(parts[0])
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2:
+                    edges.append((int(parts[0]), int(parts[1])))
+        return cls.from_edges(num_vertices, edges, base)
+
+    def __str__(self):
+        return f"Graph with {self.num_vertices} vertices and {self.num_edges} edges."
+
+    def degree(self, vertex):
+        return self.offsets[vertex + 1] - self.offsets[vertex]
+
+    def neighbors(self, vertex):
+        """Sorted neighbors of a vertex (a slice of the index array)."""
+        return self.indices[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    @property
+    def adj(self):
+        """Adjacency-list view, compatible with code written for dict-of-lists graphs."""
+        return CSRAdjacency(self)
+
+    def adjacency_lists(self):
+        """
+        Neighbor lists as a list of Python lists, built once and cached.
+
+        Hot loops that index neighbors many times per generation iterate these
+        instead of slicing the index array on every access.
+        """
+        if self._lists is None:
+            self._lists = [self.neighbors(v).tolist() for v in range(self.num_vertices)]
+        return self._lists
+
+    def edges(self):
+        """Yields every undirected edge once as (u, v) with u < v."""
+        for u, neighbors in enumerate(self.adjacency_lists()):
+            for v in neighbors[bisect_left(neighbors, u + 1):]:
+                yield u, v
+
+    def build_bitmatrix(self):
+        """
+        Builds the dense adjacency bitmatrix used by has_edge and neighbor_mask.
+        Costs n^2 / 8 bytes, about 31 KB for gc_500_9.
+        """
+        if self._bits is None:
+            bits = []
+            for v in range(self.num_vertices):
+                mask = 0
+                for u in self.adjacency_lists()[v]:
+                    mask |= 1 << u
+                bits.append(mask)
+            self._bits = bits
+        return self._bits
+
+    def neighbor_mask(self, vertex):
+        """Neighbors of a vertex as an integer bitset."""
+        return self.build_bitmatrix()[vertex]
+
+    def has_edge(self, u, v):
+        """O(1) with the bitmatrix, O(log deg) binary search otherwise."""
+        if self._bits is not None:
+            return (self._bits[u] >> v) & 1 == 1
+        start, end = int(self.offsets[u]), int(self.offsets[u + 1])
+        i = bisect_left(self.indices, v, start, end)
+        return i < end and self.indices[i] == v
+
+    def to_adjacency_dict(self):
+        """
+        Adapter for the PV1-2 / PV3 algorithms: {vertex: [neighbors]} with 0-based ids.
+        """
+        adj_list = defaultdict(list)
+        for v, neighbors in enumerate(self.adjacency_lists()):
+            adj_list[v] = list(neighbors)
+        return adj_list
+
+    def to_adjacency_sets(self):
+        """Adapter for code that expects a list of neighbor sets."""
+        return [set(neighbors) for neighbors in self.adjacency_lists()]
@@ -0,0 +1,139 @@
+import math
+import random
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, the pure Python path gives the same values
+    np = None
+
+DIVERSITY_METRICS = ("hamming", "entropy", "sampled")
+
+
+def locus_counts(population):
+    """
+    Color frequencies of every locus of the population.
+
+    With numpy the counts come from one bincount over the whole (pop x n)
+    array, otherwise from one Counter per locus. Both cost O(pop * n).
+
+    Args:
+        population (list): Chromosomes of equal length (non-negative colors).
+
+    Returns:
+        list: One list of the nonzero color counts per locus.
+    """
+    if np is None:
+        return [list(Counter(column).values()) for column in zip(*population)]
+    genes = np.asarray(population, dtype=np.int64)
+    n = genes.shape[1]
+    width = int(genes.max()) + 1
+    counts = np.bincount((genes + width * np.arange(n)).ravel(), minlength=n * width).reshape(n, width)
+    return [row[row > 0].tolist() for row in counts]
+
+
+def hamming_diversity(population, counts=None):
+    """
+    Mean pairwise Hamming distance divided by the chromosome length.
+
+    At a locus with color counts f_c, (P^2 - sum f_c^2) / 2 of the pairs
+    differ, so the all-pairs mean is exact in O(pop * n) instead of O(pop^2 * n).
+
+    Args:
+        population (list): The chromosomes.
+        counts (list): Precomputed locus_counts(population).
+
+    Returns:
+        float: Diversity in [0, 1].
+    """
+    size = len(population)
+    if size < 2 or not population[0]:
+        return 0.0
+    if counts is None:
+        counts = locus_counts(population)
+    differing = sum(size * size - sum(f * f for f in locus) for locus in counts) / 2
+    return differing / (size * (size - 1) / 2) / len(counts)
+
+
+def entropy_diversity(population, counts=None):
+    """
+    Mean Shannon entropy of the loci, each normalized by its maximum
+    log(min(pop, colors)).
+
+    Args:
+        population (list): The chromosomes.
+        counts (list): Precomputed locus_counts(population).
+
+    Returns:
+        float: Diversity in [0, 1].
+    """
+    size = len(population)
+    if size < 2 or not population[0]:
+        return 0.0
+    if counts is None:
+        counts = locus_counts(population)
+    width = max(len(locus) for locus in counts)
+    max_entropy = math.log(min(size, max(width, 2)))
+    total = 0.0
+    for locus in counts:
+        total -= sum(f / size * math.log(f / size) for f in locus)
+    return total / len(counts) / max_entropy
+
+
+def sampled_hamming_diversity(population, pairs=100, rng=random):
+    """
+    Hamming diversity estimated from randomly sampled pairs, O(pairs * n).
+    """
+    size = len(population)
+    if size < 2 or not population[0]:
+        return 0.0
+    total = 0
+    for _ in range(pairs):
+        a, b = rng.sample(range(size), 2)
+        total += sum(1 for x, y in zip(population[a], population[b]) if x != y)
+    return total / pairs / len(population[0])
+
+
+class PopulationDiversity:
+    """
+    Diversity of a GA population, computed at most once per generation.
+
+    measure() caches its value under the key passed by the caller (the
+    generation index), so every offspring of a generation reuses it.
+    """
+    def __init__(self, metric="hamming", sample_pairs=100, rng=random):
+        """
+        Args:
+            metric (str): One of DIVERSITY_METRICS.
+            sample_pairs (int): Number of pairs of the 'sampled' metric.
+            rng: random.Random-compatible generator of the 'sampled' metric.
+        """
+        if metric not in DIVERSITY_METRICS:
+            raise ValueError(f"Unknown diversity metric '{metric}', expected one of {DIVERSITY_METRICS}.")
+        self.metric = metric
+        self.sample_pairs = sample_pairs
+        self.rng = rng
+        self.computations = 0
+        self._key = None
+        self._value = None
+
+    def measure(self, population, key=None):
+        """
+        Args:
+            population (list): The chromosomes.
+            key: Cache key, e.g. the generation index; None always recomputes.
+
+        Returns:
+            float: Diversity in [0, 1].
+        """
+        if key is not None and key == self._key:
+            return self._value
+        self.computations += 1
+        if self.metric == "hamming":
+            value = hamming_diversity(population)
+        elif self.metric == "entropy":
+            value = entropy_diversity(population)
+        else:
+            value = sampled_hamming_diversity(population, self.sample_pairs, self.rng)
+        self._key, self._value = key, value
+        return value
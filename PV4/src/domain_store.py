@@ -0,0 +1,106 @@
+class DomainStore:
+    """
+    Bitset domain store for k-coloring constraint propagation.
+
+    The domain of every vertex is an integer bitmask (bit c set = color c,
+    0..k-1, still allowed) and the uncolored vertices form a vertex bitset, so
+    the uncolored neighbors of a vertex are `masks[v] & uncolored`. Assigning a
+    color removes it from those neighbors only; neighbors left with a single
+    color are assigned through a work queue, so propagation touches the
+    neighborhoods of newly assigned vertices instead of sweeping the whole
+    graph. Every domain change is recorded on a trail and undone with undo().
+    """
+    def __init__(self, masks, k):
+        """
+        Args:
+            masks (list): masks[v] is the neighbor bitset of vertex v (0..n-1),
+                e.g. CSRGraph.build_bitmatrix().
+            k (int): The number of colors.
+        """
+        n = len(masks)
+        self.masks = masks
+        self.k = k
+        self.full = (1 << k) - 1
+        self.domains = [self.full] * n
+        self.colors = [-1] * n
+        self.uncolored = (1 << n) - 1
+        self.trail = []
+
+    @classmethod
+    def from_adjacency(cls, adj_list, num_vertices, k):
+        """
+        Builds the store of a {vertex: neighbors} graph with vertices 0..n-1.
+        """
+        masks = [0] * num_vertices
+        for v in range(num_vertices):
+            for u in adj_list.get(v, []):
+                masks[v] |= 1 << u
+        return cls(masks, k)
+
+    def allowed(self, vertex, color):
+        """True when color is still in the domain of vertex."""
+        return (self.domains[vertex] >> color) & 1 == 1
+
+    def mark(self):
+        """Current trail position, to be passed to undo()."""
+        return len(self.trail)
+
+    def undo(self, mark):
+        """Restores the domains and colors recorded since mark."""
+        trail = self.trail
+        domains = self.domains
+        colors = self.colors
+        while len(trail) > mark:
+            vertex, domain, color = trail.pop()
+            if colors[vertex] != -1 and color == -1:
+                self.uncolored |= 1 << vertex
+            domains[vertex] = domain
+            colors[vertex] = color
+
+    def assign(self, vertex, color):
+        """
+        Colors a vertex and propagates: the color leaves the domains of the
+        uncolored neighbors, and neighbors reduced to a single color are
+        assigned in turn.
+
+        Args:
+            vertex (int): The vertex to color.
+            color (int): Its color, 0..k-1.
+
+        Returns:
+            bool: False when a domain became empty (the caller undoes to its mark).
+        """
+        domains = self.domains
+        colors = self.colors
+        masks = self.masks
+        trail = self.trail
+        queue = [(vertex, color)]
+        while queue:
+            v, c = queue.pop()
+            if colors[v] != -1:
+                if colors[v] != c:
+                    return False
+                continue
+            if not (domains[v] >> c) & 1:
+                return False
+            trail.append((v, domains[v], -1))
+            colors[v] = c
+            domains[v] = 1 << c
+            self.uncolored &= ~(1 << v)
+
+            bit = 1 << c
+            rest = masks[v] & self.uncolored
+            while rest:
+                low = rest & -rest
+                u = low.bit_length() - 1
+                rest ^= low
+                domain = domains[u]
+                if domain & bit:
+                    trail.append((u, domain, -1))
+                    domain ^= bit
+                    domains[u] = domain
+                    if not domain:
+                        return False
+                    if not domain & (domain - 1):
+                        queue.append((u, domain.bit_length() - 1))
+        return True
@@ -0,0 +1,73 @@
+import heapq
+
+
+def dsatur(neighbors, num_colors=None):
+    """
+    DSATUR coloring shared by the initializers and classic heuristics of all projects.
+
+    The next vertex is taken from a max-heap keyed on (saturation, degree);
+    when a vertex's saturation grows a new entry is pushed and the old one is
+    skipped on pop (lazy invalidation). Every vertex keeps a count of its
+    colored neighbors per color, so saturation and the smallest free color are
+    read without rescanning the neighborhood. Runs in O((n + m) log n).
+
+    Args:
+        neighbors (list): neighbors[v] is an iterable of the neighbors of vertex v (0..n-1).
+        num_colors (int): None for classic unlimited DSATUR. Otherwise colors are
+            limited to 0..num_colors-1 and a vertex without a free color gets the
+            color that is least used among its neighbors.
+
+    Returns:
+        list: The color of every vertex, starting at 0.
+    """
+    n = len(neighbors)
+    colors = [-1] * n
+    neighbor_color_counts = [{} for _ in range(n)]
+    degrees = [len(neighbors[v]) for v in range(n)]
+    # Ties on saturation and degree go to the lowest vertex id
+    heap = [(0, -degrees[v], v) for v in range(n)]
+    heapq.heapify(heap)
+
+    while heap:
+        neg_saturation, _, v = heapq.heappop(heap)
+        counts = neighbor_color_counts[v]
+        if colors[v] != -1 or -neg_saturation != len(counts):
+            continue  # Stale entry
+
+        # Smallest color not used by a neighbor
+        color = 0
+        while color in counts:
+            color += 1
+        if num_colors is not None and color >= num_colors:
+            color = min(range(num_colors), key=lambda c: counts.get(c, 0))
+        colors[v] = color
+
+        for u in neighbors[v]:
+            if colors[u] != -1:
+                continue
+            counts_u = neighbor_color_counts[u]
+            if color in counts_u:
+                counts_u[color] += 1
+            else:
+                counts_u[color] = 1
+                heapq.heappush(heap, (-len(counts_u), -degrees[u], u))
+    return colors
+
+
+def dsatur_dict(adj_list, num_colors=None, first_color=0):
+    """
+    DSATUR for {vertex: neighbors} graphs with arbitrary hashable vertex ids.
+
+    Args:
+        adj_list (dict): The adjacency list of the graph.
+        num_colors (int): Optional color limit, see dsatur.
+        first_color (int): Offset added to every color (1 for 1-based colorings).
+
+    Returns:
+        dict: A dictionary mapping each vertex to its assigned color.
+    """
+    nodes = list(adj_list.keys())
+    index = {node: i for i, node in enumerate(nodes)}
+    neighbors = [[index[u] for u in adj_list[node] if u in index] for node in nodes]
+    colors = dsatur(neighbors, num_colors)
+    return {node: colors[i] + first_color for i, node in enumerate(nodes)}
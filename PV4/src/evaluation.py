@@ -0,0 +1,227 @@
+try:
+    from batch_evaluation import BatchEvaluator
+except ImportError:  # numpy is optional, the incremental engine works without it
+    BatchEvaluator = None
+from fitness_cache import FitnessCache, ZobristHasher
+
+
+class ConflictState:
+    """
+    Cached conflict information for a single chromosome.
+
+    Keeps the total number of conflicting edges, the number of conflicts of
+    every vertex and how many vertices use each color, so that recoloring a
+    vertex only touches its neighborhood. The Zobrist hash of the chromosome
+    is maintained alongside, in O(1) per recolor.
+    """
+    def __init__(self, evaluator, chromosome, vertex_conflicts, conflicts, color_counts, zobrist):
+        self.evaluator = evaluator
+        self.chromosome = chromosome
+        self.vertex_conflicts = vertex_conflicts
+        self.conflicts = conflicts
+        self.color_counts = color_counts
+        self.zobrist = zobrist
+
+    @property
+    def colors_used(self):
+        """Number of distinct colors in the chromosome."""
+        return len(self.color_counts)
+
+    @property
+    def fitness(self):
+        """Fitness with the same definition as GeneticAlgorithm._calculate_fitness."""
+        return (self.conflicts * self.evaluator.num_vertices) + len(self.color_counts)
+
+    def recolor(self, vertex, new_color):
+        """
+        Changes the color of one vertex and updates the cached counts in O(deg(vertex)).
+
+        Args:
+            vertex (int): The vertex to recolor.
+            new_color (int): The new color of the vertex.
+        """
+        chromosome = self.chromosome
+        old_color = chromosome[vertex]
+        if old_color == new_color:
+            return
+
+        vertex_conflicts = self.vertex_conflicts
+        own_conflicts = 0
+        for neighbor in self.evaluator.neighbors[vertex]:
+            neighbor_color = chromosome[neighbor]
+            if neighbor_color == old_color:
+                vertex_conflicts[neighbor] -= 1
+                self.conflicts -= 1
+            elif neighbor_color == new_color:
+                vertex_conflicts[neighbor] += 1
+                self.conflicts += 1
+                own_conflicts += 1
+        vertex_conflicts[vertex] = own_conflicts
+        chromosome[vertex] = new_color
+        self.zobrist = self.evaluator.hasher.update(self.zobrist, vertex, old_color, new_color)
+
+        color_counts = self.color_counts
+        if color_counts[old_color] == 1:
+            del color_counts[old_color]
+        else:
+            color_counts[old_color] -= 1
+        color_counts[new_color] = color_counts.get(new_color, 0) + 1
+
+    def copy(self):
+        """Returns an independent copy of this state (and of its chromosome)."""
+        return ConflictState(
+            self.evaluator,
+            self.chromosome[:],
+            self.vertex_conflicts[:],
+            self.conflicts,
+            dict(self.color_counts),
+            self.zobrist
+        )
+
+    def assign(self, other):
+        """
+        Overwrites this state with the contents of other, reusing its own lists.
+
+        Args:
+            other (ConflictState): State of a chromosome of the same length.
+
+        Returns:
+            ConflictState: This state.
+        """
+        if other is self:
+            return self
+        self.chromosome[:] = other.chromosome
+        self.vertex_conflicts[:] = other.vertex_conflicts
+        self.conflicts = other.conflicts
+        self.color_counts.clear()
+        self.color_counts.update(other.color_counts)
+        self.zobrist = other.zobrist
+        return self
+
+    def derive(self, chromosome):
+        """
+        Builds the state of a chromosome that differs from this one in a few genes.
+
+        Only the differing genes are recolored, so the cost is the sum of their
+        degrees instead of a full edge scan.
+
+        Args:
+            chromosome (list): The chromosome to evaluate.
+
+        Returns:
+            ConflictState: The state of the new chromosome.
+        """
+        state = self.copy()
+        current = state.chromosome
+        for vertex, color in enumerate(chromosome):
+            if current[vertex] != color:
+                state.recolor(vertex, color)
+        return state
+
+
+class ConflictEvaluator:
+    """
+    Evaluation engine for graph coloring chromosomes.
+
+    Full evaluations scan the edge list once and produce a ConflictState; all
+    later changes to that chromosome are applied through the state in
+    O(deg(v)) per changed gene. Conflict tallies of evaluated chromosomes are
+    memoized in an LRU cache keyed by their Zobrist hash, so duplicates (elite
+    copies, parents passed through without crossover) are not rescanned.
+    """
+    def __init__(self, graph, num_colors=None, cache_size=4096):
+        """
+        Args:
+            graph (Graph): The graph whose colorings are evaluated.
+            num_colors (int): Expected number of colors, sizes the Zobrist table
+                (default: max degree + 1, the greedy bound).
+            cache_size (int): Capacity of the fitness cache; 0 disables it.
+        """
+        self.num_vertices = graph.num_vertices
+        self.neighbors = graph.adjacency_lists()
+        self.full_evaluations = 0
+        if num_colors is None:
+            num_colors = max(map(len, self.neighbors), default=0) + 1
+        self.hasher = ZobristHasher(self.num_vertices, num_colors)
+        self.cache = FitnessCache(cache_size) if cache_size > 0 else None
+        self.batch = None
+        if BatchEvaluator is not None:
+            self.batch = BatchEvaluator.from_csr(graph)
+
+    def _make_state(self, chromosome, vertex_conflicts, conflicts, zobrist):
+        color_counts = {}
+        for color in chromosome:
+            color_counts[color] = color_counts.get(color, 0) + 1
+        return ConflictState(self, chromosome, vertex_conflicts, conflicts, color_counts, zobrist)
+
+    def _cached_state(self, chromosome, zobrist):
+        """Builds the state from the cache, or returns None on a miss."""
+        if self.cache is None:
+            return None
+        cached = self.cache.get(zobrist)
+        if cached is None:
+            return None
+        vertex_conflicts, conflicts = cached
+        return self._make_state(chromosome, list(vertex_conflicts), conflicts, zobrist)
+
+    def _remember(self, state):
+        if self.cache is not None:
+            self.cache.put(state.zobrist, (tuple(state.vertex_conflicts), state.conflicts))
+
+    def evaluate(self, chromosome):
+        """
+        Evaluates a chromosome, from the cache if it was seen before.
+
+        Args:
+            chromosome (list): The chromosome to evaluate. It is kept by reference.
+
+        Returns:
+            ConflictState: The cached conflict information of the chromosome.
+        """
+        zobrist = self.hasher.hash(chromosome)
+        state = self._cached_state(chromosome, zobrist)
+        if state is not None:
+            return state
+
+        self.full_evaluations += 1
+        vertex_conflicts = [0] * len(chromosome)
+        for vertex, neighbors in enumerate(self.neighbors):
+            color = chromosome[vertex]
+            count = 0
+            for neighbor in neighbors:
+                if chromosome[neighbor] == color:
+                    count += 1
+            vertex_conflicts[vertex] = count
+
+        state = self._make_state(chromosome, vertex_conflicts, sum(vertex_conflicts) // 2, zobrist)
+        self._remember(state)
+        return state
+
+    def evaluate_many(self, chromosomes):
+        """
+        Evaluates several chromosomes, consulting the cache first.
+
+        When numpy is available the conflict tallies of all cache misses are
+        computed in one vectorized pass over the edge array.
+
+        Args:
+            chromosomes (list): The chromosomes to evaluate. They are kept by reference.
+
+        Returns:
+            list: One ConflictState per chromosome.
+        """
+        if self.batch is None or len(chromosomes) < 2:
+            return [self.evaluate(chromosome) for chromosome in chromosomes]
+
+        keys = [self.hasher.hash(chromosome) for chromosome in chromosomes]
+        states = [self._cached_state(chromosome, key) for chromosome, key in zip(chromosomes, keys)]
+        missing = [i for i, state in enumerate(states) if state is None]
+        if not missing:
+            return states
+
+        self.full_evaluations += len(missing)
+        tallies = self.batch.vertex_conflicts([chromosomes[i] for i in missing]).tolist()
+        for i, vertex_conflicts in zip(missing, tallies):
+            states[i] = self._make_state(chromosomes[i], vertex_conflicts, sum(vertex_conflicts) // 2, keys[i])
+            self._remember(states[i])
+        return states
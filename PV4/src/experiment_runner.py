@@ -1,8 +1,13 @@
 import os
-from utils import parse_dimacs_graph
-from base_genetic_algorithm import GeneticAlgorithm 
-from hybrid_genetic_algorithms import GATabuSearch, GAAdaptiveRepair, MemeticGA, GAGreedyCustomCrossover, GreedyInitializer 
+import csv
+import io
 import time
+import random
+import itertools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from utils import parse_dimacs_graph
+from base_genetic_algorithm import GeneticAlgorithm
 
 # Experiment parameters
 generations_list = [100, 500, 1000]
@@ -10,50 +15,188 @@ num_colors_list = [7, 8, 9, 10]
 population_sizes = [50, 100, 200]
 initializers = ["random", "dsatur", "greedy", "mixed"]
 
-file_name = "gc_50_9.txt"
-base_dir = os.path.dirname(os.path.abspath(__file__))
-file_path = os.path.join(base_dir, "..", "data", file_name)
-
-print(f"Loading graph from: {file_path}")
-graph = parse_dimacs_graph(file_path)
-print("Graph loaded successfully!")
-print(graph)
-print("-" * 50)
-
-results = []
-
-total_runs = len(generations_list) * len(num_colors_list) * len(population_sizes) * len(initializers)
-run_count = 0
-
-for generations in generations_list:
-    for num_colors in num_colors_list:
-        for pop_size in population_sizes:
-            for initializer in initializers:
-                run_count += 1
-                print(f"\n[Run {run_count}/{total_runs}] Gen:{generations}, Colors:{num_colors}, Pop:{pop_size}, Init:{initializer}")
-                start_time = time.time()
-                ga = GeneticAlgorithm(
-                    graph=graph,
-                    population_size=pop_size,
-                    num_colors=num_colors,
-                    initializer=initializer
-                )
-                best_chromosome, best_fitness, best_conflicts, best_colors = ga.run(generations=generations)
-                elapsed = time.time() - start_time
-                results.append({
-                    "generations": generations,
-                    "num_colors": num_colors,
-                    "population": pop_size,
-                    "initializer": initializer,
-                    "fitness": best_fitness,
-                    "conflicts": best_conflicts,
-                    "colors_used": best_colors,
-                    "time": elapsed
-                })
-                print(f"Result: Fitness={best_fitness}, Conflicts={best_conflicts}, Colors={best_colors}, Time={elapsed:.2f}s")
-
-# Print summary table
-print("\nSUMMARY TABLE:")
-print(f"{'Gen':>5} {'Col':>4} {'Pop':>4} {'Init':>8} {'Fit':>8} {'Conf':>5} {'Used':>5} {'Time':>7}")
-for r in results:
-    print(f"{r['generations']:5d} {r['num_colors']:4d} {r['population']:4d} {r['initializer']:>8} {r['fitness']:8.2f} {r['conflicts']:5d} {r['colors_used']:5d} {r['time']:7.2f}") 
+FIELDNAMES = ["run", "seed", "generations", "num_colors", "population", "initializer",
+              "fitness", "conflicts", "colors_used", "time"]
+
+# Graph of the current worker process, loaded once by _init_worker
+_worker_graph = None
+
+
+def build_grid(generations_list=generations_list, num_colors_list=num_colors_list,
+               population_sizes=population_sizes, initializers=initializers, base_seed=42):
+    """
+    Builds the list of GA configurations to run.
+
+    Every configuration gets its own seed derived from its position in the grid,
+    so a run gives the same result no matter which worker executes it.
+
+    Returns:
+        list: One dict per run with run index, seed and GA parameters.
+    """
+    grid = []
+    combinations = itertools.product(generations_list, num_colors_list, population_sizes, initializers)
+    for run, (generations, num_colors, pop_size, initializer) in enumerate(combinations):
+        grid.append({
+            "run": run,
+            "seed": base_seed + run,
+            "generations": generations,
+            "num_colors": num_colors,
+            "population": pop_size,
+            "initializer": initializer
+        })
+    return grid
+
+
+def _init_worker(file_path):
+    """
+    Loads the graph once per worker process.
+    """
+    global _worker_graph
+    _worker_graph = parse_dimacs_graph(file_path)
+
+
+def run_single(config, graph=None):
+    """
+    Runs one GA configuration and returns its result row.
+
+    Args:
+        config (dict): A grid entry from build_grid.
+        graph (Graph): The graph; defaults to the graph loaded by the worker.
+
+    Returns:
+        dict: The config extended with fitness, conflicts, colors_used and time.
+    """
+    graph = graph if graph is not None else _worker_graph
+    random.seed(config["seed"])
+    start_time = time.time()
+    ga = GeneticAlgorithm(
+        graph=graph,
+        population_size=config["population"],
+        num_colors=config["num_colors"],
+        initializer=config["initializer"]
+    )
+    # The GA logs every 10 generations; keep worker output off the terminal
+    with contextlib.redirect_stdout(io.StringIO()):
+        best_chromosome, best_fitness, best_conflicts, best_colors = ga.run(generations=config["generations"])
+    result = dict(config)
+    result.update({
+        "fitness": best_fitness,
+        "conflicts": best_conflicts,
+        "colors_used": best_colors,
+        "time": time.time() - start_time
+    })
+    return result
+
+
+def load_completed_runs(output_path):
+    """
+    Reads the result rows already written by an earlier (possibly interrupted) sweep.
+
+    Returns:
+        dict: Mapping run index -> result row.
+    """
+    completed = {}
+    if not os.path.exists(output_path):
+        return completed
+    with open(output_path, 'r', newline='') as f:
+        lines = f.readlines()
+    # Every complete row ends with a newline; a last line without one was cut off
+    # mid-write and may hold truncated values (e.g. time=0.01136 or colors_used=2)
+    if lines and not lines[-1].endswith('\n'):
+        lines.pop()
+    for row in csv.DictReader(lines):
+        if any(row.get(field) in (None, '') for field in FIELDNAMES):
+            continue  # Incomplete row of an interrupted sweep
+        completed[int(row["run"])] = row
+    return completed
+
+
+def run_experiments(file_path, output_path, grid=None, max_workers=None, resume=True):
+    """
+    Runs a grid of GA configurations in parallel and streams the results to CSV.
+
+    Each worker process loads the graph once. Result rows are appended to
+    output_path as soon as a run completes; with resume=True, runs already
+    present in the file are skipped, so an interrupted sweep picks up where it
+    stopped.
+
+    Args:
+        file_path (str): The graph file.
+        output_path (str): CSV file that receives one row per run.
+        grid (list): Configurations from build_grid (default: the full grid).
+        max_workers (int): Number of worker processes (default: CPU count).
+        resume (bool): Skip runs already written to output_path.
+
+    Returns:
+        list: All result rows (previous and new), ordered by run index.
+    """
+    if grid is None:
+        grid = build_grid()
+
+    completed = load_completed_runs(output_path) if resume else {}
+    pending = [config for config in grid if config["run"] not in completed]
+    print(f"{len(grid)} runs in grid, {len(completed)} already done, {len(pending)} to run.")
+
+    # Rewrite the completed rows first, which also drops a truncated last line. They go
+    # to a temporary file that replaces the old one, so a crash never loses finished runs
+    temp_path = output_path + ".tmp"
+    with open(temp_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(completed[run] for run in sorted(completed))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, output_path)
+
+    with open(output_path, 'a', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES, extrasaction='ignore')
+        if pending:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                     initargs=(file_path,)) as executor:
+                futures = {executor.submit(run_single, config): config for config in pending}
+                failed = 0
+                for done_count, future in enumerate(as_completed(futures), start=1):
+                    try:
+                        result = future.result()
+                    except Exception as error:
+                        # A failed run is not written, so the next resume retries it
+                        failed += 1
+                        config = futures[future]
+                        print(f"[{done_count}/{len(pending)}] Run {config['run']} failed: {error!r}")
+                        continue
+                    writer.writerow(result)
+                    f.flush()
+                    completed[result["run"]] = result
+                    print(f"[{done_count}/{len(pending)}] Run {result['run']}: Gen:{result['generations']}, "
+                          f"Colors:{result['num_colors']}, Pop:{result['population']}, Init:{result['initializer']} "
+                          f"-> Fitness={result['fitness']}, Conflicts={result['conflicts']}, "
+                          f"Colors={result['colors_used']}, Time={result['time']:.2f}s")
+                if failed:
+                    print(f"{failed} runs failed; run the sweep again to retry them.")
+
+    return [completed[run] for run in sorted(completed)]
+
+
+def print_summary(results):
+    """
+    Prints the summary table of a sweep.
+    """
+    print("\nSUMMARY TABLE:")
+    print(f"{'Gen':>5} {'Col':>4} {'Pop':>4} {'Init':>8} {'Fit':>8} {'Conf':>5} {'Used':>5} {'Time':>7}")
+    for r in results:
+        print(f"{int(r['generations']):5d} {int(r['num_colors']):4d} {int(r['population']):4d} {r['initializer']:>8} "
+              f"{float(r['fitness']):8.2f} {int(r['conflicts']):5d} {int(r['colors_used']):5d} {float(r['time']):7.2f}")
+
+
+if __name__ == "__main__":
+    file_name = "gc_50_9.txt"
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(base_dir, "..", "data", file_name)
+    output_path = os.path.join(base_dir, "..", "results", f"experiment_grid_{os.path.splitext(file_name)[0]}.csv")
+
+    print(f"Graph: {file_path}")
+    print(f"Results: {output_path}")
+    print("-" * 50)
+
+    results = run_experiments(file_path, output_path)
+    print_summary(results)
@@ -0,0 +1,134 @@
+from collections import OrderedDict
+
+_MASK64 = (1 << 64) - 1
+
+
+def _splitmix64(x):
+    """64-bit mixing function used to derive the Zobrist keys."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+class ZobristHasher:
+    """
+    Zobrist hashing of chromosomes.
+
+    Every (vertex, color) pair has a random 64-bit key and the hash of a
+    chromosome is the XOR of the keys of its genes, so recoloring one vertex
+    updates the hash in O(1).
+    """
+    def __init__(self, num_vertices, num_colors, seed=0x5EED):
+        """
+        Args:
+            num_vertices (int): Genes per chromosome.
+            num_colors (int): Colors 0..num_colors get a precomputed key (this covers
+                both 0-based and 1-based colorings); other colors are hashed on the fly.
+            seed (int): Seed of the keys.
+        """
+        self.seed = seed
+        self.width = num_colors + 1
+        self.table = [[self._make_key(v, c) for c in range(self.width)] for v in range(num_vertices)]
+
+    def _make_key(self, vertex, color):
+        return _splitmix64(self.seed ^ _splitmix64((vertex << 32) ^ (color & 0xFFFFFFFF)))
+
+    def key(self, vertex, color):
+        """Key of a single (vertex, color) gene."""
+        if 0 <= color < self.width:
+            return self.table[vertex][color]
+        return self._make_key(vertex, color)
+
+    def hash(self, chromosome):
+        """Hash of a whole chromosome in O(n)."""
+        h = 0
+        if chromosome and 0 <= min(chromosome) and max(chromosome) < self.width:
+            for row, color in zip(self.table, chromosome):
+                h ^= row[color]
+        else:
+            for vertex, color in enumerate(chromosome):
+                h ^= self.key(vertex, color)
+        return h
+
+    def update(self, h, vertex, old_color, new_color):
+        """Hash after recoloring one vertex, in O(1)."""
+        return h ^ self.key(vertex, old_color) ^ self.key(vertex, new_color)
+
+
+class FitnessCache:
+    """
+    Bounded fitness memo keyed by chromosome hash, with LRU eviction.
+
+    Values are whatever the caller stores for a chromosome (a fitness, or a
+    conflict tally). With 64-bit Zobrist keys a collision between two
+    different chromosomes is practically impossible for the cache sizes used
+    here, so keys are not verified against the full chromosome.
+    """
+    def __init__(self, capacity=4096, hasher=None):
+        """
+        Args:
+            capacity (int): Maximum number of cached chromosomes.
+            hasher (ZobristHasher): Used by get_or_compute_many to key chromosomes.
+        """
+        self.capacity = capacity
+        self.hasher = hasher
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """
+        Returns the cached value of a key (and marks it recently used), or None.
+        """
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Stores a value, evicting the least recently used entry when full.
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def get_or_compute_many(self, chromosomes, compute):
+        """
+        Looks up every chromosome and computes only the missing values in one call.
+
+        Args:
+            chromosomes (list): The chromosomes to evaluate.
+            compute (callable): Maps a list of chromosomes to a list of values.
+
+        Returns:
+            list: One value per chromosome.
+        """
+        keys = [self.hasher.hash(chromosome) for chromosome in chromosomes]
+        values = [self.get(key) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing:
+            for i, value in zip(missing, compute([chromosomes[i] for i in missing])):
+                values[i] = value
+                self.put(keys[i], value)
+        return values
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """
+        Returns:
+            dict: hits, misses, hit_rate and the number of cached entries.
+        """
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate, "size": len(self.entries)}
@@ -1,17 +1,22 @@
-import collections
+from csr_graph import CSRGraph, build_csr
 
-class Graph:
+class Graph(CSRGraph):
     """
-    Represents a graph using an adjacency list.
+    Represents a graph in compressed sparse row form.
+    graph.adj still gives the adjacency list view ({vertex: neighbors}).
     """
-    def __init__(self, num_vertices, num_edges, edges):
-        self.num_vertices = num_vertices
+    __slots__ = ()
+
+    def __init__(self, num_vertices, num_edges, edges, base=None):
+        # The gc_*.txt files are 0-indexed; 1-indexed DIMACS ids are shifted by build_csr
+        super().__init__(num_vertices, *build_csr(num_vertices, edges, base))
         self.num_edges = num_edges
-        self.adj = collections.defaultdict(set)
-        for u, v in edges:
-            # DIMACS nodes are 1-indexed, we use 0-indexed
-            self.adj[u - 1].add(v - 1)
-            self.adj[v - 1].add(u - 1)
 
-    def __str__(self):
-        return f"Graph with {self.num_vertices} vertices and {self.num_edges} edges." 
+    @classmethod
+    def from_csr(cls, csr):
+        """
+        Wraps an existing CSRGraph without copying its arrays.
+        """
+        graph = cls.__new__(cls)
+        CSRGraph.__init__(graph, csr.num_vertices, csr.offsets, csr.indices)
+        return graph
@@ -0,0 +1,223 @@
+import hashlib
+import os
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, files are then parsed in pure Python without a sidecar
+    np = None
+from csr_graph import CSRGraph, build_csr, id_base
+
+CACHE_DIR_NAME = ".graph_cache"
+CACHE_VERSION = 2
+HEADER_SIZE = 6
+
+
+def parse_edge_file(raw, base=None):
+    """
+    Parses the contents of a graph file in bulk and validates it.
+
+    The whole file is converted by numpy in one call instead of line by line.
+    In the same pass the vertex-index base is resolved against the header
+    (see csr_graph.id_base), ids are range-checked, and duplicate edges and
+    self-loops are removed.
+
+    Args:
+        raw (bytes): File contents, '<vertices> <edges>' followed by edge pairs.
+        base (int): Vertex id base (default: taken from the header vertex count).
+
+    Returns:
+        dict: num_vertices, base, edges (m x 2 int32 array, u < v, sorted),
+            duplicate_edges and self_loops.
+    """
+    data = np.fromstring(raw, dtype=np.int64, sep=' ')
+    if len(data) < 2:
+        raise ValueError("Invalid file format: First line should contain number of vertices and edges.")
+    num_vertices, declared_edges = int(data[0]), int(data[1])
+    pairs = data[2:]
+    if len(pairs) % 2 != 0:
+        raise ValueError("Invalid file format: odd number of vertex ids in the edge list.")
+    pairs = pairs.reshape(-1, 2)
+    if len(pairs) != declared_edges:
+        raise ValueError(f"Header declares {declared_edges} edges but the file lists {len(pairs)}.")
+
+    base = id_base(num_vertices, int(pairs.max()) if len(pairs) else None, base)
+    pairs = pairs - base
+    if len(pairs) and (pairs.min() < 0 or pairs.max() >= num_vertices):
+        raise ValueError(f"Vertex ids are out of range for {num_vertices} vertices (base {base}).")
+
+    u = np.minimum(pairs[:, 0], pairs[:, 1])
+    v = np.maximum(pairs[:, 0], pairs[:, 1])
+    loops = u == v
+    keys = np.unique(u[~loops] * num_vertices + v[~loops])
+    edges = np.empty((len(keys), 2), dtype=np.int32)
+    edges[:, 0] = keys // num_vertices
+    edges[:, 1] = keys % num_vertices
+
+    return {
+        "num_vertices": num_vertices,
+        "base": base,
+        "edges": edges,
+        "duplicate_edges": int(len(pairs) - np.count_nonzero(loops) - len(keys)),
+        "self_loops": int(np.count_nonzero(loops)),
+    }
+
+
+def _parse_edge_file_python(raw, base=None):
+    """
+    parse_edge_file without numpy: same validation, edges as a sorted list of (u, v) pairs.
+    """
+    data = [int(token) for token in raw.split()]
+    if len(data) < 2:
+        raise ValueError("Invalid file format: First line should contain number of vertices and edges.")
+    num_vertices, declared_edges = data[0], data[1]
+    ids = data[2:]
+    if len(ids) % 2 != 0:
+        raise ValueError("Invalid file format: odd number of vertex ids in the edge list.")
+    if len(ids) // 2 != declared_edges:
+        raise ValueError(f"Header declares {declared_edges} edges but the file lists {len(ids) // 2}.")
+
+    base = id_base(num_vertices, max(ids) if ids else None, base)
+    if ids and (min(ids) - base < 0 or max(ids) - base >= num_vertices):
+        raise ValueError(f"Vertex ids are out of range for {num_vertices} vertices (base {base}).")
+    pairs = set()
+    self_loops = 0
+    for i in range(0, len(ids), 2):
+        u, v = ids[i] - base, ids[i + 1] - base
+        if u == v:
+            self_loops += 1
+        else:
+            pairs.add((u, v) if u < v else (v, u))
+
+    return {
+        "num_vertices": num_vertices,
+        "base": base,
+        "edges": sorted(pairs),
+        "duplicate_edges": declared_edges - self_loops - len(pairs),
+        "self_loops": self_loops,
+    }
+
+
+def csr_from_edge_array(num_vertices, edges):
+    """
+    Builds CSR offsets and sorted indices from a deduplicated (m x 2) edge array.
+
+    Returns:
+        tuple: (offsets, indices) int32 arrays.
+    """
+    rows = np.concatenate([edges[:, 0], edges[:, 1]])
+    cols = np.concatenate([edges[:, 1], edges[:, 0]])
+    order = np.lexsort((cols, rows))
+    indices = cols[order].astype(np.int32)
+    offsets = np.zeros(num_vertices + 1, dtype=np.int32)
+    np.cumsum(np.bincount(rows, minlength=num_vertices), out=offsets[1:])
+    return offsets, indices
+
+
+def _cache_path(file_path, digest, cache_dir, base=None):
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(file_path)), CACHE_DIR_NAME)
+    # An explicit base gets its own sidecar, so it never replaces the one of the detected base
+    suffix = "" if base is None else f".base{base}"
+    return os.path.join(cache_dir, f"{os.path.basename(file_path)}.{digest}{suffix}.npy")
+
+
+def _write_cache(path, num_vertices, parsed, offsets, indices):
+    edges = parsed["edges"]
+    header = np.array([CACHE_VERSION, num_vertices, len(edges), parsed["base"],
+                       parsed["duplicate_edges"], parsed["self_loops"]], dtype=np.int32)
+    blob = np.concatenate([header, offsets, indices, edges.ravel()])
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a private file first so concurrent loaders never see a partial sidecar
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, blob)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: could not write graph cache {path}: {e}")
+
+
+def _read_cache(path, base=None):
+    blob = np.load(path, mmap_mode='r')
+    if len(blob) < HEADER_SIZE or int(blob[0]) != CACHE_VERSION:
+        return None
+    if base is not None and int(blob[3]) != base:
+        return None
+    num_vertices, num_edges = int(blob[1]), int(blob[2])
+    start = HEADER_SIZE
+    offsets = blob[start:start + num_vertices + 1]
+    start += num_vertices + 1
+    indices = blob[start:start + 2 * num_edges]
+    start += 2 * num_edges
+    edges = blob[start:start + 2 * num_edges].reshape(-1, 2)
+    return num_vertices, offsets, indices, edges
+
+
+def _warn_dropped(file_path, parsed):
+    if parsed["duplicate_edges"] or parsed["self_loops"]:
+        print(f"Warning: {file_path}: dropped {parsed['duplicate_edges']} duplicate edges "
+              f"and {parsed['self_loops']} self-loops")
+
+
+def load_graph_arrays(file_path, use_cache=True, cache_dir=None, base=None):
+    """
+    Loads a graph file as (num_vertices, offsets, indices, edges) arrays.
+
+    The first load parses the file in bulk and writes a binary sidecar into
+    a .graph_cache directory next to the file, named after the file's content
+    hash (and the explicit base, if any). Later loads memory-map the sidecar, so the arrays are views of the
+    cached file instead of freshly parsed data. Without numpy the file is
+    parsed in pure Python on every load.
+
+    Args:
+        file_path (str): The path to the graph file.
+        use_cache (bool): Read and write the binary sidecar.
+        cache_dir (str): Directory for sidecars (default: next to the file).
+        base (int): Vertex id base of the file (default: taken from the header vertex count).
+
+    Returns:
+        tuple: num_vertices, CSR offsets, CSR indices and the (m x 2) edge array
+        (a list of (u, v) pairs without numpy).
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if np is None:
+        parsed = _parse_edge_file_python(raw, base)
+        _warn_dropped(file_path, parsed)
+        num_vertices = parsed["num_vertices"]
+        offsets, indices = build_csr(num_vertices, parsed["edges"], base=0)
+        return num_vertices, offsets, indices, parsed["edges"]
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    path = _cache_path(file_path, digest, cache_dir, base)
+
+    if use_cache and os.path.exists(path):
+        try:
+            cached = _read_cache(path, base)
+        except (OSError, ValueError):
+            cached = None
+        if cached is not None:
+            return cached
+
+    parsed = parse_edge_file(raw, base)
+    num_vertices = parsed["num_vertices"]
+    _warn_dropped(file_path, parsed)
+    offsets, indices = csr_from_edge_array(num_vertices, parsed["edges"])
+    if use_cache:
+        _write_cache(path, num_vertices, parsed, offsets, indices)
+    return num_vertices, offsets, indices, parsed["edges"]
+
+
+def load_csr_graph(file_path, use_cache=True, cache_dir=None, base=None):
+    """
+    Loads a graph file into a CSRGraph using the bulk parser and binary cache.
+
+    Args:
+        file_path (str): The path to the graph file.
+        use_cache (bool): Read and write the binary sidecar.
+        cache_dir (str): Directory for sidecars (default: next to the file).
+        base (int): Vertex id base of the file (default: taken from the header vertex count).
+
+    Returns:
+        CSRGraph: The graph with 0-based vertex ids.
+    """
+    num_vertices, offsets, indices, _ = load_graph_arrays(file_path, use_cache, cache_dir, base)
+    return CSRGraph(num_vertices, offsets, indices)
@@ -1,174 +1,316 @@
-from collections import deque
+from anytime import Deadline
 from base_genetic_algorithm import GeneticAlgorithm
+from diversity import PopulationDiversity
+from crossover_engine import CROSSOVER_METHODS, conflict_aware_uniform, gpx, pairwise_conflict_crossover
 import random
+import sys
 
 class TabuSearch:
     """
-    A simple Tabu Search implementation for graph coloring.
-    It attempts to improve a given coloring by changing the colors of conflicting vertices.
+    TabuCol tabu search for graph coloring.
+
+    Keeps an n x k conflict table (gamma[v][c] = number of neighbors of v colored c),
+    so every (vertex, color) move is scored in O(1) and a move costs O(deg(v))
+    to apply. Tabu status is stored as the iteration until which a
+    (vertex, color) pair stays tabu. An optional Deadline is polled every
+    iteration, so the search can be stopped by a time budget.
     """
-    def __init__(self, graph, initial_coloring, max_iterations=1000, tabu_tenure=10):
+    def __init__(self, graph, initial_coloring, max_iterations=1000, tabu_tenure=10, deadline=None,
+                 num_colors=None, verbose=True):
+        """
+        Args:
+            num_colors (int): Colors 0..num_colors-1 the search may use (default:
+                the number of distinct colors of the initial coloring).
+            verbose (bool): Print every improvement.
+        """
         self.graph = graph
+        self.deadline = deadline
+        self.verbose = verbose
         self.current_solution = list(initial_coloring)
         self.best_solution = list(initial_coloring)
         self.max_iterations = max_iterations
-        self.tabu_list = deque(maxlen=tabu_tenure)
-        self.num_colors = len(set(initial_coloring))
+        self.tabu_tenure = tabu_tenure
+        self.num_colors = num_colors if num_colors is not None else len(set(initial_coloring))
+        self.neighbors = graph.adjacency_lists()
 
-    def _calculate_conflicts(self, coloring):
-        conflicts = 0
-        conflicting_vertices = set()
-        for v, neighbors in self.graph.adj.items():
+    def _build_gamma(self, coloring, width):
+        gamma = [[0] * width for _ in range(len(coloring))]
+        for v, neighbors in enumerate(self.neighbors):
+            row = gamma[v]
             for u in neighbors:
-                if v < u and coloring[v] == coloring[u]:
-                    conflicts += 1
-                    conflicting_vertices.add(v)
-                    conflicting_vertices.add(u)
-        return conflicts, list(conflicting_vertices)
+                row[coloring[u]] += 1
+        return gamma
 
     def run(self):
-        best_conflicts = self._calculate_conflicts(self.best_solution)[0]
-
-        for i in range(self.max_iterations):
-            current_conflicts, conflicting_vertices = self._calculate_conflicts(self.current_solution)
-
-            if current_conflicts < best_conflicts:
-                self.best_solution = list(self.current_solution)
-                best_conflicts = current_conflicts
-                print(f"  Tabu Search new best: {best_conflicts} conflicts")
-
+        coloring = self.current_solution
+        n = len(coloring)
+        if n == 0:
+            return self.best_solution, 0
+
+        num_colors = self.num_colors
+        gamma = self._build_gamma(coloring, max(num_colors, max(coloring) + 1))
+        tabu_until = [[0] * len(gamma[0]) for _ in range(n)]
+
+        # Conflicting vertices as array + position map for O(1) insert/remove
+        conflicting = []
+        position = [-1] * n
+        for v in range(n):
+            if gamma[v][coloring[v]] > 0:
+                position[v] = len(conflicting)
+                conflicting.append(v)
+
+        def mark(v):
+            is_conflicting = gamma[v][coloring[v]] > 0
+            if is_conflicting and position[v] < 0:
+                position[v] = len(conflicting)
+                conflicting.append(v)
+            elif not is_conflicting and position[v] >= 0:
+                last = conflicting.pop()
+                if last != v:
+                    conflicting[position[v]] = last
+                    position[last] = position[v]
+                position[v] = -1
+
+        current_conflicts = sum(gamma[v][coloring[v]] for v in range(n)) // 2
+        best_conflicts = current_conflicts
+
+        deadline = self.deadline
+        for iteration in range(1, self.max_iterations + 1):
             if best_conflicts == 0:
-                print("  Tabu Search found a valid solution!")
+                if self.verbose:
+                    print("  Tabu Search found a valid solution!")
+                break
+            if deadline is not None and deadline.expired():
                 break
 
-            if not conflicting_vertices:
+            if not conflicting:
                 # No conflicts, we are done
                 break
 
-            best_move = None
-            best_move_conflicts = float('inf')
-
-            # Explore neighborhood of a random conflicting vertex
-            vertex_to_move = random.choice(conflicting_vertices)
-            
-            for color in range(self.num_colors):
-                if color == self.current_solution[vertex_to_move]:
-                    continue
-
-                original_color = self.current_solution[vertex_to_move]
-                
-                # Aspiration criterion: allow tabu move if it leads to a new best solution
-                is_tabu = (vertex_to_move, color) in self.tabu_list
-                
-                self.current_solution[vertex_to_move] = color
-                new_conflicts, _ = self._calculate_conflicts(self.current_solution)
+            best_delta = None
+            best_moves = []
+            for v in conflicting:
+                row = gamma[v]
+                current_color = coloring[v]
+                own = row[current_color]
+                tabu_row = tabu_until[v]
+                for color, count in enumerate(row[:num_colors]):
+                    delta = count - own
+                    if best_delta is not None and delta > best_delta or color == current_color:
+                        continue
+                    # Aspiration criterion: allow tabu move if it leads to a new best solution
+                    if tabu_row[color] >= iteration and current_conflicts + delta >= best_conflicts:
+                        continue
+                    if best_delta is None or delta < best_delta:
+                        best_delta = delta
+                        best_moves = [(v, color)]
+                    elif delta == best_delta:
+                        best_moves.append((v, color))
+
+            if not best_moves:
+                continue
+
+            vertex, new_color = random.choice(best_moves)
+            old_color = coloring[vertex]
+            coloring[vertex] = new_color
+            for u in self.neighbors[vertex]:
+                gamma[u][old_color] -= 1
+                gamma[u][new_color] += 1
+                if coloring[u] == old_color or coloring[u] == new_color:
+                    mark(u)
+            mark(vertex)
+            current_conflicts += best_delta
+            # Moving the vertex back to its old color is tabu for tabu_tenure iterations
+            tabu_until[vertex][old_color] = iteration + self.tabu_tenure
 
-                if is_tabu and new_conflicts >= best_conflicts:
-                     # Revert move and continue
-                    self.current_solution[vertex_to_move] = original_color
-                    continue
-
-                if new_conflicts < best_move_conflicts:
-                    best_move_conflicts = new_conflicts
-                    best_move = (vertex_to_move, color, original_color)
-                
-                # Revert move
-                self.current_solution[vertex_to_move] = original_color
-
-            if best_move:
-                vertex, new_color, old_color = best_move
-                self.current_solution[vertex] = new_color
-                # Add the reverse move to the tabu list
-                self.tabu_list.append((vertex, old_color))
+            if current_conflicts < best_conflicts:
+                self.best_solution = list(coloring)
+                best_conflicts = current_conflicts
+                if self.verbose:
+                    print(f"  Tabu Search new best: {best_conflicts} conflicts")
         
         return self.best_solution, best_conflicts
 
 
 class ColorSwap:
     """
-    A simple Color Swap local search for graph coloring.
-    Swaps colors between vertices to reduce conflicts.
+    Color Swap local search for graph coloring.
+    Swaps the colors of a conflicting vertex and a vertex of another color to
+    reduce conflicts.
+
+    Keeps an n x k table of neighbor-color counts (gamma[v][c] = number of
+    neighbors of v colored c), so the delta of swapping v (color a) and w
+    (color b) is gamma[v][b] - gamma[v][a] + gamma[w][a] - gamma[w][b], minus 2
+    when v and w are adjacent, in O(1). The conflicting edges are kept in an
+    array with a position map for O(1) random sampling; applying a swap only
+    touches the neighborhoods of the two vertices.
+
+    Strategies:
+    - 'first': take the first improving partner in a random scan order
+    - 'best': scan all partners of both endpoints of the conflict in one pass
+      and take the best improving swap
     """
-    def __init__(self, graph, max_iterations=100):
+    STRATEGIES = ("first", "best")
+
+    def __init__(self, graph, max_iterations=100, strategy="first"):
+        """
+        Args:
+            max_iterations (int): Number of sampled conflicts.
+            strategy (str): One of ColorSwap.STRATEGIES.
+        """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown color swap strategy '{strategy}', expected one of {self.STRATEGIES}.")
         self.graph = graph
         self.max_iterations = max_iterations
-
-    def _calculate_conflicts(self, coloring):
-        conflicts = 0
-        for v, neighbors in self.graph.adj.items():
-            for u in neighbors:
-                if v < u and coloring[v] == coloring[u]:
-                    conflicts += 1
-        return conflicts
-
-    def run(self, chromosome):
+        self.strategy = strategy
+        self.neighbors = graph.adjacency_lists()
+        self.neighbor_sets = [set(row) for row in self.neighbors]
+
+    def _swap_delta(self, coloring, gamma, v, w):
+        """Change of the conflict count when v and w exchange their colors."""
+        a, b = coloring[v], coloring[w]
+        delta = gamma[v][b] - gamma[v][a] + gamma[w][a] - gamma[w][b]
+        if w in self.neighbor_sets[v]:
+            delta -= 2
+        return delta
+
+    def _first_improvement(self, coloring, gamma, v1, v2):
+        v = v1 if random.random() < 0.5 else v2
+        color = coloring[v]
+        n = len(coloring)
+        start = random.randrange(n)
+        for i in range(n):
+            w = (start + i) % n
+            if coloring[w] != color and self._swap_delta(coloring, gamma, v, w) < 0:
+                return v, w
+        return None
+
+    def _best_improvement(self, coloring, gamma, v1, v2):
+        best, best_delta, ties = None, 0, 0
+        for v in (v1, v2):
+            color = coloring[v]
+            row = gamma[v]
+            adjacent = self.neighbor_sets[v]
+            for w, other in enumerate(coloring):
+                if other == color:
+                    continue
+                delta = row[other] - row[color] + gamma[w][color] - gamma[w][other]
+                if w in adjacent:
+                    delta -= 2
+                if delta < best_delta:
+                    best, best_delta, ties = (v, w), delta, 1
+                elif delta == best_delta and best is not None:
+                    # Uniform choice among the best swaps
+                    ties += 1
+                    if random.randrange(ties) == 0:
+                        best = (v, w)
+        return best
+
+    def run(self, chromosome, deadline=None, in_place=False):
         """
         Apply color swap local search to improve the chromosome.
+        Stops early when the optional deadline expires; in_place improves the
+        chromosome itself instead of a copy.
         """
-        improved = list(chromosome)
-        current_conflicts = self._calculate_conflicts(improved)
-        
+        improved = chromosome if in_place else list(chromosome)
+        neighbors = self.neighbors
+        num_colors = max(improved) + 1 if improved else 0
+        gamma = [[0] * num_colors for _ in improved]
+        conflicts = []
+        for v, row in enumerate(neighbors):
+            counts = gamma[v]
+            color = improved[v]
+            for u in row:
+                counts[improved[u]] += 1
+                if v < u and color == improved[u]:
+                    conflicts.append((v, u))
+        position = {edge: i for i, edge in enumerate(conflicts)}
+
+        def recolor(v, old, new):
+            improved[v] = new
+            for u in neighbors[v]:
+                counts = gamma[u]
+                counts[old] -= 1
+                counts[new] += 1
+                color = improved[u]
+                edge = (v, u) if v < u else (u, v)
+                if color == old:
+                    i = position.pop(edge)
+                    last = conflicts.pop()
+                    if last != edge:
+                        conflicts[i] = last
+                        position[last] = i
+                elif color == new:
+                    position[edge] = len(conflicts)
+                    conflicts.append(edge)
+
+        search = self._best_improvement if self.strategy == "best" else self._first_improvement
         for iteration in range(self.max_iterations):
-            if current_conflicts == 0:
+            if not conflicts:
                 break
-                
-            # Find a random conflict
-            conflicting_pairs = []
-            for v, neighbors in self.graph.adj.items():
-                for u in neighbors:
-                    if v < u and improved[v] == improved[u]:
-                        conflicting_pairs.append((v, u))
-            
-            if not conflicting_pairs:
+            if deadline is not None and deadline.expired():
                 break
                 
             # Pick a random conflict
-            v1, v2 = random.choice(conflicting_pairs)
-            
-            # Try swapping colors
-            original_v1, original_v2 = improved[v1], improved[v2]
-            improved[v1], improved[v2] = improved[v2], improved[v1]
-            
-            new_conflicts = self._calculate_conflicts(improved)
+            v1, v2 = random.choice(conflicts)
             
             # Keep the swap only if it improves the solution
-            if new_conflicts < current_conflicts:
-                current_conflicts = new_conflicts
-            else:
-                # Revert the swap
-                improved[v1], improved[v2] = original_v1, original_v2
+            move = search(improved, gamma, v1, v2)
+            if move is not None:
+                v, w = move
+                a, b = improved[v], improved[w]
+                recolor(v, a, b)
+                recolor(w, b, a)
         
-        return improved, current_conflicts
+        return improved, len(conflicts)
 
 
 class ConstraintRepair:
     """
     Repairs constraint violations in chromosomes by changing colors of conflicting vertices.
+
+    The conflicting edges are collected once per chromosome and kept in an
+    array with a position map; a recolor only updates the edges of the
+    recolored vertex, and its candidate colors come from a neighbor-color
+    count array, so a repair costs one edge scan plus O(deg + k) per attempt.
     """
     def __init__(self, graph, max_repair_attempts=10):
         self.graph = graph
         self.max_repair_attempts = max_repair_attempts
+        self.neighbors = graph.adjacency_lists()
 
     def _find_conflicts(self, chromosome):
         """Find all conflicting vertex pairs."""
         conflicts = []
-        for v, neighbors in self.graph.adj.items():
+        for v, neighbors in enumerate(self.neighbors):
+            color = chromosome[v]
             for u in neighbors:
-                if v < u and chromosome[v] == chromosome[u]:
+                if v < u and color == chromosome[u]:
                     conflicts.append((v, u))
         return conflicts
 
-    def repair(self, chromosome, num_colors):
+    def repair(self, chromosome, num_colors, in_place=False):
         """
         Attempts to repair constraint violations in the chromosome.
-        Returns the repaired chromosome and number of conflicts remaining.
+        Returns the repaired chromosome and number of conflicts remaining;
+        in_place repairs the chromosome itself instead of a copy.
         """
-        repaired = list(chromosome)
-        attempts = 0
-        
-        while attempts < self.max_repair_attempts:
-            conflicts = self._find_conflicts(repaired)
-            
+        repaired = chromosome if in_place else list(chromosome)
+        conflicts = self._find_conflicts(repaired)
+        position = {edge: i for i, edge in enumerate(conflicts)}
+
+        def remove(edge):
+            i = position.pop(edge)
+            last = conflicts.pop()
+            if last != edge:
+                conflicts[i] = last
+                position[last] = i
+
+        def add(edge):
+            position[edge] = len(conflicts)
+            conflicts.append(edge)
+
+        for _ in range(self.max_repair_attempts):
             if not conflicts:
                 break  # No conflicts, chromosome is valid
                 
@@ -177,27 +319,37 @@ class ConstraintRepair:
             
             # Try to change the color of v1 to resolve the conflict
             original_color = repaired[v1]
+            neighbors = self.neighbors[v1]
             
-            # Find available colors for v1
-            neighbor_colors = set()
-            for neighbor in self.graph.adj[v1]:
-                neighbor_colors.add(repaired[neighbor])
+            # Neighbor colors of v1, counted once for this attempt
+            neighbor_counts = [0] * num_colors
+            for neighbor in neighbors:
+                color = repaired[neighbor]
+                if color < num_colors:
+                    neighbor_counts[color] += 1
             
             # Try to find a color that doesn't conflict with neighbors
             for color in range(num_colors):
-                if color not in neighbor_colors and color != original_color:
-                    repaired[v1] = color
+                if not neighbor_counts[color] and color != original_color:
+                    new_color = color
                     break
             else:
                 # If no good color found, pick a random one
                 available_colors = [c for c in range(num_colors) if c != original_color]
-                if available_colors:
-                    repaired[v1] = random.choice(available_colors)
+                if not available_colors:
+                    continue
+                new_color = random.choice(available_colors)
             
-            attempts += 1
+            # Only the edges of v1 change status
+            repaired[v1] = new_color
+            for neighbor in neighbors:
+                color = repaired[neighbor]
+                if color == original_color:
+                    remove((v1, neighbor) if v1 < neighbor else (neighbor, v1))
+                elif color == new_color:
+                    add((v1, neighbor) if v1 < neighbor else (neighbor, v1))
         
-        final_conflicts = len(self._find_conflicts(repaired))
-        return repaired, final_conflicts
+        return repaired, len(conflicts)
 
 
 class GreedyInitializer:
@@ -245,48 +397,38 @@ class GreedyInitializer:
 class CustomCrossover:
     """
     Custom crossover operator that reduces color conflicts.
+
+    Methods (see crossover_engine.py), all O(n + m) per child:
+    - 'pairwise': conflict-aware exchange of genes between two children
+    - 'uniform': each gene from the parent that conflicts less with the placed neighbors
+    - 'gpx': greedy partition crossover
     """
-    def __init__(self, graph):
+    def __init__(self, graph, method="pairwise", num_colors=None):
+        """
+        Args:
+            method (str): One of CROSSOVER_METHODS.
+            num_colors (int): Number of color classes, required by 'gpx'.
+        """
+        if method not in CROSSOVER_METHODS:
+            raise ValueError(f"Unknown crossover method '{method}', expected one of {CROSSOVER_METHODS}.")
         self.graph = graph
+        self.method = method
+        self.num_colors = num_colors
+        self.neighbors = graph.adjacency_lists()
 
-    def _calculate_conflicts(self, chromosome):
-        """Calculate number of conflicts in a chromosome."""
-        conflicts = 0
-        for v, neighbors in self.graph.adj.items():
-            for u in neighbors:
-                if v < u and chromosome[v] == chromosome[u]:
-                    conflicts += 1
-        return conflicts
-
-    def crossover(self, parent1, parent2):
+    def crossover(self, parent1, parent2, out=None):
         """
         Custom crossover that tries to reduce conflicts.
-        Uses conflict-aware uniform crossover.
+        Returns two children, written into the two rows of out if given.
         """
-        child1 = list(parent1)
-        child2 = list(parent2)
-        
-        # For each position, choose the color that causes fewer conflicts
-        for i in range(len(parent1)):
-            # Test both colors at this position
-            temp1 = child1.copy()
-            temp2 = child2.copy()
-            
-            # Swap colors at position i
-            temp1[i] = parent2[i]
-            temp2[i] = parent1[i]
-            
-            # Calculate conflicts for both options
-            conflicts1 = self._calculate_conflicts(temp1)
-            conflicts2 = self._calculate_conflicts(temp2)
-            
-            # Choose the better option
-            if conflicts1 < conflicts2:
-                child1[i] = parent2[i]
-            else:
-                child2[i] = parent1[i]
-        
-        return child1, child2
+        out1, out2 = (None, None) if out is None else out
+        if self.method == "pairwise":
+            return pairwise_conflict_crossover(self.neighbors, parent1, parent2, out=out)
+        if self.method == "uniform":
+            return (conflict_aware_uniform(self.neighbors, parent1, parent2, out=out1),
+                    conflict_aware_uniform(self.neighbors, parent2, parent1, out=out2))
+        return (gpx(parent1, parent2, self.num_colors, out=out1),
+                gpx(parent2, parent1, self.num_colors, out=out2))
 
 
 class MemeticGA(GeneticAlgorithm):
@@ -295,66 +437,74 @@ class MemeticGA(GeneticAlgorithm):
     Each individual undergoes local search (Tabu Search or Color Swap) after genetic operations.
     """
     def __init__(self, graph, population_size, num_colors, 
-                 local_search_type="tabu", local_search_iterations=50):
-        super().__init__(graph, population_size, num_colors, initializer='mixed')
+                 local_search_type="tabu", local_search_iterations=50, color_swap_strategy="first",
+                 telemetry=None):
+        """
+        Args:
+            color_swap_strategy (str): 'first' or 'best' improvement of the color swap local search.
+        """
+        super().__init__(graph, population_size, num_colors, initializer='mixed', telemetry=telemetry)
         self.local_search_type = local_search_type
         self.local_search_iterations = local_search_iterations
         self.tabu_search = TabuSearch(graph, [], max_iterations=local_search_iterations)
-        self.color_swap = ColorSwap(graph, max_iterations=local_search_iterations)
+        self.color_swap = ColorSwap(graph, max_iterations=local_search_iterations, strategy=color_swap_strategy)
         print(f"🚀 Using Memetic GA: GA + {local_search_type.title()} Local Search")
 
     def _apply_local_search(self, chromosome):
         """
-        Apply local search to improve a single chromosome.
+        Apply local search to improve a single chromosome in place.
         """
         if self.local_search_type == "tabu":
             # For Tabu Search, we need to create a new instance with the current chromosome
             tabu = TabuSearch(
                 self.graph, 
                 chromosome, 
-                max_iterations=self.local_search_iterations
+                max_iterations=self.local_search_iterations,
+                deadline=self.deadline
             )
             improved, conflicts = tabu.run()
-            return improved
+            chromosome[:] = improved
         elif self.local_search_type == "color_swap":
-            improved, conflicts = self.color_swap.run(chromosome)
-            return improved
-        else:
-            return chromosome
+            self.color_swap.run(chromosome, self.deadline, in_place=True)
+        return chromosome
 
     def _run_generation(self):
         """
         Override the generation method to include local search for each individual.
         """
-        # Calculate fitness for all individuals
-        fitness_scores = [(chromo, self._calculate_fitness(chromo)) for chromo in self.population]
-        
-        # Sort by fitness (lower is better)
-        fitness_scores.sort(key=lambda x: x[1][0])
+        telemetry = self.telemetry
+        # Fitness of all individuals is cached in their evaluation states
+        with telemetry.phase("evaluation"):
+            states = self._population_states()
         
         # Get the best individual (for elitism)
-        best_chromosome = fitness_scores[0][0]
+        best_state = min(states, key=lambda state: state.fitness)
         
-        # Create new population
-        new_population = [best_chromosome[:]]  # Elitism
+        # Create new population in the rows of the next buffer
+        new_states = self._next_states()
+        elite = new_states[0].assign(best_state)  # Elitism
         
         # Generate the rest of the population
-        while len(new_population) < self.population_size:
-            parent1 = self._selection()
-            parent2 = self._selection()
-            offspring1, offspring2 = self._crossover(parent1, parent2)
-            offspring1 = self._mutation(offspring1)
-            offspring2 = self._mutation(offspring2)
+        size = self.population_size
+        filled = 1
+        while filled < size:
+            with telemetry.phase("selection"):
+                parent1 = self._selection()
+                parent2 = self._selection()
+            out = self._offspring_rows(new_states, filled)
+            with telemetry.phase("crossover"):
+                offspring1, offspring2 = self._crossover(parent1, parent2, out=out)
+            with telemetry.phase("mutation"):
+                self._mutation(offspring1, in_place=True)
+                self._mutation(offspring2, in_place=True)
             
             # Apply local search to improve offspring
-            offspring1 = self._apply_local_search(offspring1)
-            offspring2 = self._apply_local_search(offspring2)
-            
-            new_population.append(offspring1)
-            if len(new_population) < self.population_size:
-                new_population.append(offspring2)
+            with telemetry.phase("local_search"):
+                self._apply_local_search(offspring1)
+                self._apply_local_search(offspring2)
+            filled += 2
                 
-        return new_population
+        return self._swap_rows(elite)
 
 
 class GAAdaptiveRepair(GeneticAlgorithm):
@@ -364,37 +514,25 @@ class GAAdaptiveRepair(GeneticAlgorithm):
     - Adjusts mutation rate based on population diversity
     """
     def __init__(self, graph, population_size, num_colors, 
-                 base_mutation_rate=0.1, diversity_threshold=0.3):
-        super().__init__(graph, population_size, num_colors, initializer='mixed')
+                 base_mutation_rate=0.1, diversity_threshold=0.3, diversity_metric="hamming", telemetry=None):
+        """
+        Args:
+            diversity_metric (str): 'hamming', 'entropy' or 'sampled' (see diversity.py).
+        """
+        super().__init__(graph, population_size, num_colors, initializer='mixed', telemetry=telemetry)
         self.base_mutation_rate = base_mutation_rate
         self.diversity_threshold = diversity_threshold
+        self.diversity = PopulationDiversity(diversity_metric)
         self.constraint_repair = ConstraintRepair(graph)
+        self._generation = 0
         print("🚀 Using Hybrid Algorithm: GA + Constraint Repair + Adaptive Parameters")
 
     def _calculate_population_diversity(self):
         """
-        Calculate population diversity based on average Hamming distance.
+        Diversity of the current population, computed once per generation from
+        per-locus color counts (O(pop * n)) and cached for all its offspring.
         """
-        if len(self.population) < 2:
-            return 0.0
-        
-        total_distance = 0
-        comparisons = 0
-        
-        for i in range(len(self.population)):
-            for j in range(i + 1, len(self.population)):
-                distance = sum(1 for a, b in zip(self.population[i], self.population[j]) if a != b)
-                total_distance += distance
-                comparisons += 1
-        
-        if comparisons == 0:
-            return 0.0
-            
-        avg_distance = total_distance / comparisons
-        max_possible_distance = len(self.population[0])
-        diversity = avg_distance / max_possible_distance
-        
-        return diversity
+        return self.diversity.measure(self.population, key=self._generation)
 
     def _adaptive_mutation_rate(self):
         """
@@ -415,53 +553,57 @@ class GAAdaptiveRepair(GeneticAlgorithm):
 
     def _mutation_with_repair(self, chromosome):
         """
-        Apply mutation and then repair constraints.
+        Apply mutation and then repair constraints, both in place.
         """
-        # Get adaptive mutation rate
-        mutation_rate = self._adaptive_mutation_rate()
-        
-        # Apply mutation
-        mutated = list(chromosome)
-        for i in range(len(mutated)):
-            if random.random() < mutation_rate:
-                mutated[i] = random.randint(0, self.num_colors - 1)
+        with self.telemetry.phase("mutation"):
+            # Get adaptive mutation rate
+            mutation_rate = self._adaptive_mutation_rate()
+            
+            # Apply mutation
+            for i in range(len(chromosome)):
+                if random.random() < mutation_rate:
+                    chromosome[i] = random.randint(0, self.num_colors - 1)
         
         # Repair constraints
-        repaired, conflicts = self.constraint_repair.repair(mutated, self.num_colors)
+        with self.telemetry.phase("local_search"):
+            self.constraint_repair.repair(chromosome, self.num_colors, in_place=True)
         
-        return repaired
+        return chromosome
 
     def _run_generation(self):
         """
         Override the generation method to use adaptive mutation with repair.
         """
-        # Calculate fitness for all individuals
-        fitness_scores = [(chromo, self._calculate_fitness(chromo)) for chromo in self.population]
-        
-        # Sort by fitness (lower is better)
-        fitness_scores.sort(key=lambda x: x[1][0])
+        telemetry = self.telemetry
+        self._generation += 1  # New parent population, diversity is measured again
+        # Fitness of all individuals is cached in their evaluation states
+        with telemetry.phase("evaluation"):
+            states = self._population_states()
         
         # Get the best individual (for elitism)
-        best_chromosome = fitness_scores[0][0]
+        best_state = min(states, key=lambda state: state.fitness)
         
-        # Create new population
-        new_population = [best_chromosome[:]]  # Elitism
+        # Create new population in the rows of the next buffer
+        new_states = self._next_states()
+        elite = new_states[0].assign(best_state)  # Elitism
         
         # Generate the rest of the population
-        while len(new_population) < self.population_size:
-            parent1 = self._selection()
-            parent2 = self._selection()
-            offspring1, offspring2 = self._crossover(parent1, parent2)
+        size = self.population_size
+        filled = 1
+        while filled < size:
+            with telemetry.phase("selection"):
+                parent1 = self._selection()
+                parent2 = self._selection()
+            out = self._offspring_rows(new_states, filled)
+            with telemetry.phase("crossover"):
+                offspring1, offspring2 = self._crossover(parent1, parent2, out=out)
             
             # Use adaptive mutation with repair
-            offspring1 = self._mutation_with_repair(offspring1)
-            offspring2 = self._mutation_with_repair(offspring2)
-            
-            new_population.append(offspring1)
-            if len(new_population) < self.population_size:
-                new_population.append(offspring2)
+            self._mutation_with_repair(offspring1)
+            self._mutation_with_repair(offspring2)
+            filled += 2
                 
-        return new_population
+        return self._swap_rows(elite)
 
 
 class GAGreedyCustomCrossover(GeneticAlgorithm):
@@ -472,19 +614,24 @@ class GAGreedyCustomCrossover(GeneticAlgorithm):
     - Local search supported mutation
     """
     def __init__(self, graph, population_size, num_colors, 
-                 local_search_iterations=30):
-        # Override initialization to use greedy
-        self.graph = graph
-        self.population_size = population_size
-        self.num_colors = num_colors
+                 local_search_iterations=30, crossover="pairwise", color_swap_strategy="first",
+                 telemetry=None):
+        """
+        Args:
+            crossover (str): Method of the custom crossover, one of CROSSOVER_METHODS.
+            color_swap_strategy (str): 'first' or 'best' improvement of the color swap local search.
+        """
+        # Override initialization to use greedy: the base state is set up
+        # first, the population once the greedy initializer exists
+        self._init_state(graph, population_size, num_colors, telemetry=telemetry)
         
         # Initialize components
         self.greedy_initializer = GreedyInitializer(graph)
-        self.custom_crossover = CustomCrossover(graph)
-        self.color_swap = ColorSwap(graph, max_iterations=local_search_iterations)
+        self.custom_crossover = CustomCrossover(graph, crossover, num_colors)
+        self.color_swap = ColorSwap(graph, max_iterations=local_search_iterations, strategy=color_swap_strategy)
         
         # Initialize population with greedy algorithm
-        self._initialize_population()
+        self.population = self._initialize_population()
         
         print("🚀 Using Hybrid Algorithm: GA + Greedy + Custom Crossover")
 
@@ -492,11 +639,11 @@ class GAGreedyCustomCrossover(GeneticAlgorithm):
         """
         Initialize population using greedy algorithm and some random individuals.
         """
-        self.population = []
+        population = []
         
         # Add greedy solution
         greedy_solution, greedy_colors = self.greedy_initializer.greedy_coloring()
-        self.population.append(greedy_solution)
+        population.append(greedy_solution)
         
         # Add some variations of greedy solution
         for _ in range(min(5, self.population_size // 2)):
@@ -505,84 +652,100 @@ class GAGreedyCustomCrossover(GeneticAlgorithm):
             for i in range(len(variation)):
                 if random.random() < 0.1:  # 10% chance to change
                     variation[i] = random.randint(0, self.num_colors - 1)
-            self.population.append(variation)
+            population.append(variation)
         
         # Fill the rest with random individuals
-        while len(self.population) < self.population_size:
+        while len(population) < self.population_size:
             individual = [random.randint(0, self.num_colors - 1) for _ in range(len(self.graph.adj))]
-            self.population.append(individual)
+            population.append(individual)
+        return population
 
-    def _custom_crossover(self, parent1, parent2):
+    def _custom_crossover(self, parent1, parent2, out=None):
         """
         Use custom crossover that reduces conflicts.
         """
-        return self.custom_crossover.crossover(parent1, parent2)
+        return self.custom_crossover.crossover(parent1, parent2, out=out)
 
     def _mutation_with_local_search(self, chromosome):
         """
-        Apply mutation and then improve with local search.
+        Apply mutation and then improve with local search, both in place.
         """
         # Apply standard mutation
-        mutated = list(chromosome)
-        for i in range(len(mutated)):
-            if random.random() < 0.1:  # 10% mutation rate
-                mutated[i] = random.randint(0, self.num_colors - 1)
+        with self.telemetry.phase("mutation"):
+            for i in range(len(chromosome)):
+                if random.random() < 0.1:  # 10% mutation rate
+                    chromosome[i] = random.randint(0, self.num_colors - 1)
         
         # Apply local search to improve
-        improved, conflicts = self.color_swap.run(mutated)
+        with self.telemetry.phase("local_search"):
+            self.color_swap.run(chromosome, self.deadline, in_place=True)
         
-        return improved
+        return chromosome
 
     def _run_generation(self):
         """
         Override the generation method to use custom crossover and local search.
         """
-        # Calculate fitness for all individuals
-        fitness_scores = [(chromo, self._calculate_fitness(chromo)) for chromo in self.population]
-        
-        # Sort by fitness (lower is better)
-        fitness_scores.sort(key=lambda x: x[1][0])
+        telemetry = self.telemetry
+        # Fitness of all individuals is cached in their evaluation states
+        with telemetry.phase("evaluation"):
+            states = self._population_states()
         
         # Get the best individual (for elitism)
-        best_chromosome = fitness_scores[0][0]
+        best_state = min(states, key=lambda state: state.fitness)
         
-        # Create new population
-        new_population = [best_chromosome[:]]  # Elitism
+        # Create new population in the rows of the next buffer
+        new_states = self._next_states()
+        elite = new_states[0].assign(best_state)  # Elitism
         
         # Generate the rest of the population
-        while len(new_population) < self.population_size:
-            parent1 = self._selection()
-            parent2 = self._selection()
+        size = self.population_size
+        filled = 1
+        while filled < size:
+            with telemetry.phase("selection"):
+                parent1 = self._selection()
+                parent2 = self._selection()
+            out = self._offspring_rows(new_states, filled)
             
             # Use custom crossover
-            offspring1, offspring2 = self._custom_crossover(parent1, parent2)
+            with telemetry.phase("crossover"):
+                offspring1, offspring2 = self._custom_crossover(parent1, parent2, out=out)
             
             # Use mutation with local search
-            offspring1 = self._mutation_with_local_search(offspring1)
-            offspring2 = self._mutation_with_local_search(offspring2)
-            
-            new_population.append(offspring1)
-            if len(new_population) < self.population_size:
-                new_population.append(offspring2)
+            self._mutation_with_local_search(offspring1)
+            self._mutation_with_local_search(offspring2)
+            filled += 2
                 
-        return new_population
+        return self._swap_rows(elite)
 
 
 class GATabuSearch(GeneticAlgorithm):
     """
     Hybrid GA that uses DSATUR for initialization and Tabu Search to
     improve the best individual at the end of the run.
+
+    Under a time-limited deadline the GA phase gets ga_time_share of the
+    remaining time (a child Deadline) and the Tabu Search runs on the rest
+    until the deadline expires, instead of tabu_iterations iterations.
     """
-    def __init__(self, graph, population_size, num_colors, tabu_iterations=100, tabu_tenure=10):
+    def __init__(self, graph, population_size, num_colors, tabu_iterations=100, tabu_tenure=10,
+                 ga_time_share=0.5, telemetry=None):
+        """
+        Args:
+            ga_time_share (float): Fraction of a time-limited deadline given to the GA phase.
+        """
         # This approach always initializes with DSATUR
-        super().__init__(graph, population_size, num_colors, initializer='dsatur')
+        super().__init__(graph, population_size, num_colors, initializer='dsatur', telemetry=telemetry)
         self.tabu_iterations = tabu_iterations
         self.tabu_tenure = tabu_tenure
+        self.ga_time_share = ga_time_share
         print("🚀 Using Hybrid Algorithm: GA + DSATUR + Tabu Search")
 
-    def run(self, generations=100):
+    def run(self, generations=100, deadline=None, incumbent=None, target=0):
         # 1. Run standard GA with DSATUR initialization
-        super().run(generations)
+        timed = deadline is not None and deadline.end is not None
+        ga_deadline = Deadline(deadline.remaining() * self.ga_time_share, parent=deadline) if timed else deadline
+        super().run(generations, deadline=ga_deadline, incumbent=incumbent, target=target)
 
         # 2. Improve the best individual with Tabu Search
         print("\n--- Starting Tabu Search post-processing ---")
@@ -591,18 +754,33 @@ class GATabuSearch(GeneticAlgorithm):
         
         print(f"Best GA solution has {initial_conflicts} conflicts. Applying Tabu Search...")
 
-        if initial_conflicts == 0:
-            print("GA already found a valid solution. No need for Tabu Search.")
+        if initial_conflicts <= target:
+            print("GA already reached the target. No need for Tabu Search.")
             return self.best_chromosome, self.best_fitness, self.best_conflicts, self.best_colors_used
 
-        tabu_search = TabuSearch(
-            graph=self.graph,
-            initial_coloring=best_ga_solution,
-            max_iterations=self.tabu_iterations,
-            tabu_tenure=self.tabu_tenure
-        )
-        
-        ts_solution, ts_conflicts = tabu_search.run()
+        telemetry = self.telemetry
+        post_start = telemetry.elapsed()
+        with telemetry.phase("local_search"):
+            tabu_search = TabuSearch(
+                graph=self.graph,
+                initial_coloring=best_ga_solution,
+                # With a time limit the rest of the budget bounds the search
+                max_iterations=sys.maxsize if timed else self.tabu_iterations,
+                tabu_tenure=self.tabu_tenure,
+                deadline=deadline
+            )
+            ts_solution, ts_conflicts = tabu_search.run()
+        # The GA run is already closed; the post-processing gets its own event
+        post_seconds = telemetry.elapsed() - post_start
+        self.runtime_seconds += post_seconds
+        telemetry.emit({
+            "event": "post_processing",
+            "method": "tabu_search",
+            "local_search_seconds": post_seconds,
+            "conflicts_before": initial_conflicts,
+            "conflicts_after": ts_conflicts,
+            "runtime_seconds": self.runtime_seconds
+        })
 
         print(f"Tabu Search finished. Final conflicts: {ts_conflicts}")
 
@@ -613,6 +791,8 @@ class GATabuSearch(GeneticAlgorithm):
             self.best_colors_used = len(set(ts_solution))
             # Recalculate fitness
             self.best_fitness, _ = self._calculate_fitness(ts_solution)
+            if incumbent is not None:
+                incumbent.offer(ts_solution, ts_conflicts, self.best_colors_used)
         else:
             print("Tabu Search did not improve the GA solution.")
 
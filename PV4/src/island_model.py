@@ -0,0 +1,230 @@
+import io
+import os
+import time
+import random
+import contextlib
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+from utils import parse_dimacs_graph
+from base_genetic_algorithm import GeneticAlgorithm
+
+TOPOLOGIES = ("ring", "full", "random")
+
+
+def migration_sources(topology, num_islands, epoch, seed):
+    """
+    Returns, for every island, the islands it receives migrants from.
+
+    The random topology draws one source per island from an RNG seeded with
+    (seed, epoch), so every process computes the same mapping.
+
+    Args:
+        topology (str): 'ring', 'full' or 'random'.
+        num_islands (int): Number of islands.
+        epoch (int): Index of the migration.
+        seed (int): Seed of the island run.
+
+    Returns:
+        list: sources[i] is a list of island indices.
+    """
+    if topology == "ring":
+        return [[(i - 1) % num_islands] for i in range(num_islands)]
+    if topology == "full":
+        return [[j for j in range(num_islands) if j != i] for i in range(num_islands)]
+    if topology == "random":
+        rng = random.Random(seed * 1_000_003 + epoch)
+        return [[rng.choice([j for j in range(num_islands) if j != i])] for i in range(num_islands)]
+    raise ValueError(f"Unknown topology '{topology}', expected one of {TOPOLOGIES}.")
+
+
+def _attach(name, shape, dtype):
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _accept_migrants(ga, migrants):
+    """
+    Replaces the worst individuals of an island with the migrants.
+    The island's best individual is never replaced.
+    """
+    states = ga._population_states()
+    worst_first = sorted(range(len(states)), key=lambda i: states[i].fitness, reverse=True)
+    for i, migrant in zip(worst_first[:len(states) - 1], migrants):
+        ga.population[i] = migrant
+
+
+def _island_worker(island, config, barrier, names):
+    """
+    Evolves one island and exchanges migrants through the shared buffers.
+    """
+    num_islands = config["num_islands"]
+    n = config["num_vertices"]
+    migration_size = config["migration_size"]
+    segments = []
+    try:
+        shm, migrants = _attach(names["migrants"], (num_islands, migration_size, n), np.int32)
+        segments.append(shm)
+        shm, best = _attach(names["best"], (num_islands, n), np.int32)
+        segments.append(shm)
+        shm, stats = _attach(names["stats"], (num_islands, 3), np.float64)
+        segments.append(shm)
+
+        graph = parse_dimacs_graph(config["file_path"])
+        random.seed(config["seed"] + island)
+        with contextlib.redirect_stdout(io.StringIO()):
+            ga = config["ga_class"](graph, config["population_size"], config["num_colors"], **config["ga_kwargs"])
+
+        best_state = None
+        generation = 0
+        epoch = 0
+        while generation < config["generations"]:
+            steps = min(config["migration_interval"], config["generations"] - generation)
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(steps):
+                    ga.population = ga._run_generation()
+                    current = min(ga._population_states(), key=lambda state: state.fitness)
+                    if best_state is None or current.fitness < best_state.fitness:
+                        best_state = current.copy()
+                    if best_state.conflicts == 0:
+                        break
+            generation += steps
+
+            # Publish the island's best and its top individuals
+            states = sorted(ga._population_states(), key=lambda state: state.fitness)
+            for slot in range(migration_size):
+                migrants[island, slot] = states[slot % len(states)].chromosome
+            stats[island] = (best_state.fitness, best_state.conflicts, best_state.colors_used)
+            barrier.wait()
+
+            if island == 0 and config["verbose"]:
+                print(f"Epoch {epoch:3d} (generation {generation:4d}): "
+                      f"island best fitness = {[int(f) for f in stats[:, 0]]}")
+            # Every island sees the same stats after the barrier, so all stop together
+            if generation >= config["generations"] or (stats[:, 1] == 0).any():
+                break
+
+            incoming = []
+            for source in migration_sources(config["topology"], num_islands, epoch, config["seed"])[island]:
+                incoming.extend(migrants[source].tolist())
+            # Nobody may overwrite the buffer before every island has read it
+            barrier.wait()
+            _accept_migrants(ga, incoming)
+            epoch += 1
+
+        best[island] = best_state.chromosome
+        stats[island] = (best_state.fitness, best_state.conflicts, best_state.colors_used)
+    except BaseException:
+        barrier.abort()
+        raise
+    finally:
+        for shm in segments:
+            shm.close()
+
+
+def run_island_model(file_path, num_islands=4, population_size=50, num_colors=10, generations=500,
+                     ga_class=GeneticAlgorithm, ga_kwargs=None, migration_interval=10, migration_size=2,
+                     topology="ring", seed=42, verbose=True):
+    """
+    Runs an island-model GA with one process per island.
+
+    Every island is an independent GeneticAlgorithm (or hybrid subclass)
+    population seeded with seed + island index. Every migration_interval
+    generations the islands synchronize, write their top migration_size
+    individuals into a shared-memory buffer, and replace their worst
+    individuals with the migrants of their source islands. Because islands
+    only interact at these barriers, the result depends only on the seed.
+
+    Args:
+        file_path (str): The graph file, loaded once in each island process.
+        num_islands (int): Number of islands (processes).
+        population_size (int): Population size of each island.
+        num_colors (int): The number of available colors (k).
+        generations (int): Generations evolved by each island.
+        ga_class (type): GeneticAlgorithm or one of the hybrid subclasses.
+        ga_kwargs (dict): Extra constructor arguments of ga_class.
+        migration_interval (int): Generations between two migrations.
+        migration_size (int): Individuals sent by each island per migration.
+        topology (str): 'ring', 'full' or 'random'.
+        seed (int): Base random seed.
+        verbose (bool): Print the best fitness of every island at each migration.
+
+    Returns:
+        dict: best_chromosome, best_fitness, best_conflicts, best_colors_used,
+            best_island, island_fitness (best fitness of every island) and time.
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown topology '{topology}', expected one of {TOPOLOGIES}.")
+    if num_islands < 2:
+        raise ValueError("The island model needs at least two islands.")
+
+    start_time = time.time()
+    num_vertices = parse_dimacs_graph(file_path).num_vertices
+    config = {
+        "file_path": file_path,
+        "num_islands": num_islands,
+        "num_vertices": num_vertices,
+        "population_size": population_size,
+        "num_colors": num_colors,
+        "generations": generations,
+        "ga_class": ga_class,
+        "ga_kwargs": ga_kwargs or {},
+        "migration_interval": max(1, migration_interval),
+        "migration_size": max(1, min(migration_size, population_size - 1)),
+        "topology": topology,
+        "seed": seed,
+        "verbose": verbose,
+    }
+
+    sizes = {
+        "migrants": num_islands * config["migration_size"] * num_vertices * 4,
+        "best": num_islands * num_vertices * 4,
+        "stats": num_islands * 3 * 8,
+    }
+    segments = {key: shared_memory.SharedMemory(create=True, size=max(1, size)) for key, size in sizes.items()}
+    try:
+        names = {key: shm.name for key, shm in segments.items()}
+        barrier = mp.Barrier(num_islands)
+        workers = [mp.Process(target=_island_worker, args=(island, config, barrier, names))
+                   for island in range(num_islands)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        failed = [i for i, worker in enumerate(workers) if worker.exitcode != 0]
+        if failed:
+            raise RuntimeError(f"Island processes {failed} failed.")
+
+        best = np.ndarray((num_islands, num_vertices), dtype=np.int32, buffer=segments["best"].buf)
+        stats = np.ndarray((num_islands, 3), dtype=np.float64, buffer=segments["stats"].buf)
+        best_island = int(np.argmin(stats[:, 0]))
+        result = {
+            "best_chromosome": best[best_island].tolist(),
+            "best_fitness": stats[best_island, 0].item(),
+            "best_conflicts": int(stats[best_island, 1]),
+            "best_colors_used": int(stats[best_island, 2]),
+            "best_island": best_island,
+            "island_fitness": stats[:, 0].tolist(),
+            "time": time.time() - start_time,
+        }
+        del best, stats
+    finally:
+        for shm in segments.values():
+            shm.close()
+            shm.unlink()
+    return result
+
+
+if __name__ == "__main__":
+    file_name = "gc_500_9.txt"
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(base_dir, "..", "data", file_name)
+
+    result = run_island_model(file_path, num_islands=os.cpu_count() or 4, population_size=50,
+                              num_colors=60, generations=300, topology="ring")
+    print("\n" + "=" * 50)
+    print(f"Best island: {result['best_island']}")
+    print(f"Best Fitness: {result['best_fitness']:.2f}")
+    print(f"Conflicts: {result['best_conflicts']}")
+    print(f"Colors Used: {result['best_colors_used']}")
+    print(f"Time: {result['time']:.2f}s")
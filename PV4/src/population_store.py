@@ -0,0 +1,64 @@
+class PopulationStore:
+    """
+    Double-buffered population of fixed-width integer rows.
+
+    Two buffers (current and next) of population_size rows, each with its
+    fitness vector, are allocated once. A generation reads the current buffer,
+    writes its offspring in place into the rows of the next buffer and then
+    calls swap(), so the rows of a buffer are reused every other generation
+    instead of allocating a new list per individual. A row that must outlive
+    the generation after next (e.g. the best solution) has to be copied.
+    """
+    def __init__(self, population_size, width):
+        """
+        Args:
+            population_size (int): Rows per buffer.
+            width (int): Genes per row (the number of vertices).
+        """
+        self.population_size = population_size
+        self.width = width
+        self.buffers = [[[0] * width for _ in range(population_size)] for _ in range(2)]
+        self.fitness_buffers = [[0] * population_size for _ in range(2)]
+        self.order = list(range(population_size))
+        self.current = 0
+
+    @property
+    def rows(self):
+        """Rows of the current buffer."""
+        return self.buffers[self.current]
+
+    @property
+    def next_rows(self):
+        """Rows of the next buffer, written by the generation being built."""
+        return self.buffers[1 - self.current]
+
+    @property
+    def fitness(self):
+        """Fitness vector of the current buffer."""
+        return self.fitness_buffers[self.current]
+
+    def load(self, population):
+        """
+        Copies chromosomes into the rows of the current buffer.
+
+        Returns:
+            list: The rows of the current buffer.
+        """
+        rows = self.rows
+        for row, chromosome in zip(rows, population):
+            row[:] = chromosome
+        return rows
+
+    def ranking(self):
+        """
+        Indices of the current buffer sorted by fitness (lowest first).
+
+        The index list is reused and sorted in place; since the ranking of the
+        previous generation is mostly preserved, the sort is close to linear.
+        """
+        self.order.sort(key=self.fitness.__getitem__)
+        return self.order
+
+    def swap(self):
+        """Makes the next buffer the current one."""
+        self.current = 1 - self.current
@@ -0,0 +1,113 @@
+import heapq
+import random
+from itertools import accumulate
+
+SELECTION_METHODS = ("tournament", "sus", "rank", "truncation")
+
+
+def tournament_indices(fitness, count, tournament_size=3, rng=random):
+    """
+    Draws count tournament winners from a fitness vector (lower is better).
+
+    The contestants of a tournament are distinct (sampled without replacement,
+    like random.sample tournaments); a generation costs O(count * tournament_size)
+    and never copies the population.
+
+    Args:
+        fitness (list): Fitness of every individual, computed once per generation.
+        count (int): Number of parents to select.
+        tournament_size (int): Number of contestants per tournament.
+        rng: random.Random-compatible generator (default: the random module).
+
+    Returns:
+        list: Indices of the selected individuals.
+    """
+    size = len(fitness)
+    tournament_size = max(1, min(tournament_size, size))
+    contestants = range(size)
+    sample = rng.sample
+    key = fitness.__getitem__
+    return [min(sample(contestants, tournament_size), key=key) for _ in range(count)]
+
+
+def _universal_sampling(weights, count, rng):
+    """
+    Stochastic universal sampling: count equally spaced pointers over the
+    cumulative weights, one random offset. O(len(weights) + count).
+    """
+    cumulative = list(accumulate(weights))
+    total = cumulative[-1]
+    if total <= 0:
+        return [int(rng.random() * len(weights)) for _ in range(count)]
+    step = total / count
+    pointer = rng.random() * step
+    selected = []
+    i = 0
+    for _ in range(count):
+        while cumulative[i] < pointer and i < len(cumulative) - 1:
+            i += 1
+        selected.append(i)
+        pointer += step
+    # Pointers follow the population order; shuffle so consecutive parents are not neighbors
+    rng.shuffle(selected)
+    return selected
+
+
+def stochastic_universal_indices(fitness, count, rng=random):
+    """
+    Stochastic universal sampling on a fitness vector (lower is better).
+
+    The weight of an individual is (worst fitness - its fitness) + 1, so the
+    worst individual keeps a small chance and better ones get proportionally more.
+    """
+    worst = max(fitness)
+    return _universal_sampling([worst - f + 1 for f in fitness], count, rng)
+
+
+def rank_indices(fitness, count, rng=random, pressure=1.5):
+    """
+    Linear ranking selection sampled with SUS.
+
+    Args:
+        pressure (float): Expected number of copies of the best individual (1..2).
+    """
+    size = len(fitness)
+    order = sorted(range(size), key=fitness.__getitem__)
+    if size == 1:
+        return [order[0]] * count
+    weights = [pressure - (2 * pressure - 2) * rank / (size - 1) for rank in range(size)]
+    return [order[i] for i in _universal_sampling(weights, count, rng)]
+
+
+def truncation_indices(fitness, count, rng=random, ratio=0.5):
+    """
+    Truncation selection: parents are drawn uniformly from the best ratio of the population.
+    """
+    size = max(1, int(len(fitness) * ratio))
+    best = heapq.nsmallest(size, range(len(fitness)), key=fitness.__getitem__)
+    return rng.choices(best, k=count)
+
+
+def select_indices(method, fitness, count, rng=random, tournament_size=3):
+    """
+    Draws count parent indices with one of SELECTION_METHODS.
+
+    Args:
+        method (str): 'tournament', 'sus', 'rank' or 'truncation'.
+        fitness (list): Fitness of every individual (lower is better).
+        count (int): Number of parents to select.
+        rng: random.Random-compatible generator.
+        tournament_size (int): Used by tournament selection.
+
+    Returns:
+        list: Indices of the selected individuals.
+    """
+    if method == "tournament":
+        return tournament_indices(fitness, count, tournament_size, rng)
+    if method == "sus":
+        return stochastic_universal_indices(fitness, count, rng)
+    if method == "rank":
+        return rank_indices(fitness, count, rng)
+    if method == "truncation":
+        return truncation_indices(fitness, count, rng)
+    raise ValueError(f"Unknown selection method '{method}', expected one of {SELECTION_METHODS}.")
@@ -0,0 +1,209 @@
+import csv
+import json
+import time
+
+PHASES = ("evaluation", "selection", "crossover", "mutation", "local_search")
+
+GENERATION_FIELDS = (
+    ["generation", "elapsed", "generation_seconds"]
+    + [f"{phase}_seconds" for phase in PHASES]
+    + ["evaluations", "cache_hits", "cache_misses", "best_fitness", "mean_fitness", "best_conflicts", "best_colors"]
+)
+
+
+class _PhaseTimer:
+    """
+    Context manager adding the wall time of a block to one phase of the current generation.
+    """
+    __slots__ = ("totals", "name", "start")
+
+    def __init__(self, totals, name):
+        self.totals = totals
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.totals[self.name] += time.perf_counter() - self.start
+        return False
+
+
+class RunTelemetry:
+    """
+    Per-generation instrumentation of a GA run.
+
+    The GA wraps its phases in `with telemetry.phase(name):` blocks and reports
+    the end of every generation; the telemetry turns this into a stream of
+    events (plain dicts) passed to every listener:
+
+        {"event": "run_start", ...run parameters}
+        {"event": "generation", "generation", "elapsed", "generation_seconds",
+         "<phase>_seconds" for every phase in PHASES, "evaluations",
+         "cache_hits", "cache_misses", "best_fitness", "mean_fitness",
+         "best_conflicts", "best_colors"}
+        {"event": "run_end", "runtime_seconds", "generations", "<phase>_seconds", ...}
+
+    Evaluation and cache counts are per generation. Listeners are any callables
+    taking an event, e.g. JsonlWriter, CsvWriter or a user callback.
+    """
+    def __init__(self, *listeners, keep_events=True):
+        """
+        Args:
+            *listeners (callable): Receive every event as it is emitted.
+            keep_events (bool): Also keep the events in self.events.
+        """
+        self.listeners = list(listeners)
+        self.keep_events = keep_events
+        self.events = []
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        self._timers = {phase: _PhaseTimer(self.current, phase) for phase in PHASES}
+        self.start_time = None
+        self._generation_start = None
+        self._evaluations = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self.generations = 0
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def phase(self, name):
+        """
+        Returns the timer of a phase, used as `with telemetry.phase("crossover"):`.
+        """
+        return self._timers[name]
+
+    def elapsed(self):
+        """Seconds since start_run (0 before the run started)."""
+        if self.start_time is None:
+            return 0.0
+        return time.perf_counter() - self.start_time
+
+    def emit(self, event):
+        """
+        Sends an event to the listeners (and keeps it if keep_events is set).
+        """
+        if self.keep_events:
+            self.events.append(event)
+        for listener in self.listeners:
+            listener(event)
+
+    def _counters(self, evaluator):
+        if evaluator is None:
+            return 0, 0, 0
+        cache = evaluator.cache
+        if cache is None:
+            return evaluator.full_evaluations, 0, 0
+        return evaluator.full_evaluations, cache.hits, cache.misses
+
+    def start_run(self, evaluator=None, **info):
+        """
+        Starts the clock and emits the run_start event.
+
+        Args:
+            evaluator (ConflictEvaluator): Source of the evaluation and cache counters.
+            **info: Run parameters copied into the event.
+        """
+        self.start_time = time.perf_counter()
+        self._generation_start = self.start_time
+        self._evaluations, self._cache_hits, self._cache_misses = self._counters(evaluator)
+        self.generations = 0
+        for totals in (self.current, self.totals):
+            for phase in PHASES:
+                totals[phase] = 0.0
+        self.emit(dict(event="run_start", **info))
+
+    def end_generation(self, generation, states, evaluator=None):
+        """
+        Closes a generation and emits its event.
+
+        Args:
+            generation (int): Index of the generation.
+            states (list): ConflictStates of the new population.
+            evaluator (ConflictEvaluator): Source of the evaluation and cache counters.
+
+        Returns:
+            dict: The generation event.
+        """
+        now = time.perf_counter()
+        evaluations, cache_hits, cache_misses = self._counters(evaluator)
+        best = min(states, key=lambda state: state.fitness)
+        event = {
+            "event": "generation",
+            "generation": generation,
+            "elapsed": now - self.start_time,
+            "generation_seconds": now - self._generation_start,
+        }
+        for phase in PHASES:
+            event[f"{phase}_seconds"] = self.current[phase]
+            self.totals[phase] += self.current[phase]
+            self.current[phase] = 0.0
+        event.update(
+            evaluations=evaluations - self._evaluations,
+            cache_hits=cache_hits - self._cache_hits,
+            cache_misses=cache_misses - self._cache_misses,
+            best_fitness=best.fitness,
+            mean_fitness=sum(state.fitness for state in states) / len(states),
+            best_conflicts=best.conflicts,
+            best_colors=best.colors_used,
+        )
+        self._evaluations, self._cache_hits, self._cache_misses = evaluations, cache_hits, cache_misses
+        self._generation_start = now
+        self.generations += 1
+        self.emit(event)
+        return event
+
+    def end_run(self, **summary):
+        """
+        Emits the run_end event with the total runtime and time per phase.
+
+        Returns:
+            float: The runtime of the run in seconds.
+        """
+        runtime = self.elapsed()
+        event = {"event": "run_end", "runtime_seconds": runtime, "generations": self.generations}
+        for phase in PHASES:
+            # Phases timed after the last generation (e.g. post-processing) are included
+            event[f"{phase}_seconds"] = self.totals[phase] + self.current[phase]
+        event.update(summary)
+        self.emit(event)
+        return runtime
+
+
+class JsonlWriter:
+    """
+    Listener writing every event as one JSON line.
+    """
+    def __init__(self, path):
+        self.file = open(path, "w", encoding="utf-8")
+
+    def __call__(self, event):
+        self.file.write(json.dumps(event) + "\n")
+        if event["event"] == "run_end":
+            self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class CsvWriter:
+    """
+    Listener writing the generation events as CSV rows (one row per generation).
+    """
+    def __init__(self, path):
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.writer = csv.DictWriter(self.file, fieldnames=GENERATION_FIELDS, extrasaction="ignore")
+        self.writer.writeheader()
+
+    def __call__(self, event):
+        if event["event"] == "generation":
+            self.writer.writerow(event)
+        elif event["event"] == "run_end":
+            self.file.flush()
+
+    def close(self):
+        self.file.close()
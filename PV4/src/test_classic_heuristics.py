@@ -4,6 +4,7 @@ import csv
 from datetime import datetime
 from utils import parse_dimacs_graph
 from initializers import dsatur_initializer, greedy_initializer
+from dsatur_engine import dsatur
 from base_genetic_algorithm import GeneticAlgorithm
 
 def test_heuristic_on_graph(graph, heuristic_name, heuristic_func, max_colors=15):
@@ -56,38 +57,8 @@ def dsatur_classic(graph):
     Classic DSATUR algorithm without color limits.
     Returns the coloring and the number of colors used.
     """
-    n = graph.num_vertices
-    colors = [-1] * n
-    saturation = [0] * n
-    degrees = [len(graph.adj[v]) for v in range(n)]
-    uncolored = set(range(n))
-    max_color_used = -1
-
-    while uncolored:
-        # Select vertex with highest saturation, break ties by degree
-        max_sat = max(saturation[v] for v in uncolored)
-        candidates = [v for v in uncolored if saturation[v] == max_sat]
-        if len(candidates) > 1:
-            v = max(candidates, key=lambda x: degrees[x])
-        else:
-            v = candidates[0]
-        
-        # Find the smallest available color
-        neighbor_colors = set(colors[u] for u in graph.adj[v] if colors[u] != -1)
-        color = 0
-        while color in neighbor_colors:
-            color += 1
-        colors[v] = color
-        max_color_used = max(max_color_used, color)
-        
-        # Update saturation of neighbors
-        for u in graph.adj[v]:
-            if colors[u] == -1:
-                neighbor_colors_u = set(colors[w] for w in graph.adj[u] if colors[w] != -1)
-                saturation[u] = len(neighbor_colors_u)
-        uncolored.remove(v)
-    
-    return colors, max_color_used + 1
+    colors = dsatur(graph.adjacency_lists())
+    return colors, max(colors, default=-1) + 1
 
 def greedy_classic(graph):
     """
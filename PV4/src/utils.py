@@ -1,35 +1,24 @@
 from graph import Graph
+from graph_io import load_csr_graph
 
-def parse_dimacs_graph(file_path):
+def parse_dimacs_graph(file_path, use_cache=True, base=None):
     """
     Parses a graph from a file in the format used by the data files.
+
+    The file is parsed in bulk by numpy and cached as a memory-mapped binary
+    sidecar (see graph_io.load_csr_graph), so repeated loads skip parsing.
     
     Args:
         file_path (str): The path to the graph file.
+        use_cache (bool): Whether to use the binary sidecar cache.
+        base (int): Vertex id base of the file (default: taken from the header vertex count).
 
     Returns:
         Graph: A Graph object representing the parsed graph.
     """
-    edges = []
-    num_vertices = 0
-    num_edges = 0
+    graph = Graph.from_csr(load_csr_graph(file_path, use_cache=use_cache, base=base))
 
-    with open(file_path, 'r') as f:
-        # First line contains: num_vertices num_edges
-        first_line = f.readline().strip()
-        parts = first_line.split()
-        num_vertices = int(parts[0])
-        num_edges = int(parts[1])
-        
-        # Read edges
-        for line in f:
-            if line.strip():  # Skip empty lines
-                parts = line.strip().split()
-                u = int(parts[0])
-                v = int(parts[1])
-                edges.append((u, v))
-    
-    if num_vertices == 0 or num_edges == 0:
+    if graph.num_vertices == 0 or graph.num_edges == 0:
         raise ValueError("Failed to parse graph file.")
 
-    return Graph(num_vertices, num_edges, edges) 
+    return graph
@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from csr_graph import CSRGraph
+
+
+def _count_conflicts(graph, coloring):
+    """Conflicting edges of a coloring, by a plain scan of the adjacency lists."""
+    return sum(1 for v, row in enumerate(graph.adjacency_lists()) for u in row
+               if v < u and coloring[v] == coloring[u])
+
+
+@pytest.fixture
+def random_graph(random_edges):
+    def build(n, p, seed, colors=None):
+        return CSRGraph.from_edges(n, random_edges(n, p, seed, colors), base=0)
+    return build
+
+
+@pytest.fixture
+def count_conflicts():
+    return _count_conflicts
+
+
+@pytest.fixture
+def graph(random_graph):
+    return random_graph(30, 0.3, seed=1)
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from annealing_engine import SimulatedAnnealing
+
+
+@pytest.mark.parametrize("move", ["recolor", "swap"])
+def test_tracked_energy_matches_the_final_coloring(graph, move):
+    rng = random.Random(12)
+    annealer = SimulatedAnnealing(graph.adjacency_lists(), num_colors=4, move=move,
+                                  initial_temp=2.0, reheat_after=20, rng=rng)
+    chromosome = [rng.randrange(4) for _ in range(graph.num_vertices)]
+    colors = sorted(chromosome)
+    energy = annealer.anneal(chromosome, 500)
+    assert energy == annealer.energy(chromosome)
+    if move == "swap":
+        assert sorted(chromosome) == colors
+
+
+def test_untracked_run_applies_the_same_moves(graph):
+    start = [v % 4 for v in range(graph.num_vertices)]
+    results = []
+    for track_energy in (True, False):
+        annealer = SimulatedAnnealing(graph.adjacency_lists(), num_colors=4, rng=random.Random(13))
+        chromosomes = [list(start), list(start)]
+        energies = annealer.anneal_many(chromosomes, 300, track_energy=track_energy)
+        results.append((chromosomes, energies))
+    (tracked, energies), (untracked, nothing) = results
+    assert tracked == untracked
+    assert nothing == [None, None]
+    assert energies == [SimulatedAnnealing(graph.adjacency_lists(), 4).energy(c) for c in tracked]
+
+
+def test_zero_temperature_never_accepts_worse_moves(graph):
+    rng = random.Random(14)
+    annealer = SimulatedAnnealing(graph.adjacency_lists(), num_colors=3, initial_temp=0.0, rng=rng)
+    chromosome = [rng.randrange(3) for _ in range(graph.num_vertices)]
+    energy = annealer.energy(chromosome)
+    for _ in range(20):
+        new_energy = annealer.anneal(chromosome, 25, energy)
+        assert new_energy <= energy
+        energy = new_energy
+
+
+def test_invalid_arguments_raise(graph):
+    with pytest.raises(ValueError):
+        SimulatedAnnealing(graph.adjacency_lists(), num_colors=3, move="flip")
+    with pytest.raises(ValueError):
+        SimulatedAnnealing(graph.adjacency_lists())
@@ -0,0 +1,63 @@
+import time
+
+from anytime import Deadline, Incumbent, solve_result
+
+
+def test_deadline_expires_and_cancels():
+    unlimited = Deadline()
+    assert unlimited.remaining() == float("inf")
+    assert not unlimited.expired()
+    unlimited.cancel()
+    assert unlimited.cancelled and unlimited.expired()
+
+    short = Deadline(0.01)
+    time.sleep(0.02)
+    assert short.expired() and not short.cancelled
+    assert short.remaining() == 0.0
+
+
+def test_child_deadline_follows_its_parent():
+    parent = Deadline(10)
+    child = Deadline(100, parent=parent)
+    assert child.end == parent.end
+    assert Deadline(1, parent=parent).end < parent.end
+    parent.cancel()
+    assert child.cancelled and child.expired()
+
+
+def test_incumbent_keeps_a_copy_of_the_best():
+    improvements = []
+    incumbent = Incumbent(on_improvement=lambda inc: improvements.append(inc.conflicts), max_colors=3)
+    coloring = [0, 1, 2, 3]
+    assert incumbent.offer(coloring, 0)  # 4 colors > k still beats nothing
+    assert incumbent.offer([0, 1, 0, 1], 2)  # fits k, so ranks first
+    assert not incumbent.offer([0, 1, 2, 0], 3)
+    assert incumbent.offer([0, 0, 0, 0], 2)  # same conflicts, fewer colors
+    best = [0, 1, 2, 1]
+    assert incumbent.offer(best, 0)
+    best[0] = 2
+    assert incumbent.snapshot() == ([0, 1, 2, 1], 0, 3)
+    assert improvements == [0, 2, 2, 0]
+    assert incumbent.offer({1: 0, 2: 1}, 0)
+    assert incumbent.snapshot()[0] == {1: 0, 2: 1}
+
+
+def test_solve_result_statuses():
+    deadline = Deadline()
+    empty = solve_result(Incumbent(), deadline)
+    assert empty["status"] == "finished" and empty["coloring"] is None and not empty["valid"]
+
+    incumbent = Incumbent(max_colors=2)
+    incumbent.offer([0, 1, 0], 1)
+    assert solve_result(incumbent, deadline)["status"] == "finished"
+    assert solve_result(incumbent, deadline, target=1)["status"] == "target"
+    assert solve_result(incumbent, deadline, infeasible=True)["status"] == "infeasible"
+    expired = Deadline(0)
+    assert solve_result(incumbent, expired)["status"] == "timeout"
+    deadline.cancel()
+    assert solve_result(incumbent, deadline)["status"] == "cancelled"
+
+    incumbent.offer([0, 1, 1], 0)
+    result = solve_result(incumbent, deadline)
+    assert result["status"] == "target" and result["valid"]
+    assert result["colors_used"] == 2 and result["conflicts"] == 0
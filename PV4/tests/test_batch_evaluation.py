@@ -0,0 +1,26 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+from batch_evaluation import BatchEvaluator
+
+
+def test_batch_evaluator_matches_plain_scan(graph, count_conflicts):
+    rng = random.Random(4)
+    population = [[rng.randrange(6) for _ in range(graph.num_vertices)] for _ in range(9)]
+    edges = [(v, u) for v, row in enumerate(graph.adjacency_lists()) for u in row if v < u]
+    evaluator = BatchEvaluator(graph.num_vertices, edges, chunk_size=50)
+    assert evaluator.conflicts(population).tolist() == [count_conflicts(graph, c) for c in population]
+    assert evaluator.colors_used(population).tolist() == [len(set(c)) for c in population]
+    assert evaluator.max_color(population).tolist() == [max(c) for c in population]
+    tallies = evaluator.vertex_conflicts(population)
+    assert (tallies.sum(axis=1) == 2 * evaluator.conflicts(population)).all()
+
+
+def test_constructors_agree(graph):
+    rng = random.Random(5)
+    population = [[rng.randrange(6) for _ in range(graph.num_vertices)] for _ in range(4)]
+    from_csr = BatchEvaluator.from_csr(graph)
+    from_adjacency = BatchEvaluator.from_adjacency(graph.adj, graph.num_vertices)
+    assert from_csr.evaluate(population)[0].tolist() == from_adjacency.evaluate(population)[0].tolist()
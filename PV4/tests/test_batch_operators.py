@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+from batch_operators import (BatchGeneticAlgorithm, BatchOperators, conflict_aware_crossover, mutate,
+                             one_point_crossover, uniform_crossover)
+from graph import Graph
+
+
+def test_crossovers_take_each_gene_from_the_right_parent():
+    parents1 = np.zeros((3, 5), dtype=np.int64)
+    parents2 = np.ones((3, 5), dtype=np.int64)
+    out = np.empty_like(parents1)
+    one_point_crossover(parents1, parents2, np.array([0, 2, 5]), out)
+    assert out.tolist() == [[1, 1, 1, 1, 1], [0, 0, 1, 1, 1], [0, 0, 0, 0, 0]]
+    mask = np.array([[True, False, True, False, True]] * 3)
+    assert uniform_crossover(parents1, parents2, mask, out) is out
+    assert out.tolist() == [[0, 1, 0, 1, 0]] * 3
+    conflicts1 = np.array([[0, 2, 1, 1, 0]] * 3)
+    conflicts2 = np.array([[1, 0, 1, 1, 0]] * 3)
+    tie = np.array([[False, False, True, False, True]] * 3)
+    conflict_aware_crossover(parents1, parents2, conflicts1, conflicts2, tie, out)
+    assert out.tolist() == [[0, 1, 0, 1, 0]] * 3
+
+
+def test_mutation_always_changes_the_masked_genes():
+    rng = np.random.default_rng(1)
+    offspring = rng.integers(0, 4, size=(6, 10))
+    before = offspring.copy()
+    mask = rng.random((6, 10)) < 0.5
+    shifts = rng.integers(1, 4, size=(6, 10))
+    mutate(offspring, mask, shifts, 4)
+    assert ((offspring != before) == mask).all()
+    assert ((offspring >= 0) & (offspring < 4)).all()
+
+
+def test_tournament_contestants_are_distinct():
+    operators = BatchOperators(10, 4, 3, np.random.default_rng(7))
+    contestants = operators.contestants(10, 200, tournament_size=4)
+    assert contestants.shape == (200, 4)
+    assert all(len(set(row)) == 4 for row in contestants.tolist())
+    fitness = np.arange(10, dtype=np.float64)
+    # A full-size tournament always contains the best individual and a
+    # two-way tournament never lets the worst one win.
+    assert (operators.tournament(fitness, 100, tournament_size=10) == 0).all()
+    assert 9 not in operators.tournament(fitness, 500, tournament_size=2)
+    assert operators.tournament(np.array([5.0]), 3, tournament_size=3).tolist() == [0, 0, 0]
+
+
+@pytest.mark.parametrize("selection", ["tournament", "sus"])
+@pytest.mark.parametrize("crossover", ["one_point", "uniform", "conflict_aware"])
+def test_batch_ga_matches_its_states(graph, count_conflicts, crossover, selection):
+    random.seed(31)
+    ga = BatchGeneticAlgorithm(Graph.from_csr(graph), 8, 5, crossover=crossover, selection=selection)
+    best, fitness, conflicts, colors = ga.run(generations=4, target=-1)
+    assert conflicts == count_conflicts(graph, best)
+    population = ga.population
+    assert len(population) == 8
+    for chromosome, state in zip(population, ga._population_states()):
+        assert list(state.chromosome) == list(chromosome)
+        assert state.conflicts == count_conflicts(graph, chromosome)
+        assert state.colors_used == len(set(chromosome))
@@ -0,0 +1,45 @@
+from itertools import combinations
+
+from anytime import Deadline
+from clique_engine import greedy_clique, max_clique
+
+
+def _is_clique(masks, vertices):
+    return all(masks[u] >> v & 1 for u, v in combinations(vertices, 2))
+
+
+def _clique_number(masks):
+    n = len(masks)
+    for size in range(n, 0, -1):
+        if any(_is_clique(masks, c) for c in combinations(range(n), size)):
+            return size
+    return 0
+
+
+def test_max_clique_matches_brute_force(random_graph):
+    for seed in range(15):
+        masks = random_graph(12, 0.5, seed).build_bitmatrix()
+        clique, optimal = max_clique(masks)
+        assert optimal
+        assert _is_clique(masks, clique)
+        assert len(clique) == _clique_number(masks)
+        greedy = greedy_clique(masks)
+        assert _is_clique(masks, greedy)
+        assert len(greedy) <= len(clique)
+
+
+def test_budget_returns_a_valid_clique(random_graph):
+    masks = random_graph(120, 0.6, seed=3).build_bitmatrix()
+    clique, optimal = max_clique(masks, node_limit=50)
+    assert not optimal
+    assert _is_clique(masks, clique)
+
+    deadline = Deadline()
+    deadline.cancel()
+    clique, optimal = max_clique(masks, deadline=deadline)
+    assert not optimal
+    assert _is_clique(masks, clique)
+
+
+def test_empty_graph():
+    assert max_clique([]) == ([], True)
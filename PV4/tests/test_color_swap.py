@@ -0,0 +1,17 @@
+import random
+
+from hybrid_genetic_algorithms import ColorSwap
+
+
+def test_color_swap_never_worsens(graph, count_conflicts):
+    random.seed(23)
+    rng = random.Random(23)
+    for strategy in ("first", "best"):
+        swap = ColorSwap(graph, max_iterations=100, strategy=strategy)
+        chromosome = [rng.randrange(4) for _ in range(graph.num_vertices)]
+        improved, conflicts = swap.run(chromosome)
+        assert improved is not chromosome
+        assert sorted(improved) == sorted(chromosome)
+        assert conflicts == count_conflicts(graph, improved) <= count_conflicts(graph, chromosome)
+        in_place, _ = swap.run(chromosome, in_place=True)
+        assert in_place is chromosome
@@ -0,0 +1,16 @@
+import random
+
+from hybrid_genetic_algorithms import ConstraintRepair
+
+
+def test_constraint_repair_counts_the_remaining_conflicts(graph, count_conflicts):
+    random.seed(24)
+    rng = random.Random(24)
+    repair = ConstraintRepair(graph, max_repair_attempts=20)
+    chromosome = [rng.randrange(5) for _ in range(graph.num_vertices)]
+    repaired, conflicts = repair.repair(chromosome, 5)
+    assert repaired is not chromosome
+    assert conflicts == count_conflicts(graph, repaired)
+    assert all(0 <= c < 5 for c in repaired)
+    in_place, _ = repair.repair(chromosome, 5, in_place=True)
+    assert in_place is chromosome
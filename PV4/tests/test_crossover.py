@@ -0,0 +1,58 @@
+import random
+
+from crossover_engine import conflict_aware_uniform, gpx, pairwise_conflict_crossover
+
+
+def _parents(graph, k, seed):
+    rng = random.Random(seed)
+    n = graph.num_vertices
+    return [rng.randrange(k) for _ in range(n)], [rng.randrange(k) for _ in range(n)]
+
+
+def _reference_pairwise(neighbors, parent1, parent2, conflicts):
+    """The O(n * m) selection rule of the original CustomCrossover."""
+    child1, child2 = list(parent1), list(parent2)
+    for i in range(len(parent1)):
+        trial1, trial2 = list(child1), list(child2)
+        trial1[i], trial2[i] = parent2[i], parent1[i]
+        if conflicts(trial1) < conflicts(trial2):
+            child1 = trial1
+        else:
+            child2 = trial2
+    return child1, child2
+
+
+def test_uniform_takes_every_gene_from_a_parent(graph):
+    parent1, parent2 = _parents(graph, 4, seed=10)
+    neighbors = graph.adjacency_lists()
+    child = conflict_aware_uniform(neighbors, parent1, parent2, random.Random(1))
+    assert all(c in (a, b) for c, a, b in zip(child, parent1, parent2))
+    out = [None] * graph.num_vertices
+    assert conflict_aware_uniform(neighbors, parent1, parent2, random.Random(1), out=out) is out
+    assert out == child
+    # Identical parents give back the parent
+    assert conflict_aware_uniform(neighbors, parent1, parent1) == parent1
+
+
+def test_gpx_hands_over_color_classes(graph):
+    parent1, parent2 = _parents(graph, 5, seed=11)
+    child = gpx(parent1, parent2, 5, random.Random(2), first_color=1)
+    assert all(1 <= c <= 5 for c in child)
+    # The first class of the child contains the largest class of parent1
+    largest = max(set(parent1), key=parent1.count)
+    assert {v for v, c in enumerate(parent1) if c == largest} <= {v for v, c in enumerate(child) if c == 1}
+    out = [0] * graph.num_vertices
+    assert gpx(parent1, parent2, 5, random.Random(2), first_color=1, out=out) is out
+    assert out == child
+
+
+def test_pairwise_matches_the_reference_rule(graph, count_conflicts):
+    neighbors = graph.adjacency_lists()
+    for seed in range(5):
+        parent1, parent2 = _parents(graph, 4, seed)
+        expected = _reference_pairwise(neighbors, parent1, parent2, lambda c: count_conflicts(graph, c))
+        assert pairwise_conflict_crossover(neighbors, parent1, parent2) == expected
+        rows = ([0] * graph.num_vertices, [0] * graph.num_vertices)
+        children = pairwise_conflict_crossover(neighbors, parent1, parent2, out=rows)
+        assert children[0] is rows[0] and children[1] is rows[1]
+        assert children == expected
@@ -0,0 +1,20 @@
+from csr_graph import CSRGraph
+
+
+def test_from_edges_drops_loops_and_duplicates():
+    graph = CSRGraph.from_edges(4, [(0, 1), (1, 0), (2, 2), (3, 1), (0, 1)], base=0)
+    assert graph.adjacency_lists() == [[1], [0, 3], [], [1]]
+    assert [graph.degree(v) for v in range(4)] == [1, 2, 0, 1]
+    assert sorted(graph.edges()) == [(0, 1), (1, 3)]
+
+
+def test_views_agree(random_graph):
+    graph = random_graph(25, 0.3, seed=70)
+    lists = graph.adjacency_lists()
+    masks = graph.build_bitmatrix()
+    for v in range(graph.num_vertices):
+        assert list(graph.neighbors(v)) == lists[v] == sorted(graph.adj[v])
+        assert masks[v] == sum(1 << u for u in lists[v])
+        for u in range(graph.num_vertices):
+            assert graph.has_edge(u, v) == (u in lists[v])
+    assert graph.to_adjacency_sets() == [set(row) for row in lists]
@@ -0,0 +1,41 @@
+import math
+import random
+from itertools import combinations
+
+import pytest
+
+from diversity import PopulationDiversity, entropy_diversity, hamming_diversity, locus_counts
+
+
+def _population(seed, size=12, n=20, k=4):
+    rng = random.Random(seed)
+    return [[rng.randrange(k) for _ in range(n)] for _ in range(size)]
+
+
+def test_hamming_matches_all_pairs():
+    population = _population(90)
+    pairs = list(combinations(population, 2))
+    expected = sum(sum(x != y for x, y in zip(a, b)) for a, b in pairs) / len(pairs) / 20
+    assert hamming_diversity(population) == pytest.approx(expected)
+    assert hamming_diversity([population[0]] * 5) == 0.0
+
+
+def test_entropy_is_normalized():
+    population = _population(91)
+    assert 0.0 < entropy_diversity(population) <= 1.0
+    assert entropy_diversity([population[0]] * 5) == 0.0
+    counts = locus_counts(population)
+    assert [sorted(locus) for locus in counts] == \
+        [sorted(v for v in (column.count(c) for c in range(4)) if v) for column in zip(*population)]
+    assert math.isclose(entropy_diversity(population, counts), entropy_diversity(population))
+
+
+def test_measure_is_cached_per_key():
+    population = _population(92)
+    diversity = PopulationDiversity("hamming")
+    first = diversity.measure(population, key=1)
+    assert diversity.measure([population[0]] * 3, key=1) == first
+    assert diversity.measure([population[0]] * 3, key=2) == 0.0
+    assert diversity.computations == 2
+    with pytest.raises(ValueError):
+        PopulationDiversity("variance")
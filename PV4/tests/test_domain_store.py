@@ -0,0 +1,25 @@
+from domain_store import DomainStore
+
+
+def test_assign_propagates_and_undo_restores():
+    # Path 0-1-2 with two colors: coloring 0 forces the whole path
+    store = DomainStore.from_adjacency({0: [1], 1: [0, 2], 2: [1]}, 3, 2)
+    mark = store.mark()
+    assert store.assign(0, 0)
+    assert store.colors == [0, 1, 0]
+    assert store.uncolored == 0
+    assert not store.allowed(1, 0)
+    store.undo(mark)
+    assert store.colors == [-1, -1, -1]
+    assert store.domains == [0b11] * 3
+    assert store.uncolored == 0b111
+
+
+def test_assign_reports_a_wipeout():
+    # Triangle with two colors
+    store = DomainStore.from_adjacency({0: [1, 2], 1: [0, 2], 2: [0, 1]}, 3, 2)
+    mark = store.mark()
+    assert not store.assign(0, 0)
+    store.undo(mark)
+    assert store.colors == [-1, -1, -1]
+    assert store.assign(0, 1) is False
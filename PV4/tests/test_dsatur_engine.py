@@ -0,0 +1,39 @@
+from dsatur_engine import dsatur, dsatur_dict
+
+
+def _reference_dsatur(neighbors):
+    """Quadratic DSATUR with the same tie-breaking: saturation, degree, lowest id."""
+    n = len(neighbors)
+    colors = [-1] * n
+    for _ in range(n):
+        def key(v):
+            return len({colors[u] for u in neighbors[v] if colors[u] != -1}), len(neighbors[v]), -v
+        v = max((v for v in range(n) if colors[v] == -1), key=key)
+        used = {colors[u] for u in neighbors[v]}
+        color = 0
+        while color in used:
+            color += 1
+        colors[v] = color
+    return colors
+
+
+def test_matches_the_quadratic_reference(random_graph):
+    for seed in range(10):
+        neighbors = random_graph(40, 0.25, seed).adjacency_lists()
+        assert dsatur(neighbors) == _reference_dsatur(neighbors)
+
+
+def test_limited_colors_stay_in_range(random_graph, count_conflicts):
+    graph = random_graph(40, 0.5, seed=71)
+    unlimited = dsatur(graph.adjacency_lists())
+    assert count_conflicts(graph, unlimited) == 0
+    k = max(unlimited)
+    limited = dsatur(graph.adjacency_lists(), num_colors=k)
+    assert all(0 <= c < k for c in limited)
+
+
+def test_dict_version_keeps_the_vertex_labels():
+    coloring = dsatur_dict({0: [1, 2], 1: [0, 2], 2: [0, 1], 3: []}, first_color=1)
+    assert sorted(coloring) == [0, 1, 2, 3]
+    assert sorted(coloring[v] for v in (0, 1, 2)) == [1, 2, 3]
+    assert coloring[3] == 1
@@ -0,0 +1,60 @@
+import random
+
+from evaluation import ConflictEvaluator
+
+
+def test_recolor_matches_full_evaluation(graph):
+    rng = random.Random(2)
+    evaluator = ConflictEvaluator(graph, num_colors=5, cache_size=0)
+    chromosome = [rng.randrange(5) for _ in range(graph.num_vertices)]
+    state = evaluator.evaluate(list(chromosome))
+    for _ in range(200):
+        state.recolor(rng.randrange(graph.num_vertices), rng.randrange(5))
+        fresh = evaluator.evaluate(list(state.chromosome))
+        assert state.conflicts == fresh.conflicts
+        assert state.vertex_conflicts == fresh.vertex_conflicts
+        assert state.colors_used == fresh.colors_used
+        assert state.zobrist == fresh.zobrist
+        assert state.fitness == fresh.fitness
+
+
+def test_copy_and_assign_are_independent(graph):
+    evaluator = ConflictEvaluator(graph, num_colors=4)
+    state = evaluator.evaluate([v % 4 for v in range(graph.num_vertices)])
+    copied = state.copy()
+    target = evaluator.evaluate([0] * graph.num_vertices)
+    row = target.chromosome
+    target.assign(state)
+    assert target.chromosome is row
+    state.recolor(0, (state.chromosome[0] + 1) % 4)
+    for other in (copied, target):
+        assert other.chromosome[0] != state.chromosome[0]
+        assert other.conflicts == evaluator.evaluate(list(other.chromosome)).conflicts
+
+
+def test_derive_only_recolors_the_differences(graph, count_conflicts):
+    rng = random.Random(3)
+    evaluator = ConflictEvaluator(graph, num_colors=4, cache_size=0)
+    parent = [rng.randrange(4) for _ in range(graph.num_vertices)]
+    state = evaluator.evaluate(parent)
+    child = list(parent)
+    for v in rng.sample(range(graph.num_vertices), 5):
+        child[v] = rng.randrange(4)
+    derived = state.derive(child)
+    assert derived.chromosome == child
+    assert derived.conflicts == count_conflicts(graph, child)
+    assert derived.zobrist == evaluator.evaluate(list(child)).zobrist
+    assert state.chromosome is parent
+    assert evaluator.full_evaluations == 2
+
+
+def test_evaluate_many_uses_the_cache(graph, count_conflicts):
+    rng = random.Random(3)
+    evaluator = ConflictEvaluator(graph, num_colors=4)
+    population = [[rng.randrange(4) for _ in range(graph.num_vertices)] for _ in range(6)]
+    states = evaluator.evaluate_many(population)
+    assert [state.conflicts for state in states] == [count_conflicts(graph, c) for c in population]
+    assert states[0].chromosome is population[0]
+    again = evaluator.evaluate_many([list(c) for c in population[:3]])
+    assert [state.conflicts for state in again] == [state.conflicts for state in states[:3]]
+    assert evaluator.full_evaluations == 6
@@ -0,0 +1,63 @@
+import csv
+import os
+import shutil
+
+from experiment_runner import FIELDNAMES, build_grid, load_completed_runs, run_experiments
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "gc_50_9.txt")
+
+
+def _row(run, **values):
+    row = {field: 1 for field in FIELDNAMES}
+    row["run"] = run
+    row.update(values)
+    return row
+
+
+def _write(path, rows, tail=""):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rows)
+        f.write(tail)
+
+
+def test_load_completed_runs_skips_partial_rows(tmp_path):
+    path = str(tmp_path / "results.csv")
+    assert load_completed_runs(path) == {}
+    incomplete = _row(1, time="")
+    _write(path, [_row(0), incomplete], tail="2,44,10,8,50,random,9.5,0,8,0.01")
+    completed = load_completed_runs(path)
+    assert list(completed) == [0]
+    assert completed[0]["fitness"] == "1"
+
+
+def test_build_grid_seeds_follow_the_run_index():
+    grid = build_grid([5], [7, 8], [10], ["random", "dsatur"], base_seed=100)
+    assert [config["run"] for config in grid] == [0, 1, 2, 3]
+    assert [config["seed"] for config in grid] == [100, 101, 102, 103]
+    assert grid[3] == {"run": 3, "seed": 103, "generations": 5, "num_colors": 8,
+                       "population": 10, "initializer": "dsatur"}
+
+
+def test_resume_only_runs_the_missing_configurations(tmp_path):
+    path = str(tmp_path / "results.csv")
+    graph_file = shutil.copy(DATA_FILE, tmp_path)  # its cache sidecar stays out of the tree
+    grid = build_grid([2], [9], [6], ["random", "greedy"])
+    grid.append(dict(grid[0], run=2, population=0))  # fails: an empty population has no best
+    # Run 0 is done; a half-written row of run 1 must be rerun
+    _write(path, [_row(0, fitness="sentinel")], tail="1,43,2,9,6,greedy,3")
+
+    results = run_experiments(graph_file, path, grid=grid, max_workers=1)
+    assert [int(row["run"]) for row in results] == [0, 1]
+    assert results[0]["fitness"] == "sentinel"
+    assert results[1]["initializer"] == "greedy"
+
+    completed = load_completed_runs(path)
+    assert sorted(completed) == [0, 1]
+    assert completed[0]["fitness"] == "sentinel"
+    assert not os.path.exists(path + ".tmp")
+
+    # The failed run is retried and fails again; finished runs are kept
+    results = run_experiments(graph_file, path, grid=grid, max_workers=1)
+    assert [int(row["run"]) for row in results] == [0, 1]
@@ -0,0 +1,40 @@
+import random
+
+from fitness_cache import FitnessCache, ZobristHasher
+
+
+def test_zobrist_update_matches_hash():
+    rng = random.Random(5)
+    hasher = ZobristHasher(20, 4)
+    chromosome = [rng.randrange(4) for _ in range(20)]
+    h = hasher.hash(chromosome)
+    for _ in range(50):
+        v, color = rng.randrange(20), rng.randrange(4)
+        h = hasher.update(h, v, chromosome[v], color)
+        chromosome[v] = color
+        assert h == hasher.hash(chromosome)
+
+
+def test_lru_eviction_and_counters():
+    cache = FitnessCache(capacity=2)
+    cache.put(1, "a")
+    cache.put(2, "b")
+    assert cache.get(1) == "a"  # 2 becomes the least recently used
+    cache.put(3, "c")
+    assert cache.get(2) is None
+    assert cache.get(3) == "c"
+    assert len(cache) == 2
+    assert cache.stats() == {"hits": 2, "misses": 1, "hit_rate": 2 / 3, "size": 2}
+
+
+def test_get_or_compute_many_computes_only_misses():
+    cache = FitnessCache(hasher=ZobristHasher(3, 3))
+    calls = []
+
+    def compute(chromosomes):
+        calls.append([list(c) for c in chromosomes])
+        return [sum(c) for c in chromosomes]
+
+    assert cache.get_or_compute_many([[0, 1, 2], [2, 2, 2]], compute) == [3, 6]
+    assert cache.get_or_compute_many([[2, 2, 2], [1, 1, 1], [0, 1, 2]], compute) == [6, 3, 3]
+    assert calls == [[[0, 1, 2], [2, 2, 2]], [[1, 1, 1]]]
@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from anytime import Incumbent
+from base_genetic_algorithm import GeneticAlgorithm
+from graph import Graph
+from hybrid_genetic_algorithms import GAAdaptiveRepair, GAGreedyCustomCrossover, MemeticGA
+
+
+def check_population(ga, count_conflicts):
+    """Every cached state must describe its row, and rows must not alias each other."""
+    population = ga.population
+    assert len(population) == ga.population_size
+    assert len({id(chromosome) for chromosome in population}) == len(population)
+    for chromosome, state in zip(population, ga._population_states()):
+        assert list(state.chromosome) == list(chromosome)
+        assert state.conflicts == count_conflicts(ga.graph, chromosome)
+        assert state.colors_used == len(set(chromosome))
+
+
+@pytest.mark.parametrize("cls,kwargs", [
+    (GeneticAlgorithm, {"initializer": "mixed", "selection": "tournament"}),
+    (GeneticAlgorithm, {"selection": "rank"}),
+    (MemeticGA, {"local_search_type": "tabu", "local_search_iterations": 10}),
+    (MemeticGA, {"local_search_type": "color_swap", "local_search_iterations": 10}),
+    (GAAdaptiveRepair, {}),
+    (GAGreedyCustomCrossover, {"local_search_iterations": 10}),
+])
+def test_generations_keep_population_states_consistent(graph, count_conflicts, cls, kwargs):
+    random.seed(30)
+    ga = cls(Graph.from_csr(graph), 8, 5, **kwargs)
+    incumbent = Incumbent(max_colors=5)
+    best, fitness, conflicts, colors = ga.run(generations=4, incumbent=incumbent, target=-1)
+    check_population(ga, count_conflicts)
+    assert conflicts == count_conflicts(graph, best)
+    assert incumbent.snapshot() == (list(best), conflicts, colors)
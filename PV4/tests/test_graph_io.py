@@ -0,0 +1,61 @@
+import pytest
+
+from csr_graph import CSRGraph, id_base
+from graph_io import load_csr_graph, load_graph_arrays, parse_edge_file
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def test_id_base():
+    assert id_base(5, 4) == 0
+    assert id_base(5, 5) == 1
+    assert id_base(5, None) == 0
+    assert id_base(5, 4, base=1) == 1
+    assert id_base(5, 5, base=0) == 0
+    with pytest.raises(ValueError):
+        id_base(5, 4, base=2)
+
+
+def test_explicit_base_keeps_an_isolated_last_vertex(tmp_path):
+    # 1-based triangle on 1..3 with vertex 4 isolated
+    path = _write(tmp_path, "g.txt", "4 3\n1 2\n2 3\n1 3\n")
+    one_based = load_csr_graph(path, use_cache=False, base=1)
+    assert one_based.adjacency_lists() == [[1, 2], [0, 2], [0, 1], []]
+    guessed = load_csr_graph(path, use_cache=False)
+    assert guessed.adjacency_lists() == [[], [2, 3], [1, 3], [1, 2]]
+    with pytest.raises(ValueError):
+        load_csr_graph(_write(tmp_path, "bad.txt", "3 1\n0 3\n"), use_cache=False, base=0)
+
+
+def test_duplicates_and_self_loops_are_dropped(tmp_path):
+    path = _write(tmp_path, "g.txt", "3 4\n0 1\n1 0\n2 2\n1 2\n")
+    graph = load_csr_graph(path, use_cache=False)
+    assert graph.adjacency_lists() == [[1], [0, 2], [1]]
+    assert graph.adjacency_lists() == CSRGraph.from_edges(3, [(0, 1), (1, 2)], base=0).adjacency_lists()
+
+
+def test_malformed_files_raise():
+    with pytest.raises(ValueError):
+        parse_edge_file(b"3 2\n0 1\n")
+    with pytest.raises(ValueError):
+        parse_edge_file(b"3 1\n0 1 2\n")
+    with pytest.raises(ValueError):
+        parse_edge_file(b"3 1\n0 5\n")
+
+
+def test_cache_is_reused_per_base(tmp_path):
+    pytest.importorskip("numpy")
+    path = _write(tmp_path, "g.txt", "4 1\n1 2\n")
+    cache_dir = str(tmp_path / "cache")
+    first = load_graph_arrays(path, cache_dir=cache_dir)
+    again = load_graph_arrays(path, cache_dir=cache_dir)
+    assert first[0] == again[0] == 4
+    assert list(first[1]) == list(again[1]) and list(first[2]) == list(again[2])
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+    # The sidecar was written for base 0, so an explicit base 1 parses the file again
+    assert load_csr_graph(path, cache_dir=cache_dir, base=1).adjacency_lists() == [[1], [0], [], []]
+    assert load_csr_graph(path, cache_dir=cache_dir).adjacency_lists() == [[], [2], [1], []]
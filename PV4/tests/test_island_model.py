@@ -0,0 +1,32 @@
+import os
+import shutil
+
+import pytest
+
+pytest.importorskip("numpy")
+from island_model import migration_sources, run_island_model
+from utils import parse_dimacs_graph
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "gc_50_9.txt")
+
+
+def test_migration_sources():
+    assert migration_sources("ring", 4, 0, 1) == [[3], [0], [1], [2]]
+    assert migration_sources("full", 3, 0, 1) == [[1, 2], [0, 2], [0, 1]]
+    sources = migration_sources("random", 5, 2, 7)
+    assert sources == migration_sources("random", 5, 2, 7)
+    assert all(len(s) == 1 and s[0] != i for i, s in enumerate(sources))
+    with pytest.raises(ValueError):
+        migration_sources("star", 3, 0, 1)
+
+
+def test_islands_are_reproducible(tmp_path, count_conflicts):
+    graph_file = shutil.copy(DATA_FILE, tmp_path)
+    runs = [run_island_model(graph_file, num_islands=2, population_size=6, num_colors=9, generations=4,
+                             migration_interval=2, topology=topology, seed=5, verbose=False)
+            for topology in ("ring", "ring", "random")]
+    assert runs[0]["best_chromosome"] == runs[1]["best_chromosome"]
+    graph = parse_dimacs_graph(graph_file)
+    for result in runs:
+        assert result["best_conflicts"] == count_conflicts(graph, result["best_chromosome"])
+        assert result["best_fitness"] == min(result["island_fitness"])
@@ -0,0 +1,46 @@
+from itertools import product
+
+from anytime import Deadline
+from backtrack_engine import KColoringSearch
+
+
+def _proper(masks, colors):
+    return all(not (masks[v] >> u & 1) or colors[u] != colors[v]
+               for v in range(len(masks)) for u in range(v))
+
+
+def _colorable(masks, k):
+    return any(_proper(masks, colors) for colors in product(range(k), repeat=len(masks)))
+
+
+def test_search_matches_brute_force(random_graph):
+    for seed in range(12):
+        masks = random_graph(8, 0.5, seed).build_bitmatrix()
+        for k in range(1, 5):
+            search = KColoringSearch(masks, k)
+            colors = search.run()
+            if _colorable(masks, k):
+                assert colors is not None and _proper(masks, colors)
+                assert all(0 <= c < k for c in colors)
+            else:
+                assert colors is None and search.exhausted
+
+
+def test_precolored_vertices_are_kept(random_graph):
+    masks = random_graph(25, 0.3, seed=4, colors=4).build_bitmatrix()
+    colors = KColoringSearch(masks, 4, precolored={0: 3, 1: 2}).run()
+    assert colors is not None and _proper(masks, colors)
+    assert colors[0] == 3 and colors[1] == 2
+    assert KColoringSearch(masks, 4, precolored={0: 4}).run() is None
+
+
+def test_budget_stops_without_exhausting(random_graph):
+    masks = random_graph(60, 0.5, seed=5).build_bitmatrix()
+    search = KColoringSearch(masks, 10, node_limit=100)
+    assert search.run() is None
+    assert not search.exhausted
+    deadline = Deadline()
+    deadline.cancel()
+    search = KColoringSearch(masks, 10, deadline=deadline)
+    assert search.run() is None
+    assert not search.exhausted
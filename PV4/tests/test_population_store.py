@@ -0,0 +1,24 @@
+from population_store import PopulationStore
+
+
+def test_rows_are_reused_across_swaps():
+    store = PopulationStore(3, 4)
+    first, second = store.rows, store.next_rows
+    rows = store.load([[1, 2, 3, 4], [0, 0, 0, 0], [4, 3, 2, 1]])
+    assert rows is first
+    assert [list(row) for row in rows] == [[1, 2, 3, 4], [0, 0, 0, 0], [4, 3, 2, 1]]
+    assert all(type(row) is list for row in rows)
+    ids = [id(row) for row in first]
+    store.swap()
+    assert store.rows is second and store.next_rows is first
+    store.swap()
+    assert [id(row) for row in store.rows] == ids
+
+
+def test_ranking_follows_the_current_fitness():
+    store = PopulationStore(4, 2)
+    store.fitness[:] = [3.0, 1.0, 2.0, 0.5]
+    assert store.ranking() == [3, 1, 2, 0]
+    store.swap()
+    store.fitness[:] = [0, 1, 2, 3]
+    assert store.ranking() == [0, 1, 2, 3]
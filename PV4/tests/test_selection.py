@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from selection import SELECTION_METHODS, select_indices, tournament_indices
+
+
+@pytest.mark.parametrize("method", SELECTION_METHODS)
+def test_indices_are_in_range(method):
+    rng = random.Random(6)
+    fitness = [rng.randrange(100) for _ in range(20)]
+    selected = select_indices(method, fitness, 50, rng)
+    assert len(selected) == 50
+    assert all(0 <= i < 20 for i in selected)
+
+
+def test_tournament_contestants_are_distinct():
+    rng = random.Random(7)
+    fitness = list(range(10))
+    # Without replacement, a full-size tournament always contains the best
+    # individual and a two-way tournament never lets the worst one win.
+    assert tournament_indices(fitness, 100, tournament_size=10, rng=rng) == [0] * 100
+    assert 9 not in tournament_indices(fitness, 500, tournament_size=2, rng=rng)
+    assert tournament_indices([5], 3, tournament_size=3, rng=rng) == [0, 0, 0]
+
+
+def test_truncation_keeps_the_better_half():
+    rng = random.Random(8)
+    fitness = [9, 1, 8, 2, 7, 3]
+    assert set(select_indices("truncation", fitness, 200, rng)) <= {1, 3, 5}
+
+
+@pytest.mark.parametrize("method", ["sus", "rank"])
+def test_better_individuals_are_drawn_more_often(method):
+    rng = random.Random(9)
+    fitness = [0, 50, 100]
+    selected = select_indices(method, fitness, 3000, rng)
+    assert selected.count(0) > selected.count(1) > selected.count(2)
+
+
+def test_unknown_method_raises():
+    with pytest.raises(ValueError):
+        select_indices("roulette", [1, 2], 2)
@@ -0,0 +1,22 @@
+import random
+
+from anytime import Deadline
+from base_genetic_algorithm import GeneticAlgorithm
+from graph import Graph
+from hybrid_genetic_algorithms import GATabuSearch
+
+
+def test_solve_reaches_the_target(random_graph):
+    random.seed(32)
+    graph = Graph.from_csr(random_graph(20, 0.2, seed=33, colors=3))
+    result = GATabuSearch.solve(graph, 6, time_budget=10, population_size=8, generations=20)
+    assert result["status"] == "target" and result["valid"]
+    assert result["colors_used"] <= 6
+
+
+def test_solve_honours_a_cancelled_deadline(graph):
+    random.seed(34)
+    deadline = Deadline()
+    deadline.cancel()
+    result = GeneticAlgorithm.solve(Graph.from_csr(graph), 2, deadline=deadline, population_size=6)
+    assert result["status"] == "cancelled"
@@ -0,0 +1,32 @@
+import random
+
+from anytime import Deadline
+from graph import Graph
+from hybrid_genetic_algorithms import TabuSearch
+
+
+def test_tabu_search_colors_a_colorable_graph(random_graph, count_conflicts):
+    graph = Graph.from_csr(random_graph(40, 0.3, seed=20, colors=4))
+    rng = random.Random(21)
+    random.seed(21)
+    start = [rng.randrange(4) for _ in range(graph.num_vertices)]
+    solution, conflicts = TabuSearch(graph, start, max_iterations=5000, num_colors=4, verbose=False).run()
+    assert conflicts == count_conflicts(graph, solution) == 0
+    assert all(0 <= c < 4 for c in solution)
+
+
+def test_tabu_search_reports_the_conflicts_of_its_best(graph, count_conflicts):
+    random.seed(22)
+    start = [v % 3 for v in range(graph.num_vertices)]
+    solution, conflicts = TabuSearch(graph, start, max_iterations=200, verbose=False).run()
+    assert conflicts == count_conflicts(graph, solution)
+    assert conflicts <= count_conflicts(graph, start)
+
+
+def test_tabu_search_stops_at_the_deadline(graph, count_conflicts):
+    deadline = Deadline()
+    deadline.cancel()
+    start = [v % 3 for v in range(graph.num_vertices)]
+    solution, conflicts = TabuSearch(graph, start, max_iterations=10 ** 9, deadline=deadline,
+                                     num_colors=3, verbose=False).run()
+    assert conflicts == count_conflicts(graph, solution)
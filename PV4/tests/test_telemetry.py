@@ -0,0 +1,43 @@
+import csv
+import json
+import random
+
+from base_genetic_algorithm import GeneticAlgorithm
+from graph import Graph
+from telemetry import PHASES, CsvWriter, JsonlWriter, RunTelemetry
+
+
+def test_run_streams_one_event_per_generation(graph, tmp_path):
+    random.seed(80)
+    received = []
+    jsonl = JsonlWriter(str(tmp_path / "run.jsonl"))
+    table = CsvWriter(str(tmp_path / "run.csv"))
+    telemetry = RunTelemetry(received.append, jsonl, table)
+    GeneticAlgorithm(Graph.from_csr(graph), 8, 3, telemetry=telemetry).run(generations=5)
+    jsonl.close()
+    table.close()
+
+    kinds = [event["event"] for event in received]
+    assert kinds == ["run_start"] + ["generation"] * 5 + ["run_end"]
+    assert telemetry.events == received
+    generations = received[1:-1]
+    assert [event["generation"] for event in generations] == list(range(5))
+    assert all(event["evaluations"] >= 0 for event in generations)
+    end = received[-1]
+    for phase in PHASES:
+        assert end[f"{phase}_seconds"] == sum(event[f"{phase}_seconds"] for event in generations)
+
+    with open(tmp_path / "run.jsonl") as f:
+        assert [json.loads(line) for line in f] == received
+    with open(tmp_path / "run.csv", newline="") as f:
+        assert [int(row["generation"]) for row in csv.DictReader(f)] == list(range(5))
+
+
+def test_phase_timer_accumulates():
+    telemetry = RunTelemetry(keep_events=False)
+    telemetry.start_run()
+    for _ in range(3):
+        with telemetry.phase("selection"):
+            pass
+    assert telemetry.current["selection"] > 0
+    assert telemetry.events == []
@@ -0,0 +1,20 @@
+import random
+
+import pytest
+
+
+def planted_edges(n, p, seed, colors=None):
+    """
+    Edges (u, v), u < v, of a random graph on vertices 0..n-1. With colors, a
+    random coloring with that many colors is planted first and only edges
+    between different colors are drawn, so the graph is colors-colorable.
+    """
+    rng = random.Random(seed)
+    planted = [rng.randrange(colors) for _ in range(n)] if colors else None
+    return [(u, v) for u in range(n) for v in range(u + 1, n)
+            if (planted is None or planted[u] != planted[v]) and rng.random() < p]
+
+
+@pytest.fixture
+def random_edges():
+    return planted_edges